@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+Monthly Seller Report Deck Generator
+Run: python3 create_seller_report_decks.py leaderboard.csv --month 2025-06
+Output: seller_reports/<month>/<rank>-<seller_id>.pptx
+
+Equivalent to `python3 -m decks seller-reports`; see decks/seller_reports.py.
+"""
+
+import sys
+
+from decks.cli import main
+
+
+if __name__ == "__main__":
+    sys.exit(main(["seller-reports", *sys.argv[1:]]))
@@ -0,0 +1,99 @@
+"""
+Presentation generators for the Outfittr and Cursor decks.
+
+Submodules are loaded on first attribute access, so `import decks` stays
+cheap: python-pptx, lxml and numpy are only imported once a deck is
+actually built. The CLI (`python3 -m decks`) relies on this to answer
+--help and validate specs without loading python-pptx at all.
+
+    import decks
+    decks.cursor_pro.create_presentation("out.pptx")
+
+Thread safety: building different decks in different threads is safe.
+Module-level state is either immutable (RGBColor and size constants, XML
+templates, lookup tables), per thread (decks.prototype's template
+presentations) or guarded by a lock (hyperlink registries, font metric
+tables, progress sinks). A single Presentation and its slides, shapes and
+ChartBook are not thread-safe; keep each deck in one thread. Batch runners
+take `executor="thread"` (`--executor thread`) to build decks in a thread
+pool instead of worker processes, which avoids pickling jobs and results
+for small decks. lxml serializes parsing per parser, so on GIL builds
+threads mostly overlap I/O and zip compression. decks/tests/test_threads.py
+builds decks in a thread pool and checks they match serial builds part
+for part.
+"""
+
+import importlib
+
+_SUBMODULES = (
+    "aspect",
+    "basic",
+    "bench_startup",
+    "catalogue",
+    "charts",
+    "cli",
+    "columns",
+    "cursor",
+    "cursor_pro",
+    "heatmap",
+    "helpers",
+    "ir",
+    "links",
+    "manifest",
+    "markup",
+    "masters",
+    "media",
+    "ooxml",
+    "outputs",
+    "preview",
+    "progress",
+    "prototype",
+    "reader",
+    "search",
+    "seller_reports",
+    "shard",
+    "slim",
+    "sources",
+    "spec",
+    "text_fit",
+    "watch",
+)
+
+# Convenience re-exports, resolved lazily: name -> submodule
+_EXPORTS = {
+    "fit_font_size": "text_fit",
+    "generate_catalogue": "catalogue",
+    "generate_reports": "seller_reports",
+    "autolink_presentation": "links",
+    "write_variants": "aspect",
+    "open_columns": "columns",
+    "load_and_validate": "spec",
+    "new_presentation": "prototype",
+    "validate_package": "ooxml",
+    "save_presentation": "outputs",
+    "slim_presentation": "slim",
+    "SlideIR": "ir",
+    "parse_markup": "markup",
+    "add_heatmap": "heatmap",
+    "DeckReader": "reader",
+    "render_slide": "preview",
+    "finalize_deck": "media",
+    "add_media": "media",
+    "ChartBook": "charts",
+    "SpecError": "spec",
+}
+
+__all__ = sorted(_SUBMODULES + tuple(_EXPORTS))
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    if name in _EXPORTS:
+        module = importlib.import_module(f"{__name__}.{_EXPORTS[name]}")
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return __all__
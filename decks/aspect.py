@@ -0,0 +1,172 @@
+"""
+Aspect-ratio variants of a built deck.
+
+The generators lay slides out at 10 x 7.5in (4:3) with absolute positions.
+Rather than re-running the slide builders for every venue, a variant is
+made from the finished deck: the deck is cloned (decks.prototype) and the
+geometry of every top-level shape on the slides, layouts and masters is
+recomputed for the new slide size with one of four anchoring rules:
+
+- "stretch": the shape keeps its side margins and absorbs the extra width
+  (backgrounds, title and footer bands, full-width rules); table columns
+  are widened in proportion;
+- "center":  the shape moves with the centred content block (the default);
+- "left" / "right": the shape keeps its distance to that slide edge
+  (slide numbers, corner badges).
+
+Full-width shapes are stretched and everything else is centred; edge
+anchors are given by shape name (DEFAULT_ANCHORS plus the caller's own),
+since a small shape near an edge is as often part of a card as a corner mark.
+
+Vertical positions and heights are scaled with the slide height. Shapes
+that inherit their position from a layout placeholder have no geometry of
+their own and follow the transformed layout.
+
+    write_variants("cursor_presentation_pro.pptx", ["16:9"])
+    # -> cursor_presentation_pro-16x9.pptx
+"""
+
+import os
+
+from pptx import Presentation
+from pptx.oxml.ns import qn
+
+from decks.outputs import save_presentation
+from decks.prototype import SLIDE_SIZES, clone_presentation
+
+ANCHORS = ("left", "center", "right", "stretch")
+
+# Share of the slide width above which a shape is treated as a full-width band
+STRETCH_RATIO = 0.8
+
+# Shape name -> anchor for shapes that belong to a slide edge, or underline
+# a left-aligned title (the chrome layouts' accent rule)
+DEFAULT_ANCHORS = {"Slide Number": "right", "Accent Rule": "left"}
+
+_XFRM_PATHS = {
+    qn("p:sp"): (qn("p:spPr"), qn("a:xfrm")),
+    qn("p:pic"): (qn("p:spPr"), qn("a:xfrm")),
+    qn("p:cxnSp"): (qn("p:spPr"), qn("a:xfrm")),
+    qn("p:grpSp"): (qn("p:grpSpPr"), qn("a:xfrm")),
+    qn("p:graphicFrame"): (qn("p:xfrm"),),
+}
+_A_OFF = qn("a:off")
+_A_EXT = qn("a:ext")
+_GRID_COLS = "./a:graphic/a:graphicData/a:tbl/a:tblGrid/a:gridCol"
+_P_CNVPR_PATH = "./*/p:cNvPr"
+_P_GRAPHIC_FRAME = qn("p:graphicFrame")
+
+
+def anchor_for(cx, slide_width):
+    """Anchoring rule guessed from a shape's width."""
+    if cx >= slide_width * STRETCH_RATIO:
+        return "stretch"
+    return "center"
+
+
+def _xfrm(shape):
+    path = _XFRM_PATHS.get(shape.tag)
+    if path is None:
+        return None
+    node = shape
+    for tag in path:
+        node = node.find(tag)
+        if node is None:
+            return None
+    return node
+
+
+def _shape_name(shape):
+    c_nv_pr = shape.xpath(_P_CNVPR_PATH)
+    return c_nv_pr[0].get("name") if c_nv_pr else None
+
+
+def _scale_columns(frame, cx):
+    """Scale the table columns of graphicFrame `frame` to fill width `cx`."""
+    columns = frame.xpath(_GRID_COLS)
+    if not columns:
+        return
+    widths = [int(column.get("w")) for column in columns]
+    total = sum(widths)
+    # Cumulative rounding keeps the columns summing exactly to cx
+    edge = 0
+    for column, width in zip(columns, widths):
+        column.set("w", str(round((edge + width) * cx / total) - round(edge * cx / total)))
+        edge += width
+
+
+def transform_shapes(sp_tree, old_size, new_size, anchors=None):
+    """Recompute geometry of the top-level shapes of `sp_tree` in place.
+
+    `anchors` maps shape names to an anchoring rule and overrides the
+    geometric guess (and DEFAULT_ANCHORS) for those shapes.
+    """
+    anchors = {**DEFAULT_ANCHORS, **(anchors or {})}
+    old_width, old_height = old_size
+    new_width, new_height = new_size
+    dx = new_width - old_width
+    sy = new_height / old_height
+    for shape in sp_tree:
+        xfrm = _xfrm(shape)
+        if xfrm is None:
+            continue
+        off = xfrm.find(_A_OFF)
+        ext = xfrm.find(_A_EXT)
+        if off is None or ext is None:
+            continue
+        x, cx = int(off.get("x")), int(ext.get("cx"))
+        anchor = anchors.get(_shape_name(shape)) or anchor_for(cx, old_width)
+        if anchor == "stretch":
+            ext.set("cx", str(cx + dx))
+            if shape.tag == _P_GRAPHIC_FRAME:
+                _scale_columns(shape, cx + dx)
+        elif anchor == "center":
+            off.set("x", str(x + dx // 2))
+        elif anchor == "right":
+            off.set("x", str(x + dx))
+        if sy != 1:
+            off.set("y", str(round(int(off.get("y")) * sy)))
+            ext.set("cy", str(round(int(ext.get("cy")) * sy)))
+
+
+def transform_presentation(prs, aspect, anchors=None):
+    """Resize `prs` in place to `aspect` ("4:3" or "16:9")."""
+    old_size = (prs.slide_width, prs.slide_height)
+    new_size = SLIDE_SIZES[aspect]
+    if old_size == new_size:
+        return prs
+    for master in prs.slide_masters:
+        transform_shapes(master.shapes._spTree, old_size, new_size, anchors)
+        for layout in master.slide_layouts:
+            transform_shapes(layout.shapes._spTree, old_size, new_size, anchors)
+    for slide in prs.slides:
+        transform_shapes(slide.shapes._spTree, old_size, new_size, anchors)
+    prs.slide_width, prs.slide_height = new_size
+    return prs
+
+
+def make_variant(prs, aspect, anchors=None):
+    """A transformed copy of `prs`; `prs` itself is left untouched."""
+    return transform_presentation(clone_presentation(prs), aspect, anchors)
+
+
+def variant_path(path, aspect):
+    """Output path of the `aspect` variant: deck.pptx -> deck-16x9.pptx."""
+    root, ext = os.path.splitext(path)
+    return f"{root}-{aspect.replace(':', 'x')}{ext}"
+
+
+def write_variants(path, aspects, anchors=None):
+    """Write one variant of the deck at `path` per aspect; return their paths.
+
+    Aspects matching the deck's own size are skipped.
+    """
+    prs = Presentation(path)
+    written = []
+    for aspect in aspects:
+        if SLIDE_SIZES[aspect] == (prs.slide_width, prs.slide_height):
+            continue
+        output = variant_path(path, aspect)
+        save_presentation(make_variant(prs, aspect, anchors), output)
+        written.append(output)
+    return written
@@ -0,0 +1,63 @@
+"""
+Create a PowerPoint (.pptx) using python-pptx.
+Run: python3 -m decks build basic
+Output: presentation.pptx in the current directory.
+
+Edit the SLIDES list below to use your own content.
+"""
+
+from pptx.util import Inches, Pt
+
+from decks.outputs import save_presentation
+from decks.progress import deck_run
+from decks.prototype import new_presentation
+from decks.slim import slim_presentation
+
+
+# Customize your slides here: list of (title, bullet_points)
+SLIDES = [
+    ("Title Slide", ["Your presentation title", "Subtitle or date"]),
+    ("Agenda", ["Point one", "Point two", "Point three"]),
+    ("Section 1", ["Key message", "Supporting detail", "Another detail"]),
+    ("Section 2", ["Key message", "Supporting detail"]),
+    ("Thank You", ["Questions?", "Contact info"]),
+]
+
+
+def add_bullet_slide(prs, title, bullets):
+    # Title + content layout (layout 6 is often "Title and Content")
+    slide_layout = prs.slide_layouts[6]  # Blank
+    slide = prs.slides.add_slide(slide_layout)
+
+    # Title
+    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(9), Inches(1))
+    tf = title_box.text_frame
+    p = tf.paragraphs[0]
+    p.text = title
+    p.font.size = Pt(32)
+    p.font.bold = True
+
+    # Bullets
+    body_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(9), Inches(5))
+    tf = body_box.text_frame
+    tf.word_wrap = True
+    for i, bullet in enumerate(bullets):
+        if i == 0:
+            p = tf.paragraphs[0]
+        else:
+            p = tf.add_paragraph()
+        p.text = bullet
+        p.font.size = Pt(18)
+        p.space_after = Pt(12)
+
+
+def create_presentation(output_path="presentation.pptx"):
+    prs = new_presentation()
+
+    with deck_run(output_path) as deck:
+        for title, bullets in SLIDES:
+            with deck.slide(title):
+                add_bullet_slide(prs, title, bullets)
+
+        slim_presentation(prs)
+        deck.saved(save_presentation(prs, output_path))
@@ -0,0 +1,135 @@
+"""
+Cold-start benchmark and import budget for the decks CLI.
+
+Each probe runs in a fresh interpreter several times. The median wall time
+minus a bare `python -c pass` baseline is the probe's import cost, and it
+must stay under the budget. Probes for light commands also fail if they
+pulled in python-pptx, lxml or numpy.
+
+Run: python3 -m decks.bench_startup --budget-ms 60
+
+decks/tests/test_startup.py runs every probe once and fails if a light
+probe imports a heavy module. Wall times depend on machine load, so the
+budget itself is only checked there when DECKS_STARTUP_BUDGET=1 is set
+(run it, or this module, as its own CI step on an otherwise idle runner).
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+HEAVY_MODULES = ("pptx", "lxml", "numpy", "PIL", "xlsxwriter")
+BUDGET_MS = 60.0
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_REPORT_HEAVY = (
+    "import json, sys\n"
+    f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+    "print(json.dumps(heavy), file=sys.stderr)\n"
+)
+
+# Probe name -> (code, must stay light)
+PROBES = {
+    "import": ("import decks\n", True),
+    "help": (
+        "import contextlib, io\n"
+        "from decks.cli import main\n"
+        "with contextlib.redirect_stdout(io.StringIO()):\n"
+        "    try:\n"
+        "        main(['--help'])\n"
+        "    except SystemExit:\n"
+        "        pass\n",
+        True,
+    ),
+    "validate": (
+        "import contextlib, io\n"
+        "from decks.cli import main\n"
+        "with contextlib.redirect_stdout(io.StringIO()):\n"
+        "    main(['validate', {spec!r}])\n",
+        True,
+    ),
+}
+
+
+def _run_once(code):
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", code + _REPORT_HEAVY],
+        cwd=PACKAGE_ROOT, capture_output=True, text=True, check=True,
+    )
+    elapsed = time.perf_counter() - start
+    heavy = json.loads(proc.stderr.strip().splitlines()[-1])
+    return elapsed, heavy
+
+
+def measure(code, repeat):
+    """Median wall time (seconds) of `code` in fresh interpreters."""
+    timings = []
+    heavy = []
+    for _ in range(repeat):
+        elapsed, heavy = _run_once(code)
+        timings.append(elapsed)
+    return statistics.median(timings), heavy
+
+
+@contextlib.contextmanager
+def _spec_file():
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+        json.dump({"decks": [{"generator": "cursor_pro", "output": "bench.pptx"}]}, f)
+    try:
+        yield f.name
+    finally:
+        os.unlink(f.name)
+
+
+def heavy_imports():
+    """{probe: heavy modules it imported} for the probes that must stay light,
+    each run once."""
+    with _spec_file() as spec_path:
+        return {
+            name: _run_once(code.format(spec=spec_path))[1]
+            for name, (code, must_be_light) in PROBES.items() if must_be_light
+        }
+
+
+def run_benchmark(budget_ms, repeat=7):
+    """Measure every probe; return (results, failures)."""
+    with _spec_file() as spec_path:
+        baseline, _ = measure("", repeat)
+        results = {}
+        failures = []
+        for name, (code, must_be_light) in PROBES.items():
+            median, heavy = measure(code.format(spec=spec_path), repeat)
+            cost_ms = max(median - baseline, 0.0) * 1000
+            results[name] = {"import_ms": round(cost_ms, 1), "heavy_modules": heavy}
+            if cost_ms > budget_ms:
+                failures.append(f"{name}: {cost_ms:.1f} ms exceeds {budget_ms} ms budget")
+            if must_be_light and heavy:
+                failures.append(f"{name}: imported {', '.join(heavy)}")
+    return results, failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Enforce the decks cold-start budget.")
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS,
+                        help="Max import cost per probe above bare interpreter start")
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    results, failures = run_benchmark(args.budget_ms, args.repeat)
+    for name, result in results.items():
+        print(f"{name:>10}: {result['import_ms']:6.1f} ms")
+    for failure in failures:
+        print(f"✗ {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
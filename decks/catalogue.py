@@ -0,0 +1,424 @@
+"""
+Product catalogue decks streamed from a `products` export.
+
+Run: python3 -m decks catalogue products.csv --per-page 6
+Output: catalogue/<category>-<part>.pptx
+
+Listings are grouped by category (in any order) and laid out either one per slide
+(photo, price, condition, seller, description) or as N-up grid pages.
+Each category starts on a divider slide and is split into decks of at most
+`slides_per_deck` slides, which are built in a bounded process pool, so
+memory stays flat however large the export is. Inside a deck, listing
+photos are loaded and downscaled by a small thread pool a few pages ahead
+of the slide being laid out.
+
+Images are taken from the `images` column (a Postgres array literal, a JSON
+list or "|"-separated paths/URLs); only the first image of a listing is
+used. Relative paths are resolved against `image_root` (the Next.js
+`public/` directory by default) and http(s) URLs are downloaded.
+
+Draft builds (`media="link"`, `--draft`) link the photos instead of loading
+and embedding them (see decks.media): decks are a few hundred KB and build
+in a fraction of the time, and `python3 -m decks finalize` embeds the
+optimized photos later in one pass.
+"""
+
+import io
+import json
+import math
+import os
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from decks import sources
+from decks.media import MEDIA_MODES, LinkedMedia, add_linked_picture, link_media, read_media
+from decks.manifest import DEFAULT_RETRIES, MANIFEST_NAME, BatchManifest, run_jobs
+from decks.progress import deck_run
+from decks.sources import to_float, to_int
+
+CONDITION_LABELS = {
+    "brand_new": "Brand New",
+    "like_new": "Like New",
+    "excellent": "Excellent",
+    "good": "Good",
+    "fair": "Fair",
+}
+
+SLIDES_PER_DECK = 200
+# Longest edge of the downscaled photos, in pixels (~150 dpi on a 4in photo)
+IMAGE_MAX_PX = 600
+PLACEHOLDER_IMAGE = "placeholder-product.jpg"
+
+
+# =============================================================================
+# LISTINGS
+# =============================================================================
+
+def iter_rows(source, table="products"):
+    """Stream product rows from `source`, ordered by category."""
+    return sources.iter_rows(source, table, "category, created_at DESC, id")
+
+
+def parse_images(value):
+    """List of image references from an `images` cell."""
+    if isinstance(value, (list, tuple)):
+        return [str(v) for v in value if v]
+    value = (value or "").strip()
+    if not value:
+        return []
+    if value.startswith("["):
+        return [str(v) for v in json.loads(value) if v]
+    if value.startswith("{"):
+        # Postgres TEXT[] literal: {a,"b,c"}
+        return [
+            quoted.replace('\\"', '"') if quoted else bare
+            for quoted, bare in re.findall(r'"((?:[^"\\]|\\.)*)"|([^,{}]+)', value)
+            if quoted or bare.strip()
+        ]
+    return [v.strip() for v in value.split("|") if v.strip()]
+
+
+def iter_listings(rows, statuses=("active",)):
+    """Turn product rows into small listing dicts, skipping other statuses."""
+    for row in rows:
+        if statuses and (row.get("status") or "active") not in statuses:
+            continue
+        images = parse_images(row.get("images"))
+        yield {
+            "id": str(row["id"]),
+            "title": row.get("title") or "Untitled listing",
+            "description": row.get("description") or "",
+            "price": to_float(row.get("price")),
+            "category": row.get("category") or "Uncategorised",
+            "subcategory": row.get("subcategory") or "",
+            "condition": CONDITION_LABELS.get(row.get("condition"), row.get("condition") or ""),
+            "brand": row.get("brand") or "",
+            "size": row.get("size") or "",
+            "color": row.get("color") or "",
+            "seller": row.get("seller_name") or row.get("full_name") or str(row.get("seller_id") or ""),
+            "views": to_int(row.get("view_count")),
+            "image": images[0] if images else None,
+        }
+
+
+def iter_deck_jobs(listings, per_page, slides_per_deck=SLIDES_PER_DECK):
+    """Yield (category, part, listings) chunks that each fill one deck.
+
+    Every deck starts with a category divider slide, so a chunk holds at
+    most ``(slides_per_deck - 1) * per_page`` listings. Listings may come in
+    any order: they are bucketed by category and parts are numbered per
+    category across the whole stream, so every (category, part) is yielded
+    once. Full chunks are yielded as soon as they fill; the last, partial
+    chunk of each category when the stream ends, so at most one partial
+    chunk per category is held.
+    """
+    chunk_size = max(1, slides_per_deck - 1) * per_page
+    parts = {}
+    chunks = {}
+    for listing in listings:
+        category = listing["category"]
+        chunk = chunks.setdefault(category, [])
+        chunk.append(listing)
+        if len(chunk) == chunk_size:
+            parts[category] = parts.get(category, 0) + 1
+            yield category, parts[category], chunk
+            chunks[category] = []
+    for category, chunk in chunks.items():
+        if chunk:
+            parts[category] = parts.get(category, 0) + 1
+            yield category, parts[category], chunk
+
+
+def deck_filename(category, part):
+    """Stable output name for one part of a category."""
+    slug = re.sub(r"[^a-z0-9]+", "-", category.lower()).strip("-") or "uncategorised"
+    return f"{slug}-{part:03d}.pptx"
+
+
+# =============================================================================
+# IMAGES
+# =============================================================================
+
+def prepare_image(ref, image_root, max_px=IMAGE_MAX_PX):
+    """Downscaled JPEG (bytes, width, height) for `ref`, or None if unusable."""
+    from PIL import Image, ImageOps
+
+    if not ref:
+        return None
+    try:
+        with Image.open(io.BytesIO(read_media(ref, image_root))) as image:
+            image = ImageOps.exif_transpose(image).convert("RGB")
+            image.thumbnail((max_px, max_px))
+            out = io.BytesIO()
+            image.save(out, "JPEG", quality=82, optimize=True)
+            return out.getvalue(), image.width, image.height
+    except (OSError, ValueError):
+        return None
+
+
+def iter_prepared(listings, image_root, workers, max_px=IMAGE_MAX_PX):
+    """Yield (listing, image) in order, preparing at most 2 * workers ahead."""
+    window = deque()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for listing in listings:
+            if len(window) >= workers * 2:
+                done_listing, future = window.popleft()
+                yield done_listing, future.result()
+            window.append(
+                (listing, pool.submit(prepare_image, listing["image"], image_root, max_px))
+            )
+        while window:
+            done_listing, future = window.popleft()
+            yield done_listing, future.result()
+
+
+def iter_linked(listings, image_root):
+    """Yield (listing, LinkedMedia or None) in order, for draft decks."""
+    for listing in listings:
+        ref = listing["image"]
+        yield listing, link_media(ref, image_root) if ref else None
+
+
+# =============================================================================
+# DECK BUILDING
+# =============================================================================
+
+def grid_shape(per_page):
+    """(columns, rows) of an N-up grid page."""
+    columns = math.ceil(math.sqrt(per_page))
+    return columns, math.ceil(per_page / columns)
+
+
+def _add_photo(slide, scene, image, x, y, width, height):
+    """Fit `image` (prepared or LinkedMedia) centred in the box, or draw a
+    "No photo" placeholder."""
+    from decks.helpers import CURSOR_DARK_GRAY, CURSOR_MID_GRAY
+
+    if image is None:
+        scene.rectangle(x, y, width, height, CURSOR_DARK_GRAY).set_text(
+            "No photo", font_size=11, font_color=CURSOR_MID_GRAY
+        )
+        return
+    if isinstance(image, LinkedMedia):
+        add_linked_picture(slide, image, x, y, width, height)
+        return
+    data, px_width, px_height = image
+    scale = min(width / px_width, height / px_height)
+    pic_width = int(px_width * scale)
+    pic_height = int(px_height * scale)
+    slide.shapes.add_picture(
+        io.BytesIO(data),
+        x + (width - pic_width) // 2, y + (height - pic_height) // 2,
+        pic_width, pic_height,
+    )
+
+
+def _details_line(listing):
+    return "  •  ".join(
+        part for part in (listing["brand"], listing["size"], listing["color"]) if part
+    )
+
+
+def _add_listing_slide(prs, listing, image, footer):
+    from pptx.util import Inches
+
+    from decks.helpers import (
+        CURSOR_GREEN, CURSOR_LIGHT_GRAY, CURSOR_OFF_WHITE, CURSOR_PURPLE,
+    )
+    from decks.ir import SlideIR
+    from decks.masters import COMPACT_TITLE_BLOCK, add_chrome_slide
+
+    slide = add_chrome_slide(
+        prs, listing["title"], listing["subcategory"] or listing["category"],
+        CURSOR_PURPLE, footer=footer, block=COMPACT_TITLE_BLOCK,
+    )
+    scene = SlideIR()
+    _add_photo(slide, scene, image, Inches(0.5), Inches(1.4), Inches(4.6), Inches(5.3))
+
+    x = Inches(5.4)
+    width = Inches(4.1)
+    scene.textbox(x, Inches(1.4), width, Inches(0.6), f"KES {listing['price']:,.0f}",
+                  font_size=28, font_color=CURSOR_GREEN, bold=True)
+    scene.textbox(x, Inches(2.05), width, Inches(0.4), listing["condition"],
+                  font_size=14, font_color=CURSOR_PURPLE, bold=True)
+    details = _details_line(listing)
+    if details:
+        scene.textbox(x, Inches(2.5), width, Inches(0.4), details,
+                      font_size=12, font_color=CURSOR_LIGHT_GRAY)
+    scene.textbox(x, Inches(2.95), width, Inches(0.4), f"Sold by {listing['seller']}",
+                  font_size=12, font_color=CURSOR_LIGHT_GRAY)
+    if listing["description"]:
+        scene.textbox(x, Inches(3.5), width, Inches(3.1), listing["description"][:600],
+                      font_size=11, font_color=CURSOR_OFF_WHITE)
+    scene.render(slide)
+    return slide
+
+
+def _add_grid_slide(prs, category, page, prepared, per_page, footer):
+    from pptx.util import Inches
+
+    from decks.helpers import (
+        CURSOR_DARK_GRAY, CURSOR_GREEN, CURSOR_LIGHT_GRAY, CURSOR_MID_GRAY,
+        CURSOR_PURPLE, CURSOR_WHITE,
+    )
+    from decks.ir import SlideIR
+    from decks.masters import COMPACT_TITLE_BLOCK, add_chrome_slide
+
+    slide = add_chrome_slide(
+        prs, category, f"Page {page}", CURSOR_PURPLE,
+        footer=footer, block=COMPACT_TITLE_BLOCK,
+    )
+    scene = SlideIR()
+    columns, rows = grid_shape(per_page)
+    gap = Inches(0.2)
+    left = Inches(0.5)
+    top = Inches(1.4)
+    cell_width = (Inches(9) - gap * (columns - 1)) // columns
+    cell_height = (Inches(5.4) - gap * (rows - 1)) // rows
+    caption_height = min(Inches(0.75), cell_height // 3)
+    text_size = 11 if rows <= 2 else 9
+
+    cells = [
+        (left + (cell_width + gap) * (i % columns), top + (cell_height + gap) * (i // columns))
+        for i in range(len(prepared))
+    ]
+    # Card backgrounds go in first so the photos are drawn on top of them
+    cards = SlideIR()
+    for x, y in cells:
+        cards.rounded_rectangle(x, y, cell_width, cell_height, CURSOR_DARK_GRAY,
+                                border_color=CURSOR_MID_GRAY, border_width=1)
+    cards.render(slide)
+
+    for (x, y), (listing, image) in zip(cells, prepared):
+        photo_pad = Inches(0.08)
+        _add_photo(
+            slide, scene, image, x + photo_pad, y + photo_pad,
+            cell_width - photo_pad * 2, cell_height - caption_height - photo_pad,
+        )
+        caption_y = y + cell_height - caption_height
+        line = caption_height // 3
+        scene.textbox(x + photo_pad, caption_y, cell_width - photo_pad * 2, line,
+                      listing["title"], font_size=text_size, font_color=CURSOR_WHITE, bold=True)
+        scene.textbox(x + photo_pad, caption_y + line, cell_width - photo_pad * 2, line,
+                      f"KES {listing['price']:,.0f}  •  {listing['condition']}",
+                      font_size=text_size, font_color=CURSOR_GREEN)
+        scene.textbox(x + photo_pad, caption_y + line * 2, cell_width - photo_pad * 2, line,
+                      listing["seller"], font_size=text_size - 1, font_color=CURSOR_LIGHT_GRAY)
+    scene.render(slide)
+    return slide
+
+
+def _add_divider_slide(prs, category, part, count):
+    from pptx.util import Inches
+
+    from decks.helpers import CURSOR_LIGHT_GRAY, CURSOR_WHITE
+    from decks.ir import SlideIR
+    from decks.masters import add_blank_chrome_slide
+
+    slide = add_blank_chrome_slide(prs)
+    scene = SlideIR()
+    title = category if part == 1 else f"{category} (continued)"
+    scene.textbox(Inches(1), Inches(2.9), Inches(8), Inches(0.9), title,
+                  font_size=40, font_color=CURSOR_WHITE, bold=True, alignment="center")
+    scene.textbox(Inches(1), Inches(3.8), Inches(8), Inches(0.5),
+                  f"{count:,} listings", font_size=16,
+                  font_color=CURSOR_LIGHT_GRAY, alignment="center")
+    scene.render(slide)
+    return slide
+
+
+def build_catalogue_deck(category, part, listings, output_path, per_page=1,
+                         image_root="public", image_workers=8, check=False,
+                         media="embed"):
+    """Build one catalogue deck and write it atomically to `output_path`.
+
+    `media` is "embed" for downscaled embedded photos or "link" for a draft
+    that links them (see decks.media).
+    """
+    from decks.outputs import save_presentation
+    from decks.prototype import new_presentation
+    from decks.slim import slim_presentation
+
+    prs = new_presentation()
+    footer = "Source: Outfittr listings, outfittr.co.ke"
+    # Listings keep image refs relative to `image_root`; only the existence
+    # check needs the joined path
+    has_placeholder = os.path.exists(os.path.join(image_root, PLACEHOLDER_IMAGE))
+
+    with deck_run(output_path) as deck:
+        with deck.slide(category):
+            _add_divider_slide(prs, category, part, len(listings))
+        for listing in listings:
+            if listing["image"] is None and has_placeholder:
+                listing["image"] = PLACEHOLDER_IMAGE
+
+        if media == "link":
+            prepared = iter_linked(listings, image_root)
+        else:
+            prepared = iter_prepared(listings, image_root, image_workers)
+        if per_page == 1:
+            for listing, image in prepared:
+                with deck.slide(listing["id"]):
+                    _add_listing_slide(prs, listing, image, footer)
+        else:
+            page = []
+            page_number = 1
+            for item in prepared:
+                page.append(item)
+                if len(page) == per_page:
+                    with deck.slide(f"Page {page_number}"):
+                        _add_grid_slide(prs, category, page_number, page, per_page, footer)
+                    page_number += 1
+                    page = []
+            if page:
+                with deck.slide(f"Page {page_number}"):
+                    _add_grid_slide(prs, category, page_number, page, per_page, footer)
+
+        slim_presentation(prs)
+        deck.saved(save_presentation(prs, output_path, check=check))
+    return output_path
+
+
+# =============================================================================
+# BATCH RUNNER
+# =============================================================================
+
+def generate_catalogue(source, output_dir, table="products", per_page=1,
+                       image_root="public", workers=None, image_workers=8,
+                       slides_per_deck=SLIDES_PER_DECK, check=False,
+                       retries=DEFAULT_RETRIES, executor="process", media="embed"):
+    """Stream listings from `source` and build catalogue decks in a bounded pool.
+
+    At most ``2 * workers`` deck chunks are held in memory at a time.
+    Progress is journalled in `output_dir`/manifest.jsonl, so an interrupted
+    run only builds the decks that are not done yet. With `check`, each deck
+    is run through decks.ooxml in its worker before it is published.
+    `executor` picks a process or thread pool (see decks.manifest.run_jobs).
+    `media="link"` builds drafts with linked photos (see decks.media).
+    Returns (built, skipped, failed, listings).
+    """
+    if media not in MEDIA_MODES:
+        raise ValueError(f"media must be one of {', '.join(MEDIA_MODES)}, not {media!r}")
+    os.makedirs(output_dir, exist_ok=True)
+    listings_total = 0
+
+    def jobs():
+        nonlocal listings_total
+        chunks = iter_deck_jobs(
+            iter_listings(iter_rows(source, table)), per_page, slides_per_deck
+        )
+        for category, part, listings in chunks:
+            listings_total += len(listings)
+            filename = deck_filename(category, part)
+            output_path = os.path.join(output_dir, filename)
+            yield filename, output_path, build_catalogue_deck, (
+                category, part, listings, output_path,
+                per_page, image_root, image_workers, check, media,
+            )
+
+    with BatchManifest(os.path.join(output_dir, MANIFEST_NAME)) as manifest:
+        built, skipped, failed = run_jobs(
+            jobs(), manifest, workers=workers, retries=retries, executor=executor
+        )
+    return built, skipped, failed, listings_total
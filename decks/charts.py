@@ -0,0 +1,144 @@
+"""
+Charts without one embedded workbook per chart.
+
+python-pptx's `shapes.add_chart` writes the chart XML and embeds a full
+xlsx workbook (built with xlsxwriter) holding the chart's data, so that
+PowerPoint's "Edit Data" works. That workbook costs tens of milliseconds
+and several KB per chart, which adds up in analytics decks with 20+
+charts. A ChartBook adds charts to one presentation in one of three modes:
+
+- "embedded": plain python-pptx, one workbook per chart;
+- "static":   chart XML only, with the values cached in the XML. The chart
+              renders and can be restyled, but has no data to edit;
+- "shared":   one workbook for the whole deck, with one worksheet per
+              chart, written by `finish()`. Every chart's formulas point
+              at its own sheet, so "Edit Data" still works.
+
+    charts = ChartBook(prs, mode="shared")
+    charts.add_chart(slide, XL_CHART_TYPE.COLUMN_CLUSTERED,
+                     Inches(0.5), Inches(1.3), Inches(9), Inches(5), chart_data)
+    ...
+    charts.finish()
+    save_presentation(prs, path)
+
+Shared workbooks are laid out by this module (categories in column A, one
+column per series, names in row 1), and every chart's formulas are
+rewritten to point at its own sheet, so nothing depends on how python-pptx
+lays out its own workbooks. The seller report decks use a ChartBook for
+their chart slide.
+"""
+
+import io
+
+from lxml import etree
+from pptx.chart.data import CategoryChartData
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import qn
+from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
+from pptx.parts.chart import ChartPart
+from pptx.shapes.graphfrm import GraphicFrame
+
+CHART_MODES = ("embedded", "static", "shared")
+
+
+def _column(index):
+    """Spreadsheet column letters of 0-based `index` (0 -> A, 26 -> AA)."""
+    letters = ""
+    index += 1
+    while index:
+        index, rest = divmod(index - 1, 26)
+        letters = chr(ord("A") + rest) + letters
+    return letters
+
+
+def _point_sheet(chart_xml, sheet, chart_data):
+    """Point the formulas of a category chart's XML at `sheet`, laid out as
+    _write_sheet writes it: categories in column A, one column per series
+    with its name in row 1."""
+    chart = parse_xml(chart_xml)
+    rows = len(chart_data.categories)
+    quoted = "'%s'" % sheet.replace("'", "''")
+    for i, ser in enumerate(chart.iter(qn("c:ser"))):
+        column = _column(i + 1)
+        refs = {
+            "c:tx": f"{quoted}!${column}$1",
+            "c:cat": f"{quoted}!$A$2:$A${rows + 1}",
+            "c:val": f"{quoted}!${column}$2:${column}${rows + 1}",
+        }
+        for tag, ref in refs.items():
+            for f in ser.findall(f"{qn(tag)}/*/{qn('c:f')}"):
+                f.text = ref
+    return etree.tostring(chart)
+
+
+def _write_sheet(workbook, sheet, chart_data):
+    worksheet = workbook.add_worksheet(sheet)
+    worksheet.write_column(1, 0, [category.label for category in chart_data.categories])
+    for i, series in enumerate(chart_data, 1):
+        number_format = workbook.add_format({"num_format": series.number_format})
+        worksheet.write(0, i, series.name)
+        worksheet.write_column(1, i, series.values, number_format)
+
+
+class ChartBook:
+    """Adds charts to one presentation; see the module docstring for modes."""
+
+    def __init__(self, prs, mode="static"):
+        if mode not in CHART_MODES:
+            raise ValueError(f"chart mode must be one of {', '.join(CHART_MODES)}, not {mode!r}")
+        self.prs = prs
+        self.mode = mode
+        self._pending = []
+
+    def add_chart(self, slide, chart_type, x, y, cx, cy, chart_data):
+        """Add a chart of `chart_type` showing `chart_data`; returns the graphic frame.
+
+        Shared mode takes CategoryChartData with one level of categories
+        (bar, column, line, pie and area charts).
+        """
+        shapes = slide.shapes
+        if self.mode == "embedded":
+            return shapes.add_chart(chart_type, x, y, cx, cy, chart_data)
+
+        blob = chart_data.xml_bytes(chart_type)
+        sheet = None
+        if self.mode == "shared":
+            if not isinstance(chart_data, CategoryChartData) or chart_data.categories.depth != 1:
+                raise TypeError("shared charts take CategoryChartData with one level of categories")
+            sheet = f"Chart{len(self._pending) + 1}"
+            blob = _point_sheet(blob, sheet, chart_data)
+        package = slide.part.package
+        chart_part = ChartPart.load(
+            package.next_partname(ChartPart.partname_template), CT.DML_CHART, package, blob
+        )
+        rId = slide.part.relate_to(chart_part, RT.CHART)
+        sp_tree = shapes.element
+        shape_id = max(int(i) for i in sp_tree.xpath("//p:cNvPr/@id")) + 1
+        graphic_frame = CT_GraphicalObjectFrame.new_chart_graphicFrame(
+            shape_id, f"Chart {shape_id - 1}", rId, x, y, cx, cy
+        )
+        sp_tree.append(graphic_frame)
+        if sheet is not None:
+            self._pending.append((chart_part, sheet, chart_data))
+        return GraphicFrame(graphic_frame, shapes)
+
+    def finish(self):
+        """Write the shared workbook and link every pending chart to it."""
+        if not self._pending:
+            return None
+        from pptx.parts.embeddedpackage import EmbeddedXlsxPart
+        from xlsxwriter import Workbook
+
+        xlsx_file = io.BytesIO()
+        workbook = Workbook(xlsx_file, {"in_memory": True})
+        for _, sheet, chart_data in self._pending:
+            _write_sheet(workbook, sheet, chart_data)
+        workbook.close()
+
+        xlsx_part = EmbeddedXlsxPart.new(xlsx_file.getvalue(), self.prs.part.package)
+        for chart_part, _, _ in self._pending:
+            chart_part.chart_workbook.xlsx_part = xlsx_part
+        self._pending = []
+        return xlsx_part
@@ -0,0 +1,518 @@
+"""
+Command line entry point: `python3 -m decks <command>`.
+
+Only argparse and decks.spec are imported up front. Generator modules (and
+with them python-pptx, lxml and numpy) are imported inside the command that
+needs them, so `--help` and `validate` stay fast enough for short CLI and
+serverless invocations. decks.bench_startup enforces that.
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+from datetime import date
+
+from decks.outputs import is_remote
+from decks.spec import (
+    ASPECTS, GENERATORS, SpecError, build_entry, entry_id_of, load_and_validate,
+    resolve_generator,
+)
+
+
+def _report_issues(paths, workers=None):
+    """Run the OOXML checks on `paths`; print issues and return an exit code."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    import zipfile
+
+    from decks.ooxml import Issue, validate_package
+
+    failed = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for path in paths:
+            try:
+                issues = validate_package(path, executor=pool)
+            except (OSError, zipfile.BadZipFile) as exc:
+                issues = [Issue(path, f"cannot read package: {exc}")]
+            for issue in issues:
+                print(f"✗ {path}: {issue.part}: {issue.message}", file=sys.stderr)
+            failed += bool(issues)
+    if failed:
+        print(f"✗ {failed} of {len(paths)} decks failed the OOXML checks", file=sys.stderr)
+        return 1
+    return 0
+
+
+def cmd_build(args):
+    if args.output and is_remote(args.output) and (args.aspect or args.check):
+        print("✗ --aspect and --check need a local --output", file=sys.stderr)
+        return 1
+    if args.output:
+        outputs = build_entry({
+            "generator": args.generator, "output": args.output,
+            "aspects": args.aspect or [],
+        })
+    elif args.aspect or args.check:
+        print("✗ --aspect and --check need an explicit --output", file=sys.stderr)
+        return 1
+    else:
+        resolve_generator(args.generator)()
+        return 0
+    return _report_issues(outputs) if args.check else 0
+
+
+def cmd_validate(args):
+    try:
+        entries = load_and_validate(args.spec)
+    except SpecError as exc:
+        for error in exc.errors:
+            print(f"✗ {error}", file=sys.stderr)
+        return 1
+    print(f"✓ {args.spec}: {len(entries)} decks")
+    return 0
+
+
+def cmd_run(args):
+    try:
+        entries = load_and_validate(args.spec)
+    except SpecError as exc:
+        for error in exc.errors:
+            print(f"✗ {error}", file=sys.stderr)
+        return 1
+    import time
+
+    from decks.manifest import BatchManifest, file_sha256, run_with_retries
+    from decks.progress import get_reporter
+
+    get_reporter().total = len(entries)
+    outputs = []
+    skipped = failed = 0
+    with BatchManifest(args.manifest or args.spec + ".manifest.jsonl") as manifest:
+        for entry in entries:
+            entry_id = entry_id_of(entry)
+            # Remote outputs cannot be checked cheaply; trust the journal
+            local = None if is_remote(entry["output"]) else entry["output"]
+            if manifest.is_done(entry_id, local):
+                skipped += 1
+                continue
+            started = time.perf_counter()
+            try:
+                built, attempts = run_with_retries(build_entry, entry, retries=args.retries)
+            except Exception as exc:
+                manifest.mark_failed(entry_id, f"{type(exc).__name__}: {exc}", args.retries + 1)
+                print(f"✗ {entry_id}: {exc}", file=sys.stderr)
+                failed += 1
+                continue
+            manifest.mark_done(
+                entry_id, entry["output"], local and file_sha256(local),
+                round(time.perf_counter() - started, 3), attempts,
+            )
+            if local:
+                outputs.extend(built)
+    if skipped:
+        print(f"✓ {skipped} decks already done")
+    status = _report_issues(outputs) if args.check and outputs else 0
+    return 1 if failed else status
+
+
+def cmd_shard_init(args):
+    try:
+        entries = load_and_validate(args.spec)
+    except SpecError as exc:
+        for error in exc.errors:
+            print(f"✗ {error}", file=sys.stderr)
+        return 1
+    from decks.shard import init_shards
+
+    count = init_shards(entries, args.shared_dir, args.shard_size)
+    print(f"✓ {len(entries)} decks in {count} shards under {args.shared_dir}")
+    return 0
+
+
+def cmd_shard_work(args):
+    from decks.shard import work
+
+    built = work(
+        args.shared_dir, node=args.node, lease_seconds=args.lease_seconds,
+        retries=args.retries, wait=not args.no_wait, retry_failed=args.retry_failed,
+    )
+    print(f"✅ Built {built} shards")
+    return 0
+
+
+def cmd_shard_gather(args):
+    from decks.shard import gather
+
+    problems = gather(args.shared_dir)
+    for problem in problems:
+        print(f"✗ {problem}", file=sys.stderr)
+    if problems:
+        return 1
+    print(f"✓ every shard in {args.shared_dir} is done and verified")
+    return 0
+
+
+def cmd_check(args):
+    return _report_issues(args.decks, args.workers)
+
+
+def cmd_finalize(args):
+    import zipfile
+
+    from decks.media import finalize_deck
+
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+    problems = 0
+    for path in args.decks:
+        output = os.path.join(args.output_dir, os.path.basename(path)) if args.output_dir else path
+        try:
+            embedded, missing = finalize_deck(path, output, dpi=args.dpi, workers=args.workers)
+        except (OSError, KeyError, zipfile.BadZipFile) as exc:
+            print(f"✗ {path}: {exc}", file=sys.stderr)
+            problems += 1
+            continue
+        print(f"✓ {output}: embedded {embedded} pictures")
+        for target in missing:
+            print(f"✗ {path}: cannot read {target}, left linked", file=sys.stderr)
+        problems += bool(missing)
+    return 1 if problems else 0
+
+
+def cmd_slim(args):
+    import zipfile
+
+    from lxml import etree
+    from pptx import Presentation
+
+    from decks.outputs import save_presentation
+    from decks.slim import slim_presentation
+
+    problems = 0
+    for path in args.decks:
+        try:
+            prs = Presentation(path)
+        except (OSError, KeyError, zipfile.BadZipFile) as exc:
+            print(f"✗ {path}: {exc}", file=sys.stderr)
+            problems += 1
+            continue
+        before = sum(len(etree.tostring(slide._element)) for slide in prs.slides)
+        slim_presentation(prs)
+        after = sum(len(etree.tostring(slide._element)) for slide in prs.slides)
+        save_presentation(prs, path)
+        print(f"✓ {path}: slide XML {before:,} → {after:,} bytes")
+    return 1 if problems else 0
+
+
+def cmd_inspect(args):
+    import zipfile
+
+    from decks.reader import DeckReader
+
+    audit = args.require_notes or args.require_shape
+    problems = 0
+    for path in args.decks:
+        try:
+            with DeckReader(path) as deck:
+                if not audit:
+                    print(f"{path}: {len(deck)} slides")
+                    for slide in deck:
+                        print(f"  {slide.number:>3}  {slide.title.splitlines()[0] if slide.title else ''}")
+                    continue
+                for slide in deck:
+                    missing = ["notes"] if args.require_notes and not slide.notes else []
+                    missing += [
+                        f"shape {name!r}" for name in args.require_shape
+                        if name not in slide.shape_names
+                    ]
+                    if missing:
+                        print(f"✗ {path}: slide {slide.number}: no {', '.join(missing)}",
+                              file=sys.stderr)
+                        problems += 1
+        except (OSError, KeyError, zipfile.BadZipFile) as exc:
+            print(f"✗ {path}: {exc}", file=sys.stderr)
+            problems += 1
+    if audit and not problems:
+        print(f"✓ {len(args.decks)} decks passed")
+    return 1 if problems else 0
+
+
+def cmd_watch(args):
+    from decks.watch import Watcher
+
+    if args.target not in GENERATORS and not os.path.isfile(args.target):
+        print(f"✗ {args.target} is neither a generator nor a spec file", file=sys.stderr)
+        return 1
+    if args.output and args.target not in GENERATORS:
+        print("✗ --output is only for a single generator; a spec lists its outputs",
+              file=sys.stderr)
+        return 1
+    try:
+        watcher = Watcher.for_target(args.target, args.output)
+    except SpecError as exc:
+        for error in exc.errors:
+            print(f"✗ {error}", file=sys.stderr)
+        return 1
+    print(f"Watching {args.target}; preview on http://{args.host}:{args.port}/ (Ctrl-C to stop)",
+          file=sys.stderr)
+    try:
+        watcher.serve(args.host, args.port, open_browser=args.open)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def cmd_index(args):
+    from decks.search import update_index
+
+    indexed, unchanged, removed, errors = update_index(
+        args.index, args.paths, workers=args.workers
+    )
+    for path, error in errors:
+        print(f"✗ {path}: {error}", file=sys.stderr)
+    print(f"✓ Indexed {indexed} decks ({unchanged} unchanged, {removed} removed) in {args.index}")
+    return 1 if errors else 0
+
+
+def cmd_search(args):
+    import sqlite3
+
+    from decks.search import decks_citing, search
+
+    if args.url:
+        for path, slide, url in decks_citing(args.index, args.query, prefix=args.prefix,
+                                             limit=args.limit):
+            print(f"{path}  slide {slide}  {url}")
+        return 0
+    try:
+        hits = search(args.index, args.query, limit=args.limit, raw=args.raw)
+    except sqlite3.OperationalError as exc:
+        print(f"✗ invalid search query {args.query!r}: {exc}", file=sys.stderr)
+        return 1
+    for hit in hits:
+        print(f"{hit.path}  slide {hit.slide}  {hit.title}")
+        print(f"    {' '.join(hit.snippet.split())}")
+    return 0
+
+
+def _report_failed(failed, output_dir):
+    if not failed:
+        return 0
+    print(f"✗ {failed} decks failed; see {os.path.join(output_dir, 'manifest.jsonl')} "
+          "and rerun to retry them", file=sys.stderr)
+    return 1
+
+
+def cmd_seller_reports(args):
+    from decks.seller_reports import generate_reports
+
+    output_dir = args.output_dir or os.path.join("seller_reports", args.month)
+    built, skipped, failed = generate_reports(
+        args.source, args.month, output_dir,
+        table=args.table, workers=args.workers, pdf=args.pdf, check=args.check,
+        retries=args.retries, columnar=args.columnar, executor=args.executor,
+        charts=args.charts,
+    )
+    print(f"✅ Built {built} seller decks in {output_dir} ({skipped} already done)")
+    return _report_failed(failed, output_dir)
+
+
+def cmd_catalogue(args):
+    from decks.catalogue import generate_catalogue
+
+    built, skipped, failed, listings = generate_catalogue(
+        args.source, args.output_dir,
+        table=args.table, per_page=args.per_page, image_root=args.image_root,
+        workers=args.workers, image_workers=args.image_workers,
+        slides_per_deck=args.slides_per_deck, check=args.check, retries=args.retries,
+        executor=args.executor, media="link" if args.draft else "embed",
+    )
+    print(f"✅ Built {built} catalogue decks for {listings:,} listings "
+          f"in {args.output_dir} ({skipped} already done)")
+    return _report_failed(failed, args.output_dir)
+
+
+CHECK_HELP = "Check the written decks against the OOXML schema subset (decks.ooxml)"
+RETRIES_HELP = "Retries per failing deck, with exponential backoff"
+EXECUTOR_HELP = ("Build decks in worker processes, or in threads of this process "
+                 "(no pickling; best for many small decks)")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python3 -m decks",
+        description="Build Outfittr and Cursor presentation decks.",
+    )
+    parser.add_argument("--progress", choices=("text", "json", "none"), default="text",
+                        help="Progress events: short text lines, JSON lines, or nothing")
+    parser.add_argument("--progress-file", default=None,
+                        help="Append progress events to this file instead of stdout")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    p = commands.add_parser("build", help="Build a single deck")
+    p.add_argument("generator", choices=sorted(GENERATORS))
+    p.add_argument("-o", "--output",
+                   help="Output .pptx path or s3://bucket/key (default: generator's own)")
+    p.add_argument("--aspect", action="append", choices=ASPECTS,
+                   help="Also write a variant re-laid out to this slide size "
+                        "(repeatable; e.g. --aspect 16:9 -> <output>-16x9.pptx)")
+    p.add_argument("--check", action="store_true", help=CHECK_HELP)
+    p.set_defaults(func=cmd_build)
+
+    p = commands.add_parser("validate", help="Check a spec file without building")
+    p.add_argument("spec", help="JSON or JSON Lines spec file")
+    p.set_defaults(func=cmd_validate)
+
+    p = commands.add_parser("run", help="Build every deck listed in a spec file")
+    p.add_argument("spec", help="JSON or JSON Lines spec file")
+    p.add_argument("--check", action="store_true", help=CHECK_HELP)
+    p.add_argument("--manifest", default=None,
+                   help="Resume journal (default: <spec>.manifest.jsonl)")
+    p.add_argument("--retries", type=int, default=2, help=RETRIES_HELP)
+    p.set_defaults(func=cmd_run)
+
+    p = commands.add_parser("seller-reports", help="Build monthly seller report decks")
+    p.add_argument("source", help="CSV file, Parquet file, SQLite file or postgres:// DSN")
+    p.add_argument("--month", default=date.today().strftime("%Y-%m"),
+                   help="Report month label (default: current month)")
+    p.add_argument("--table", default="seller_leaderboard",
+                   help="Table or view to read for SQLite/Postgres sources")
+    p.add_argument("--output-dir", default=None,
+                   help="Output directory (default: seller_reports/<month>)")
+    p.add_argument("--workers", type=int, default=None,
+                   help="Parallel workers (default: CPU count)")
+    p.add_argument("--pdf", action="store_true",
+                   help="Also export each deck to PDF via LibreOffice")
+    p.add_argument("--check", action="store_true", help=CHECK_HELP)
+    p.add_argument("--retries", type=int, default=2, help=RETRIES_HELP)
+    p.add_argument("--columnar", action="store_true",
+                   help="Memory-map a large CSV export and group it column-wise "
+                        "(always on for Parquet)")
+    p.add_argument("--executor", choices=("process", "thread"), default="process",
+                   help=EXECUTOR_HELP)
+    p.add_argument("--charts", choices=("static", "shared", "embedded"), default="static",
+                   help="static: chart XML only (smallest, no editable data); "
+                        "shared: one workbook per deck; embedded: one workbook per chart")
+    p.set_defaults(func=cmd_seller_reports)
+
+    p = commands.add_parser("catalogue", help="Build product catalogue decks")
+    p.add_argument("source", help="CSV file, Parquet file, SQLite file or postgres:// DSN")
+    p.add_argument("--table", default="products",
+                   help="Table or view to read for SQLite/Postgres sources")
+    p.add_argument("--per-page", type=int, default=1,
+                   help="Listings per slide: 1 for listing slides, N for N-up grids")
+    p.add_argument("--output-dir", default="catalogue", help="Output directory")
+    p.add_argument("--image-root", default="public",
+                   help="Directory relative image paths are resolved against")
+    p.add_argument("--workers", type=int, default=None,
+                   help="Parallel workers (default: CPU count)")
+    p.add_argument("--image-workers", type=int, default=8,
+                   help="Image loading threads per worker process")
+    p.add_argument("--slides-per-deck", type=int, default=200,
+                   help="Split a category into decks of at most this many slides")
+    p.add_argument("--check", action="store_true", help=CHECK_HELP)
+    p.add_argument("--retries", type=int, default=2, help=RETRIES_HELP)
+    p.add_argument("--executor", choices=("process", "thread"), default="process",
+                   help=EXECUTOR_HELP)
+    p.add_argument("--draft", action="store_true",
+                   help="Link photos instead of embedding them (embed later with finalize)")
+    p.set_defaults(func=cmd_catalogue)
+
+    p = commands.add_parser("finalize", help="Embed the linked photos of draft decks")
+    p.add_argument("decks", nargs="+", help="Draft .pptx files")
+    p.add_argument("--output-dir", default=None,
+                   help="Write finalized decks here (default: replace the drafts)")
+    p.add_argument("--dpi", type=int, default=150,
+                   help="Embedded resolution, in pixels per inch of the largest display size")
+    p.add_argument("--workers", type=int, default=8, help="Image loading threads")
+    p.set_defaults(func=cmd_finalize)
+
+    p = commands.add_parser("shard", help="Split a spec across nodes via a shared directory")
+    shard = p.add_subparsers(dest="shard_command", required=True)
+    sp = shard.add_parser("init", help="Split a spec file into shards")
+    sp.add_argument("spec", help="JSON or JSON Lines spec file")
+    sp.add_argument("shared_dir", help="Directory shared by every node")
+    sp.add_argument("--shard-size", type=int, default=50, help="Decks per shard")
+    sp.set_defaults(func=cmd_shard_init)
+    sp = shard.add_parser("work", help="Claim and build shards until all are done")
+    sp.add_argument("shared_dir", help="Directory shared by every node")
+    sp.add_argument("--node", default=None, help="Node name (default: host:pid)")
+    sp.add_argument("--lease-seconds", type=float, default=60,
+                    help="Lease length; a node that stops renewing loses its shard")
+    sp.add_argument("--retries", type=int, default=2, help=RETRIES_HELP)
+    sp.add_argument("--no-wait", action="store_true",
+                    help="Exit when nothing is claimable instead of waiting for takeovers")
+    sp.add_argument("--retry-failed", action="store_true",
+                    help="Claim shards with failed decks again and rebuild those decks")
+    sp.set_defaults(func=cmd_shard_work)
+    sp = shard.add_parser("gather", help="Verify every shard and output")
+    sp.add_argument("shared_dir", help="Directory shared by every node")
+    sp.set_defaults(func=cmd_shard_gather)
+
+    p = commands.add_parser("check", help="Run the OOXML checks on built decks")
+    p.add_argument("decks", nargs="+", help=".pptx files to check")
+    p.add_argument("--workers", type=int, default=None,
+                   help="Parallel workers (default: CPU count)")
+    p.set_defaults(func=cmd_check)
+
+    p = commands.add_parser("slim", help="Minimize the slide XML of built decks in place")
+    p.add_argument("decks", nargs="+", help=".pptx files to rewrite")
+    p.set_defaults(func=cmd_slim)
+
+    p = commands.add_parser("inspect", help="List slide titles, or audit built decks")
+    p.add_argument("decks", nargs="+", help=".pptx files to read")
+    p.add_argument("--require-notes", action="store_true",
+                   help="Report slides without speaker notes")
+    p.add_argument("--require-shape", action="append", default=[], metavar="NAME",
+                   help="Report slides without a shape of this name (repeatable)")
+    p.set_defaults(func=cmd_inspect)
+
+    p = commands.add_parser("watch", help="Rebuild slides on change with a live browser preview")
+    p.add_argument("target", help=f"Generator ({', '.join(GENERATORS)}) or spec file")
+    p.add_argument("-o", "--output", help="Also write the deck here after each rebuild")
+    p.add_argument("--host", default="127.0.0.1", help="Preview server address")
+    p.add_argument("--port", type=int, default=8000, help="Preview server port")
+    p.add_argument("--open", action="store_true", help="Open the preview in a browser")
+    p.set_defaults(func=cmd_watch)
+
+    p = commands.add_parser("index", help="Index built decks for search (incremental)")
+    p.add_argument("index", help="Index database file (SQLite)")
+    p.add_argument("paths", nargs="+", help=".pptx files or directories to index")
+    p.add_argument("--workers", type=int, default=None,
+                   help="Parallel workers (default: CPU count)")
+    p.set_defaults(func=cmd_index)
+
+    p = commands.add_parser("search", help="Search indexed decks")
+    p.add_argument("index", help="Index database file (SQLite)")
+    p.add_argument("query", help='Words or "phrases" to find, or a URL with --url')
+    p.add_argument("--raw", action="store_true",
+                   help="Pass the query through in SQLite FTS5 syntax (prefix*, NOT, NEAR)")
+    p.add_argument("--url", action="store_true",
+                   help="Find decks linking to the URL given as the query")
+    p.add_argument("--prefix", action="store_true",
+                   help="With --url, also match every URL starting with it")
+    p.add_argument("--limit", type=int, default=20, help="Maximum results")
+    p.set_defaults(func=cmd_search)
+
+    return parser
+
+
+def _run_with_progress(args, stream):
+    from decks.progress import JsonLinesSink, ProgressReporter, TextSink, use_reporter
+
+    sinks = {"text": [TextSink(stream)], "json": [JsonLinesSink(stream)], "none": []}
+    with use_reporter(ProgressReporter(sinks[args.progress])):
+        if args.progress == "json" and stream is None:
+            # Keep stdout pure JSON lines; command summaries go to stderr
+            with contextlib.redirect_stdout(sys.stderr):
+                return args.func(args)
+        return args.func(args)
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.progress_file:
+        with open(args.progress_file, "a", encoding="utf-8") as stream:
+            return _run_with_progress(args, stream)
+    return _run_with_progress(args, None)
@@ -0,0 +1,429 @@
+"""
+Columnar ingestion of large CSV and Parquet exports.
+
+Data-bound slides (tables, charts, per-seller decks) read columns by name
+from a ColumnTable instead of iterating Python row dicts:
+
+    with open_columns("leaderboard.csv") as table:
+        top = table.where(table["items_sold"] > 0).sort_by("rank_position").head(10)
+        rows = table_rows(top, ["full_name", "items_sold"], {"items_sold": "{:,}"})
+        for seller_id, seller in table.group_by("seller_id"):
+            ...
+
+CSV files are memory-mapped and scanned block by block with NumPy: field
+boundaries come from vectorized searches for delimiters and newlines, and
+only the columns a deck asks for are converted, each straight into one
+typed array (int64, float64 or variable-width NumPy strings). A column's
+field bytes are gathered into one flat buffer plus offsets and converted
+ROW_CHUNK rows at a time, so a few long fields (descriptions) do not widen
+the whole column. The file itself is never read into Python objects, so
+multi-GB exports cost the size of the used columns.
+Quoted fields (with delimiters, newlines or "" inside) are handled per
+block: only blocks that contain a quote character pay for the quote
+tracking, which is one more vectorized pass (a running parity of quotes).
+
+Parquet files are read with pyarrow (imported on first use; install it to
+read .parquet), memory-mapped and one column at a time.
+
+Filtering, sorting and grouping return views that share the loaded
+columns and only carry an index array.
+"""
+
+import csv
+import mmap
+import os
+
+import numpy as np
+
+BLOCK_BYTES = 64 << 20
+ROW_CHUNK = 4096
+CHUNK_BYTES = 1 << 20
+
+_NEWLINE = ord("\n")
+_CR = ord("\r")
+_QUOTE = ord('"')
+
+# Variable-width strings: short values are stored inline, long ones on a heap
+STRING = np.dtypes.StringDType()
+
+
+# =============================================================================
+# COLUMN SOURCES
+# =============================================================================
+
+def _chunks(parts):
+    """Field bytes of `parts` ((data, offsets) pairs) as "S" arrays of up to
+    ROW_CHUNK rows, each only as wide as its longest field and halved until
+    it fits in CHUNK_BYTES, so a long field costs its own few rows."""
+    for data, offsets in parts:
+        if not len(data):
+            data = np.zeros(1, dtype=np.uint8)
+        first = 0
+        while first < len(offsets) - 1:
+            rows = ROW_CHUNK
+            while True:
+                bounds = offsets[first:first + rows + 1]
+                lengths = np.diff(bounds)
+                field_width = max(int(lengths.max(initial=0)), 1)
+                if rows == 1 or len(lengths) * field_width <= CHUNK_BYTES:
+                    break
+                rows //= 2
+            columns = np.arange(field_width)
+            chars = np.where(
+                columns < lengths[:, None],
+                data[np.minimum(bounds[:-1, None] + columns, len(data) - 1)],
+                0,
+            ).astype(np.uint8)
+            yield chars.view(f"S{field_width}").ravel()
+            first += len(lengths)
+
+
+def _decode(raw):
+    return np.char.decode(raw, "utf-8").astype(STRING)
+
+
+def _int(raw):
+    if (raw == b"").any():
+        raise ValueError("empty fields are not integers")
+    return raw.astype(np.int64)
+
+
+def _convert(parts, dtype=None):
+    """Typed array from the field bytes of one column."""
+
+    def each(convert):
+        arrays = [convert(raw) for raw in _chunks(parts)]
+        return np.concatenate(arrays) if arrays else convert(np.array([], "S1"))
+
+    if dtype is not None and np.dtype(dtype).kind in "UST":
+        return each(_decode)
+    if dtype is not None:
+        dtype = np.dtype(dtype)
+        if dtype.kind == "f":
+            return each(lambda raw: np.where(raw == b"", b"nan", raw).astype(dtype))
+        return each(lambda raw: raw.astype(dtype))
+    try:
+        return each(_int)
+    except ValueError:
+        pass
+    try:
+        return each(lambda raw: np.where(raw == b"", b"nan", raw).astype(np.float64))
+    except ValueError:
+        return each(_decode)
+
+
+class MappedCSV:
+    """A memory-mapped CSV file read one column at a time."""
+
+    def __init__(self, path, delimiter=","):
+        self.path = path
+        self.delimiter = delimiter
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        header_end = self._map.find(b"\n")
+        if header_end == -1:
+            header_end = len(self._map)
+        header = bytes(self._map[:header_end]).decode("utf-8-sig").rstrip("\r")
+        self.names = next(csv.reader([header], delimiter=delimiter)) if header else []
+        self._body = min(header_end + 1, len(self._map))
+        self._length = None
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _end(self):
+        end = len(self._map)
+        while end > self._body and self._map[end - 1] in (_NEWLINE, _CR):
+            end -= 1
+        return end
+
+    def _blocks(self):
+        """(start, end) byte ranges of whole records, about BLOCK_BYTES each.
+
+        A block only ends at a newline outside quotes (an even number of
+        quote characters since the block start), so quoted fields never
+        straddle two blocks.
+        """
+        buf = np.frombuffer(self._map, dtype=np.uint8)
+        start = self._body
+        end = self._end()
+        while start < end:
+            stop = min(start + BLOCK_BYTES, end)
+            quotes = int(np.count_nonzero(buf[start:stop] == _QUOTE))
+            while stop < end:
+                newline = self._map.find(b"\n", stop)
+                if newline == -1 or newline > end:
+                    stop = end
+                    break
+                quotes += int(np.count_nonzero(buf[stop:newline] == _QUOTE))
+                stop = newline
+                if quotes % 2 == 0:
+                    break
+                stop += 1
+            yield start, stop
+            start = stop + 1
+
+    def _separators(self, block):
+        """Offsets of the delimiters and newlines that end fields in `block`."""
+        separator = (block == ord(self.delimiter)) | (block == _NEWLINE)
+        quote = block == _QUOTE
+        if quote.any():
+            # Inside quotes after an odd number of quote characters; an
+            # escaped "" toggles twice and leaves the state unchanged
+            separator &= (np.cumsum(quote) & 1) == 0
+        return np.flatnonzero(separator)
+
+    def _field_bytes(self, indices):
+        """Field bytes of the columns at `indices`, one (data, offsets) pair
+        per column and block, where field i is data[offsets[i]:offsets[i + 1]].
+        Several columns share one scan of the file."""
+        buf = np.frombuffer(self._map, dtype=np.uint8)
+        width = len(self.names)
+        for start, stop in self._blocks():
+            block = buf[start:stop]
+            seps = np.append(self._separators(block), len(block))
+            if len(seps) % width:
+                raise ValueError(f"{self.path}: rows do not all have {width} fields")
+            ends = seps.reshape(-1, width)
+            starts = np.empty_like(ends)
+            starts[0, 0] = 0
+            starts[1:, 0] = ends[:-1, -1] + 1
+            starts[:, 1:] = ends[:, :-1] + 1
+            fields = []
+            for index in indices:
+                s = starts[:, index]
+                e = ends[:, index]
+                if index == width - 1:
+                    # Drop the \r of CRLF line endings
+                    e = e - ((e > s) & (block[np.maximum(e - 1, 0)] == _CR))
+                # Quoted fields: drop the enclosing quotes
+                quoted = (e - s >= 2) & (block[np.minimum(s, len(block) - 1)] == _QUOTE)
+                s = s + quoted
+                e = e - quoted
+                # Gather the field bytes: a running sum of +1 at each field
+                # start and -1 at its end marks the bytes inside fields
+                inside = np.zeros(len(block) + 1, np.int8)
+                inside[s] += 1
+                inside[e] -= 1
+                np.cumsum(inside, out=inside)
+                data = block[inside[:-1].view(bool)]
+                offsets = np.concatenate(([0], np.cumsum(e - s)))
+                if quoted.any():
+                    # Inside quotes, quote characters come in "" pairs: keep
+                    # the first of each
+                    quotes = np.flatnonzero(data == _QUOTE)
+                    field = np.searchsorted(offsets, quotes, "right") - 1
+                    quotes, field = quotes[quoted[field]], field[quoted[field]]
+                    rank = np.arange(len(quotes)) - np.searchsorted(quotes, offsets[field])
+                    drop = quotes[rank % 2 == 1]
+                    if len(drop):
+                        keep = np.ones(len(data), dtype=bool)
+                        keep[drop] = False
+                        data = data[keep]
+                        offsets = offsets - np.searchsorted(drop, offsets)
+                fields.append((data, offsets))
+            yield fields
+
+    def columns(self, names, dtypes=None):
+        """{name: typed NumPy array} for `names`, read in one pass."""
+        dtypes = dtypes or {}
+        indices = [self.names.index(name) for name in names]
+        blocks = list(self._field_bytes(indices))
+        parts = list(zip(*blocks)) if blocks else [()] * len(indices)
+        arrays = {name: _convert(part, dtypes.get(name)) for name, part in zip(names, parts)}
+        if arrays:
+            self._length = len(next(iter(arrays.values())))
+        return arrays
+
+    def column(self, name, dtype=None):
+        """Column `name` as a typed NumPy array."""
+        return self.columns([name], {name: dtype})[name]
+
+    def __len__(self):
+        if self._length is None:
+            buf = np.frombuffer(self._map, dtype=np.uint8)
+            width = max(len(self.names), 1)
+            self._length = sum(
+                (len(self._separators(buf[start:stop])) + 1) // width
+                for start, stop in self._blocks()
+            )
+        return self._length
+
+
+class ParquetColumns:
+    """A Parquet file read one column at a time through pyarrow."""
+
+    def __init__(self, path):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise ImportError("reading .parquet exports needs pyarrow (pip install pyarrow)") from exc
+        self.path = path
+        self._file = pq.ParquetFile(path, memory_map=True)
+        self.names = list(self._file.schema_arrow.names)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def columns(self, names, dtypes=None):
+        """{name: NumPy array} for `names`."""
+        dtypes = dtypes or {}
+        table = self._file.read(columns=list(names))
+        arrays = {}
+        for name in names:
+            array = table.column(name).to_numpy(zero_copy_only=False)
+            if array.dtype == object:
+                array = array.astype(str)
+            dtype = dtypes.get(name)
+            arrays[name] = array.astype(dtype) if dtype is not None else array
+        return arrays
+
+    def column(self, name, dtype=None):
+        return self.columns([name], {name: dtype})[name]
+
+    def __len__(self):
+        return self._file.metadata.num_rows
+
+
+# =============================================================================
+# TABLE
+# =============================================================================
+
+class ColumnTable:
+    """Named columns loaded on first use, optionally viewed through an index."""
+
+    def __init__(self, source, index=None, cache=None, dtypes=None):
+        self.source = source
+        self.index = index
+        self._cache = {} if cache is None else cache
+        self._dtypes = dtypes or {}
+
+    @property
+    def columns(self):
+        return list(self.source.names)
+
+    def close(self):
+        """Close the underlying file (and its memory map)."""
+        self.source.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self.source) if self.index is None else len(self.index)
+
+    def __contains__(self, name):
+        return name in self.source.names
+
+    def _full(self, name):
+        array = self._cache.get(name)
+        if array is None:
+            array = self._cache[name] = self.source.column(name, self._dtypes.get(name))
+        return array
+
+    def load(self, *names):
+        """Read the columns in `names` that are not loaded yet in one pass."""
+        missing = [name for name in names if name not in self._cache]
+        if missing:
+            self._cache.update(self.source.columns(missing, self._dtypes))
+        return self
+
+    def __getitem__(self, name):
+        array = self._full(name)
+        return array if self.index is None else array[self.index]
+
+    def _view(self, index):
+        if self.index is not None:
+            index = self.index[index]
+        return ColumnTable(self.source, index, self._cache, self._dtypes)
+
+    def where(self, mask):
+        """Rows where the boolean array `mask` (aligned with this view) is true."""
+        return self._view(np.flatnonzero(mask))
+
+    def sort_by(self, *names, descending=False):
+        """Rows ordered by `names` (first name most significant), stable."""
+        keys = [self[name] for name in reversed(names)]
+        order = np.lexsort(keys)
+        return self._view(order[::-1] if descending else order)
+
+    def head(self, n):
+        return self._view(np.arange(min(n, len(self))))
+
+    def group_index(self, name):
+        """(order, starts, stops) grouping the rows of this view by `name`.
+
+        Rows order[starts[g]:stops[g]] form group g; groups are numbered in
+        order of first appearance and rows keep their order within a group.
+        """
+        keys = self[name]
+        if len(keys) == 0:
+            empty = np.array([], dtype=np.intp)
+            return empty, empty, empty
+        order = np.argsort(keys, kind="stable")
+        ordered = keys[order]
+        starts = np.flatnonzero(np.concatenate(([True], ordered[1:] != ordered[:-1])))
+        stops = np.append(starts[1:], len(keys))
+        groups = np.argsort(order[starts], kind="stable")
+        return order, starts[groups], stops[groups]
+
+    def group_by(self, name):
+        """Yield (key, view) per distinct value of `name`, in order of first
+        appearance; rows keep their order within each group."""
+        keys = self[name]
+        order, starts, stops = self.group_index(name)
+        for start, stop in zip(starts.tolist(), stops.tolist()):
+            yield keys[order[start:start + 1]].tolist()[0], self._view(order[start:stop])
+
+    def rows(self, names=None):
+        """Yield row dicts of `names`, converting ROW_CHUNK rows at a time."""
+        names = list(names or self.columns)
+        for start in range(0, len(self), ROW_CHUNK):
+            chunk = slice(start, start + ROW_CHUNK)
+            values = [self[name][chunk].tolist() for name in names]
+            for row in zip(*values):
+                yield dict(zip(names, row))
+
+
+def open_columns(path, dtypes=None, delimiter=","):
+    """A ColumnTable over a CSV or Parquet export; close it when done, or
+    use it as a context manager.
+
+    `dtypes` maps column names to NumPy dtypes; other columns are inferred
+    (int64, then float64, then str).
+    """
+    if path.endswith(".parquet"):
+        source = ParquetColumns(path)
+    else:
+        source = MappedCSV(path, delimiter)
+    return ColumnTable(source, dtypes=dtypes)
+
+
+def table_rows(table, columns, formats=None, headers=None):
+    """Header plus formatted cell text for a slide table bound to `columns`."""
+    formats = formats or {}
+    rows = [list(headers or columns)]
+    values = [table[name].tolist() for name in columns]
+    for row in zip(*values):
+        rows.append([
+            formats.get(name, "{}").format(value) for name, value in zip(columns, row)
+        ])
+    return rows
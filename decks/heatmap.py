@@ -0,0 +1,272 @@
+"""
+Color-scaled heatmap grids from numeric matrices.
+
+Filling table cells one at a time through python-pptx (as
+`add_pricing_table` does) costs several proxy calls and XML edits per
+cell, which is seconds for a 100 x 52 grid of views per category per week.
+`add_heatmap` takes the whole matrix as a NumPy array: bins and colors for
+every cell (fill, and a readable text color) are computed in one
+vectorized step, then the grid is written as one XML string and parsed
+once.
+
+    add_heatmap(slide, views, Inches(0.5), Inches(1.3), Inches(9), Inches(5),
+                palette="green", row_labels=categories,
+                column_labels=[f"W{w}" for w in weeks], totals=True)
+
+- `mode="table"` (default) writes one table, which stays a single shape
+  however many cells there are; `mode="shapes"` writes one rectangle per
+  cell through decks.ir, for grids that must be restyled shape by shape;
+- `palette` is a name from PALETTES or a sequence of colors (low to high),
+  interpolated linearly; `bins=N` snaps the scale to N steps, as
+  conditional formatting does;
+- `totals=True` adds a row and a column of totals; NaN cells are drawn in
+  the missing color, unlabelled, and left out of the scale and totals;
+- values are printed in the cells (`fmt`) when the cells are big enough.
+
+With 100 rows or more, only the colors fit a slide; the values and labels
+belong on a companion table or in the notes.
+"""
+
+import numpy as np
+
+from decks.ir import _NSDECLS, SlideIR, _escape, _hex
+
+HEATMAP_MODES = ("table", "shapes")
+
+# Low-to-high color stops on the decks' dark background
+PALETTES = {
+    "green": ("262626", "22C55E"),
+    "blue": ("262626", "3B82F6"),
+    "purple": ("262626", "8B5CF6"),
+    "amber": ("262626", "F59E0B"),
+    "diverging": ("EF4444", "262626", "22C55E"),
+}
+MISSING_COLOR = "121212"
+HEADER_FILL = "121212"
+HEADER_TEXT = "9C9C9C"
+TOTAL_FILL = "262626"
+TOTAL_TEXT = "FFFFFF"
+# Cell text is left out where it would be smaller than this (points)
+MIN_LABEL_SIZE = 6
+MAX_LABEL_SIZE = 11
+
+_FRAME = (
+    '<p:graphicFrame %s><p:nvGraphicFramePr><p:cNvPr id="%d" name="%s"/>'
+    '<p:cNvGraphicFramePr><a:graphicFrameLocks noGrp="1"/></p:cNvGraphicFramePr><p:nvPr/>'
+    '</p:nvGraphicFramePr><p:xfrm><a:off x="%d" y="%d"/><a:ext cx="%d" cy="%d"/></p:xfrm>'
+    '<a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/table">'
+    '<a:tbl><a:tblPr/><a:tblGrid>%s</a:tblGrid>%s</a:tbl></a:graphicData></a:graphic>'
+    '</p:graphicFrame>'
+)
+_GRID_COL = '<a:gridCol w="%d"/>'
+_CELL = (
+    '<a:tc><a:txBody><a:bodyPr/><a:p><a:pPr algn="ctr"/>%s</a:p></a:txBody>'
+    '<a:tcPr marL="0" marR="0" marT="0" marB="0" anchor="ctr">'
+    '<a:solidFill><a:srgbClr val="%s"/></a:solidFill></a:tcPr></a:tc>'
+)
+_LABEL = (
+    '<a:r><a:rPr lang="en-US" sz="%d"%s dirty="0"><a:solidFill><a:srgbClr val="%s"/>'
+    '</a:solidFill></a:rPr><a:t>%s</a:t></a:r>'
+)
+# Empty cells still need a tiny paragraph mark, or rows grow to fit 18pt
+_EMPTY = '<a:endParaRPr lang="en-US" sz="100" dirty="0"/>'
+
+
+# =============================================================================
+# COLOR SCALE
+# =============================================================================
+
+def _stops(palette):
+    colors = PALETTES[palette] if isinstance(palette, str) else palette
+    rgb = [int(_hex(color), 16) for color in colors]
+    return np.array([[(c >> 16) & 255, (c >> 8) & 255, c & 255] for c in rgb], dtype=float)
+
+
+def heat_colors(values, palette="green", bins=None, vmin=None, vmax=None):
+    """(fill, text) arrays of "RRGGBB" strings, shaped like `values`.
+
+    Values are scaled between `vmin` and `vmax` (default: the finite
+    minimum and maximum), optionally snapped to `bins` steps, and mapped
+    onto the palette. Text is dark on light fills and white on dark ones.
+    """
+    values = np.asarray(values, dtype=float)
+    finite = np.isfinite(values)
+    if finite.any():
+        low = np.min(values[finite]) if vmin is None else vmin
+        high = np.max(values[finite]) if vmax is None else vmax
+    else:
+        low = high = 0.0
+    span = high - low
+    scaled = np.where(finite, values - low, 0.0) / span if span > 0 else np.zeros(values.shape)
+    scaled = np.clip(scaled, 0.0, 1.0)
+    if bins:
+        scaled = np.minimum(np.floor(scaled * bins), bins - 1) / max(bins - 1, 1)
+
+    stops = _stops(palette)
+    positions = np.linspace(0.0, 1.0, len(stops))
+    rgb = np.stack(
+        [np.interp(scaled, positions, stops[:, channel]) for channel in range(3)], axis=-1
+    ).round().astype(np.uint32)
+    packed = (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
+    fill = np.char.mod("%06X", packed)
+    luminance = rgb @ np.array([0.2126, 0.7152, 0.0722]) / 255
+    text = np.where(luminance > 0.55, "121212", "FFFFFF")
+    fill[~finite] = MISSING_COLOR
+    return fill, text
+
+
+# =============================================================================
+# LAYOUT
+# =============================================================================
+
+def _format(values, fmt):
+    """Rows of `fmt`-formatted labels of the 2-D array `values` ("" for NaN)."""
+    format_value = fmt.format if isinstance(fmt, str) else fmt
+    return [
+        ["" if value != value else format_value(value) for value in row]
+        for row in values.tolist()
+    ]
+
+
+def _split(total, count):
+    """`count` integer sizes summing exactly to `total`."""
+    edges = np.linspace(0, total, count + 1).round().astype(np.int64)
+    return np.diff(edges).tolist()
+
+
+def add_heatmap(slide, matrix, x, y, width, height, palette="green", mode="table",
+                row_labels=None, column_labels=None, totals=False, bins=None,
+                vmin=None, vmax=None, labels=True, fmt="{:,.0f}", name="Heatmap"):
+    """Draw `matrix` (rows x columns) as a color-scaled grid in the box.
+
+    Values (with `labels`) and row, column and total labels are printed at
+    the largest size that fits their cells, and left out where that would be
+    below MIN_LABEL_SIZE, so table rows never grow past the box. Returns the
+    new elements (the table's graphic frame, or the cell shapes).
+    """
+    if mode not in HEATMAP_MODES:
+        raise ValueError(f"heatmap mode must be one of {', '.join(HEATMAP_MODES)}, not {mode!r}")
+    values = np.asarray(matrix, dtype=float)
+    if values.ndim != 2 or not values.size:
+        raise ValueError(f"heatmap needs a non-empty 2-D matrix, got shape {values.shape}")
+    n_rows, n_columns = values.shape
+    if row_labels is not None and len(row_labels) != n_rows:
+        raise ValueError(f"{len(row_labels)} row labels for {n_rows} rows")
+    if column_labels is not None and len(column_labels) != n_columns:
+        raise ValueError(f"{len(column_labels)} column labels for {n_columns} columns")
+
+    fill, text = heat_colors(values, palette, bins, vmin, vmax)
+
+    # Label and total bands take a capped share of the box
+    label_width = int(min(width * 0.15, 1097280)) if row_labels is not None else 0
+    label_height = int(min(height * 0.08, 274320)) if column_labels is not None else 0
+    total_width = int(min(width * 0.1, 822960)) if totals else 0
+    total_height = int(min(height * 0.06, 274320)) if totals else 0
+    widths = _split(width - label_width - total_width, n_columns)
+    heights = _split(height - label_height - total_height, n_rows)
+
+    # Text insets of the cells: none in tables, python-pptx's defaults in shapes
+    inset_x, inset_y = (0, 0) if mode == "table" else (182880, 91440)
+
+    def band(texts, cell_width, cell_height, fill_color, text_color):
+        """Cells of `texts`, sized to fit, or blank when they cannot."""
+        texts = [str(t) for t in texts]
+        size = _fit_size(texts, cell_width - inset_x, cell_height - inset_y)
+        if size is None:
+            return [("", fill_color, text_color, 0, True)] * len(texts)
+        return [(t, fill_color, text_color, size, True) for t in texts]
+
+    min_width, min_height = min(widths), min(heights)
+    cell_labels = _format(values, fmt) if labels else None
+    size = None
+    if cell_labels:
+        size = _fit_size([t for row in cell_labels for t in row],
+                         min_width - inset_x, min_height - inset_y)
+    if size is None:
+        cell_labels = [[""] * n_columns] * n_rows
+
+    # Rows of (text, fill, text color, size, bold) cells, bands included
+    rows = []
+    if label_height:
+        row = [("", HEADER_FILL, HEADER_TEXT, 0, True)] if label_width else []
+        row += band(column_labels, min_width, label_height, HEADER_FILL, HEADER_TEXT)
+        if totals:
+            row += band(["Total"], total_width, label_height, HEADER_FILL, HEADER_TEXT)
+        rows.append(row)
+    side = band(row_labels, label_width, min_height, HEADER_FILL, HEADER_TEXT) if label_width else None
+    if totals:
+        row_totals = band([t for t, in _format(np.nansum(values, axis=1)[:, np.newaxis], fmt)],
+                          total_width, min_height, TOTAL_FILL, TOTAL_TEXT)
+    for i, (row_text, row_fill, row_color) in enumerate(
+        zip(cell_labels, fill.tolist(), text.tolist())
+    ):
+        row = [side[i]] if side else []
+        row += [(t, f, c, size, False) for t, f, c in zip(row_text, row_fill, row_color)]
+        rows.append(row + [row_totals[i]] if totals else row)
+    if totals:
+        row = band(["Total"], label_width, total_height, HEADER_FILL, HEADER_TEXT) if label_width else []
+        row += band(_format(np.nansum(values, axis=0)[np.newaxis], fmt)[0],
+                    min_width, total_height, TOTAL_FILL, TOTAL_TEXT)
+        row += band(_format(np.array([[np.nansum(values)]]), fmt)[0],
+                    total_width, total_height, TOTAL_FILL, TOTAL_TEXT)
+        rows.append(row)
+
+    widths = ([label_width] if label_width else []) + widths + ([total_width] if totals else [])
+    heights = ([label_height] if label_height else []) + heights + ([total_height] if totals else [])
+    if mode == "shapes":
+        return _render_shapes(slide, rows, widths, heights, x, y)
+    return _render_table(slide, rows, widths, heights, x, y, name)
+
+
+def _fit_size(texts, width, height):
+    """Largest font size (pt, at most MAX_LABEL_SIZE) at which every one of
+    `texts` fits on one line of a width x height EMU cell, or None when
+    that is below MIN_LABEL_SIZE."""
+    longest = max((len(t) for t in texts), default=0)
+    if not longest:
+        return None
+    # ~0.6 em per character; a line is ~1.2 em tall
+    size = min(MAX_LABEL_SIZE, height / 12700 / 1.25, width / 12700 / (0.6 * longest))
+    return int(size) if size >= MIN_LABEL_SIZE else None
+
+
+def _render_table(slide, rows, widths, heights, x, y, name):
+    from pptx.oxml import parse_xml
+
+    sp_tree = slide.shapes._spTree
+    shape_id = max((int(i) for i in sp_tree.xpath(".//p:cNvPr/@id")), default=1) + 1
+    body = []
+    for row, row_height in zip(rows, heights):
+        body.append('<a:tr h="%d">' % row_height)
+        for label, cell_fill, cell_text, size, bold in row:
+            content = (
+                _LABEL % (size * 100, ' b="1"' if bold else "", cell_text, _escape(label))
+                if label else _EMPTY
+            )
+            body.append(_CELL % (content, cell_fill))
+        body.append("</a:tr>")
+    frame = parse_xml(_FRAME % (
+        _NSDECLS, shape_id, _escape(name), x, y, sum(widths), sum(heights),
+        "".join(_GRID_COL % w for w in widths), "".join(body),
+    ))
+    # Insert before any trailing p:extLst so the tree stays schema-valid
+    ext_lst = sp_tree.find(
+        "{http://schemas.openxmlformats.org/presentationml/2006/main}extLst"
+    )
+    if ext_lst is None:
+        sp_tree.append(frame)
+    else:
+        ext_lst.addprevious(frame)
+    return [frame]
+
+
+def _render_shapes(slide, rows, widths, heights, x, y):
+    scene = SlideIR()
+    lefts = (np.cumsum([0] + widths[:-1]) + x).tolist()
+    tops = (np.cumsum([0] + heights[:-1]) + y).tolist()
+    for row, top, row_height in zip(rows, tops, heights):
+        for (label, cell_fill, cell_text, size, bold), left, column_width in zip(row, lefts, widths):
+            record = scene.rectangle(left, top, column_width, row_height, cell_fill)
+            if label:
+                record.set_text(label, font_size=size, font_color=cell_text, bold=bold)
+    return scene.render(slide)
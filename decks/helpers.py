@@ -0,0 +1,218 @@
+"""
+Cursor brand palette and slide helpers shared by the deck generators.
+
+Importing this module loads python-pptx; keep it out of code paths that
+only need to parse arguments or validate specs (see decks.cli).
+"""
+
+from pptx.dml.color import RGBColor
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.enum.text import MSO_ANCHOR, PP_ALIGN
+from pptx.oxml.ns import qn
+from pptx.util import Inches, Pt
+
+from decks.links import autolink_text_frame, registry_for, set_run_hyperlink
+
+# =============================================================================
+# CURSOR BRAND COLOR PALETTE
+# =============================================================================
+CURSOR_BLACK = RGBColor(18, 18, 18)
+CURSOR_DARK_GRAY = RGBColor(38, 38, 38)
+CURSOR_MID_GRAY = RGBColor(82, 82, 82)
+CURSOR_LIGHT_GRAY = RGBColor(156, 156, 156)
+CURSOR_OFF_WHITE = RGBColor(229, 229, 229)
+CURSOR_WHITE = RGBColor(255, 255, 255)
+
+CURSOR_PURPLE = RGBColor(139, 92, 246)
+CURSOR_BLUE = RGBColor(59, 130, 246)
+CURSOR_GREEN = RGBColor(34, 197, 94)
+CURSOR_AMBER = RGBColor(245, 158, 11)
+CURSOR_RED = RGBColor(239, 68, 68)
+
+GRADIENT_START = RGBColor(45, 45, 45)
+GRADIENT_END = RGBColor(25, 25, 25)
+
+# =============================================================================
+# HELPER FUNCTIONS
+# =============================================================================
+
+def add_rounded_rectangle(slide, left, top, width, height, fill_color, 
+                          border_color=None, border_width=0, corner_radius=0.1):
+    """Add a rounded rectangle shape."""
+    shape = slide.shapes.add_shape(
+        MSO_SHAPE.ROUNDED_RECTANGLE, left, top, width, height
+    )
+    shape.fill.solid()
+    shape.fill.fore_color.rgb = fill_color
+    
+    if border_color:
+        shape.line.color.rgb = border_color
+        shape.line.width = Pt(border_width)
+    else:
+        shape.line.fill.background()
+    
+    return shape
+
+
+def add_circle(slide, left, top, size, fill_color, border_color=None):
+    """Add a circle shape."""
+    shape = slide.shapes.add_shape(
+        MSO_SHAPE.OVAL, left, top, size, size
+    )
+    shape.fill.solid()
+    shape.fill.fore_color.rgb = fill_color
+    
+    if border_color:
+        shape.line.color.rgb = border_color
+        shape.line.width = Pt(2)
+    else:
+        shape.line.fill.background()
+    
+    return shape
+
+
+def add_arrow(slide, left, top, width, height, fill_color):
+    """Add an arrow shape."""
+    shape = slide.shapes.add_shape(
+        MSO_SHAPE.RIGHT_ARROW, left, top, width, height
+    )
+    shape.fill.solid()
+    shape.fill.fore_color.rgb = fill_color
+    shape.line.fill.background()
+    return shape
+
+
+def add_text_to_shape(shape, text, font_size=14, font_color=CURSOR_WHITE, 
+                      bold=False, alignment=PP_ALIGN.CENTER):
+    """Add centered text to a shape."""
+    tf = shape.text_frame
+    tf.clear()
+    tf.word_wrap = True
+    p = tf.paragraphs[0]
+    p.text = text
+    p.font.size = Pt(font_size)
+    p.font.color.rgb = font_color
+    p.font.bold = bold
+    p.alignment = alignment
+    tf.vertical_anchor = MSO_ANCHOR.MIDDLE
+
+
+def add_textbox(slide, left, top, width, height, text, font_size=14, 
+                font_color=CURSOR_OFF_WHITE, bold=False, alignment=PP_ALIGN.LEFT,
+                vertical_anchor=MSO_ANCHOR.TOP, fit=False):
+    """Add a text box with specified formatting.
+
+    With fit=True, font_size is a maximum: the text is shrunk to the largest
+    size that fits the box (see decks.text_fit.fit_font_size).
+    """
+    if fit:
+        from decks.text_fit import fit_font_size
+
+        font_size = fit_font_size(text, width, height, font_size, bold=bold)
+    textbox = slide.shapes.add_textbox(left, top, width, height)
+    tf = textbox.text_frame
+    tf.word_wrap = True
+    tf.vertical_anchor = vertical_anchor
+    p = tf.paragraphs[0]
+    p.text = text
+    p.font.size = Pt(font_size)
+    p.font.color.rgb = font_color
+    p.font.bold = bold
+    p.alignment = alignment
+    return textbox
+
+
+def add_hyperlink_textbox(slide, left, top, width, height, text, url, tooltip,
+                          font_size=14, font_color=CURSOR_BLUE, bold=False, 
+                          alignment=PP_ALIGN.LEFT, underline=True):
+    """Add a text box with a clickable hyperlink and hover tooltip (screentip)."""
+    textbox = slide.shapes.add_textbox(left, top, width, height)
+    tf = textbox.text_frame
+    tf.word_wrap = True
+    p = tf.paragraphs[0]
+    
+    run = p.add_run()
+    run.text = text
+    run.font.size = Pt(font_size)
+    run.font.color.rgb = font_color
+    run.font.bold = bold
+    run.font.underline = underline
+    p.alignment = alignment
+    
+    # Add hyperlink with screentip (tooltip on hover)
+    rid = registry_for(slide).rid(slide.part, url)
+    set_run_hyperlink(run._r, rid, tooltip)
+    
+    return textbox
+
+
+def add_clickable_shape(slide, shape, url, tooltip):
+    """Make a shape clickable with a hyperlink and hover tooltip (screentip)."""
+    rid = registry_for(slide).rid(slide.part, url)
+    cNvPr = shape._element._nvXxPr.cNvPr
+    hlinkClick = cNvPr.get_or_add_hlinkClick()
+    hlinkClick.set(qn('r:id'), rid)
+    hlinkClick.set('tooltip', tooltip)
+    return shape
+
+
+def add_speaker_notes(slide, notes_text):
+    """Add speaker notes to a slide."""
+    notes_slide = slide.notes_slide
+    text_frame = notes_slide.notes_text_frame
+    text_frame.text = notes_text
+
+
+def add_source_footer(slide, source_text, slide_width, slide_height):
+    """Add a small source footer at the bottom of the slide; URLs become links."""
+    footer = add_textbox(
+        slide, 
+        Inches(0.3), 
+        slide_height - Inches(0.35),
+        slide_width - Inches(0.6),
+        Inches(0.3),
+        source_text,
+        font_size=7,
+        font_color=CURSOR_MID_GRAY,
+        alignment=PP_ALIGN.LEFT
+    )
+    # Every cited source is clickable
+    autolink_text_frame(footer.text_frame, slide.part)
+    return footer
+
+
+def add_slide_number(slide, number, slide_width, slide_height):
+    """Add slide number to bottom right."""
+    box = add_textbox(
+        slide,
+        slide_width - Inches(0.6),
+        slide_height - Inches(0.4),
+        Inches(0.4),
+        Inches(0.3),
+        str(number),
+        font_size=10,
+        font_color=CURSOR_MID_GRAY,
+        alignment=PP_ALIGN.RIGHT
+    )
+    # Named like the layout's slide number so decks.aspect keeps it in the corner
+    box.name = "Slide Number"
+    return box
+
+
+def set_slide_background(slide, color):
+    """Set solid background color for a slide."""
+    background = slide.background
+    fill = background.fill
+    fill.solid()
+    fill.fore_color.rgb = color
+
+
+def add_horizontal_line(slide, left, top, width, color, thickness=1):
+    """Add a horizontal line/divider."""
+    line = slide.shapes.add_shape(
+        MSO_SHAPE.RECTANGLE, left, top, width, Pt(thickness)
+    )
+    line.fill.solid()
+    line.fill.fore_color.rgb = color
+    line.line.fill.background()
+    return line
@@ -0,0 +1,347 @@
+"""
+Compact slide scene-graph IR, serialized to p:spTree XML in one pass.
+
+The helpers in decks.helpers go through python-pptx shape proxies and set
+XML attributes one at a time, which dominates build time on slides with
+thousands of shapes (product grids, heatmaps). Here a slide is a list of
+small __slots__ records; `render` turns the whole list into XML with
+precomputed string templates, parses it once and appends the result to
+the slide's shape tree.
+
+    scene = SlideIR()
+    card = scene.rounded_rectangle(x, y, w, h, CURSOR_DARK_GRAY,
+                                   border_color=CURSOR_PURPLE, border_width=2)
+    card.set_text("Pro", font_size=12, bold=True)
+    scene.textbox(x, y + h, w, Inches(0.3), "$20/mo", font_size=10)
+    scene.rich_textbox(x, y, w, h, ["- **Pro**: {green:usage credits}"], font_size=9)
+    scene.render(slide)
+
+Colors are python-pptx RGBColor values (or "RRGGBB" strings); positions
+and sizes are EMU integers such as Inches(1). Rich text boxes take the
+inline markup of decks.markup.
+"""
+
+from pptx.oxml import parse_xml
+
+from decks.links import registry_for
+
+_NSDECLS = (
+    'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+    'xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+)
+
+_ALIGN = {"left": "l", "center": "ctr", "right": "r", "justify": "just"}
+_ANCHOR = {"top": "t", "middle": "ctr", "bottom": "b"}
+
+# Shape kind -> (preset geometry, display name)
+_GEOMETRY = {
+    "rect": ("rect", "Rectangle"),
+    "roundRect": ("roundRect", "Rounded Rectangle"),
+    "ellipse": ("ellipse", "Oval"),
+    "rightArrow": ("rightArrow", "Right Arrow"),
+    "textbox": ("rect", "TextBox"),
+}
+
+# Precomputed templates; filled with %-formatting in `_serialize_shape`
+_SP_OPEN = '<p:sp><p:nvSpPr><p:cNvPr id="%d" name="%s">%s</p:cNvPr>%s<p:nvPr/></p:nvSpPr>'
+_SP_PR = (
+    '<p:spPr><a:xfrm%s><a:off x="%d" y="%d"/><a:ext cx="%d" cy="%d"/></a:xfrm>'
+    '<a:prstGeom prst="%s"><a:avLst/></a:prstGeom>%s%s</p:spPr>'
+)
+_SOLID_FILL = '<a:solidFill><a:srgbClr val="%s"/></a:solidFill>'
+_NO_FILL = "<a:noFill/>"
+_LINE = '<a:ln w="%d"><a:solidFill><a:srgbClr val="%s"/></a:solidFill></a:ln>'
+_NO_LINE = "<a:ln><a:noFill/></a:ln>"
+_HLINK = '<a:hlinkClick r:id="%s"%s/>'
+_BODY = '<p:txBody><a:bodyPr wrap="square" rtlCol="0" anchor="%s">%s</a:bodyPr><a:lstStyle/>'
+_RPR = '<a:rPr lang="en-US" sz="%d"%s dirty="0">' + _SOLID_FILL + '%s</a:rPr>'
+_END_RPR = '<a:endParaRPr lang="en-US" sz="%d"%s dirty="0">' + _SOLID_FILL + '</a:endParaRPr>'
+_RUN = "<a:r>%s<a:t>%s</a:t></a:r>"
+_BULLET = '<a:buClr><a:srgbClr val="%s"/></a:buClr><a:buChar char="%s"/>'
+# Hanging indent of bulleted paragraphs, and indent per nesting level
+BULLET_INDENT = 182880
+
+# Text escaping: XML specials plus control characters XML 1.0 forbids
+_ESCAPE = {ord("&"): "&amp;", ord("<"): "&lt;", ord(">"): "&gt;", ord('"'): "&quot;"}
+_ESCAPE.update({c: None for c in range(32) if c not in (9, 10, 13)})
+_ESCAPE = str.maketrans(_ESCAPE)
+
+
+def _escape(text):
+    return text.translate(_ESCAPE)
+
+
+def _hex(color):
+    return color if isinstance(color, str) else str(color)
+
+
+class TextRun:
+    """One run of text with its character formatting."""
+
+    __slots__ = ("text", "size", "color", "bold", "italic", "link")
+
+    def __init__(self, text, size, color, bold=False, italic=False, link=None):
+        self.text = text
+        self.size = size
+        self.color = color
+        self.bold = bold
+        self.italic = italic
+        self.link = link
+
+
+class ShapeRecord:
+    """Geometry, fill, line, text and link of one shape."""
+
+    __slots__ = (
+        "kind", "x", "y", "cx", "cy", "rotation", "fill", "line", "line_width",
+        "paragraphs", "levels", "bullet", "space_after", "align", "anchor",
+        "link", "name",
+    )
+
+    def __init__(self, kind, x, y, cx, cy, fill=None, line=None, line_width=0):
+        self.kind = kind
+        self.x = int(x)
+        self.y = int(y)
+        self.cx = int(cx)
+        self.cy = int(cy)
+        self.rotation = 0
+        self.fill = fill
+        self.line = line
+        self.line_width = int(line_width)
+        # List of paragraphs; each paragraph is a list of TextRun
+        self.paragraphs = None
+        # (level, bulleted) per paragraph, or None when all are plain level 0
+        self.levels = None
+        # (char, color) of bulleted paragraphs; None uses the text color
+        self.bullet = None
+        self.space_after = 0
+        self.align = "center"
+        self.anchor = "middle"
+        self.link = None
+        self.name = None
+
+    def set_text(self, text, font_size=14, font_color="FFFFFF", bold=False,
+                 italic=False, alignment="center", anchor="middle"):
+        """Replace the shape's text with a single formatted paragraph."""
+        self.paragraphs = [[TextRun(text, font_size, font_color, bold, italic)]]
+        self.align = alignment
+        self.anchor = anchor
+        return self
+
+    def add_paragraph(self, runs, level=0, bulleted=False):
+        """Append a paragraph made of TextRun objects, optionally nested
+        `level` deep and bulleted."""
+        if self.paragraphs is None:
+            self.paragraphs = []
+        if (level or bulleted) and self.levels is None:
+            self.levels = [(0, False)] * len(self.paragraphs)
+        if self.levels is not None:
+            self.levels.append((level, bulleted))
+        self.paragraphs.append(list(runs))
+        return self
+
+    def set_link(self, url, tooltip=None):
+        """Make the whole shape a click target."""
+        self.link = (url, tooltip)
+        return self
+
+
+class SlideIR:
+    """An ordered list of shape records for one slide."""
+
+    __slots__ = ("shapes",)
+
+    def __init__(self):
+        self.shapes = []
+
+    def __len__(self):
+        return len(self.shapes)
+
+    def __iter__(self):
+        return iter(self.shapes)
+
+    def add(self, record):
+        self.shapes.append(record)
+        return record
+
+    # Helpers mirroring decks.helpers -------------------------------------
+
+    def rounded_rectangle(self, left, top, width, height, fill_color,
+                          border_color=None, border_width=0):
+        return self.add(ShapeRecord(
+            "roundRect", left, top, width, height,
+            fill_color, border_color, border_width * 12700 if border_color else 0,
+        ))
+
+    def rectangle(self, left, top, width, height, fill_color,
+                  border_color=None, border_width=0):
+        return self.add(ShapeRecord(
+            "rect", left, top, width, height,
+            fill_color, border_color, border_width * 12700 if border_color else 0,
+        ))
+
+    def circle(self, left, top, size, fill_color, border_color=None):
+        return self.add(ShapeRecord(
+            "ellipse", left, top, size, size,
+            fill_color, border_color, 2 * 12700 if border_color else 0,
+        ))
+
+    def arrow(self, left, top, width, height, fill_color):
+        return self.add(ShapeRecord("rightArrow", left, top, width, height, fill_color))
+
+    def horizontal_line(self, left, top, width, color, thickness=1):
+        return self.add(ShapeRecord("rect", left, top, width, thickness * 12700, color))
+
+    def textbox(self, left, top, width, height, text, font_size=14,
+                font_color="E5E5E5", bold=False, italic=False,
+                alignment="left", anchor="top"):
+        record = ShapeRecord("textbox", left, top, width, height)
+        record.set_text(text, font_size, font_color, bold, italic, alignment, anchor)
+        return self.add(record)
+
+    def rich_textbox(self, left, top, width, height, lines, font_size=14,
+                     font_color="E5E5E5", bold=False, alignment="left", anchor="top",
+                     bullet_color=None, space_after=0):
+        """One text box holding `lines` of decks.markup markup (a list, or a
+        string with one paragraph per line). Bulleted paragraphs get a "•"
+        in `bullet_color`; `space_after` is in points."""
+        from decks.markup import markup_runs, parse_markup
+
+        record = ShapeRecord("textbox", left, top, width, height)
+        record.align = alignment
+        record.anchor = anchor
+        record.space_after = space_after
+        if bullet_color is not None:
+            record.bullet = ("•", bullet_color)
+        if isinstance(lines, str):
+            lines = lines.split("\n")
+        for line in lines:
+            paragraph = parse_markup(line)
+            record.add_paragraph(
+                markup_runs(paragraph, font_size, font_color, bold),
+                paragraph.level, paragraph.bullet,
+            )
+        return self.add(record)
+
+    # Serialization --------------------------------------------------------
+
+    def to_xml(self, first_id=2, rids=None):
+        """Serialize every record to p:sp XML (a string, no wrapper element).
+
+        `rids` maps each hyperlink URL to its relationship id.
+        """
+        rids = rids or {}
+        return "".join(
+            _serialize_shape(record, first_id + i, rids)
+            for i, record in enumerate(self.shapes)
+        )
+
+    def links(self):
+        """Every distinct hyperlink URL used by the records, in order."""
+        seen = {}
+        for record in self.shapes:
+            if record.link:
+                seen.setdefault(record.link[0], None)
+            for paragraph in record.paragraphs or ():
+                for run in paragraph:
+                    if run.link:
+                        seen.setdefault(run.link[0], None)
+        return list(seen)
+
+    def render(self, slide):
+        """Append every record to `slide` in one parse; return the new elements."""
+        sp_tree = slide.shapes._spTree
+        first_id = max((int(i) for i in sp_tree.xpath(".//p:cNvPr/@id")), default=1) + 1
+        rids = registry_for(slide).rids(slide.part, self.links())
+        fragment = parse_xml(
+            f"<p:spTree {_NSDECLS}>{self.to_xml(first_id, rids)}</p:spTree>"
+        )
+        elements = list(fragment)
+        # Insert before any trailing p:extLst so the tree stays schema-valid
+        ext_lst = sp_tree.find(
+            "{http://schemas.openxmlformats.org/presentationml/2006/main}extLst"
+        )
+        for element in elements:
+            if ext_lst is None:
+                sp_tree.append(element)
+            else:
+                ext_lst.addprevious(element)
+        return elements
+
+
+def _hlink_xml(link, rids):
+    url, tooltip = link
+    tip = ' tooltip="%s"' % _escape(tooltip) if tooltip else ""
+    return _HLINK % (rids[url], tip)
+
+
+def _serialize_paragraph(runs, align, rids, level=0, bullet=None, space_after=0):
+    attrs = ' algn="%s"' % _ALIGN.get(align, align)
+    if level:
+        attrs += ' lvl="%d"' % level
+    children = '<a:spcAft><a:spcPts val="%d"/></a:spcAft>' % (space_after * 100) if space_after else ""
+    if bullet is not None:
+        attrs += ' marL="%d" indent="%d"' % ((level + 1) * BULLET_INDENT, -BULLET_INDENT)
+        children += _BULLET % (_hex(bullet[1]), _escape(bullet[0]))
+    elif level:
+        attrs += ' marL="%d"' % (level * BULLET_INDENT)
+    if children:
+        parts = ["<a:p><a:pPr%s>%s</a:pPr>" % (attrs, children)]
+    else:
+        parts = ["<a:p><a:pPr%s/>" % attrs]
+    for run in runs:
+        flags = (' b="1"' if run.bold else "") + (' i="1"' if run.italic else "")
+        hlink = _hlink_xml(run.link, rids) if run.link else ""
+        rpr = _RPR % (int(run.size * 100), flags, _hex(run.color), hlink)
+        lines = run.text.replace("\v", "\n").split("\n")
+        for j, line in enumerate(lines):
+            if j:
+                parts.append("<a:br>%s</a:br>" % rpr)
+            if line:
+                parts.append(_RUN % (rpr, _escape(line)))
+    if runs:
+        last = runs[-1]
+        flags = (' b="1"' if last.bold else "") + (' i="1"' if last.italic else "")
+        parts.append(_END_RPR % (int(last.size * 100), flags, _hex(last.color)))
+    parts.append("</a:p>")
+    return "".join(parts)
+
+
+def _serialize_shape(record, shape_id, rids):
+    prst, display = _GEOMETRY[record.kind]
+    is_textbox = record.kind == "textbox"
+    if record.name:
+        name = _escape(record.name)
+    else:
+        name = "%s %d" % (display, shape_id - 1)
+    c_nv_pr_children = _hlink_xml(record.link, rids) if record.link else ""
+    c_nv_sp_pr = '<p:cNvSpPr txBox="1"/>' if is_textbox else "<p:cNvSpPr/>"
+    head = _SP_OPEN % (shape_id, name, c_nv_pr_children, c_nv_sp_pr)
+
+    rot = ' rot="%d"' % int(record.rotation * 60000) if record.rotation else ""
+    fill = _SOLID_FILL % _hex(record.fill) if record.fill is not None else _NO_FILL
+    if record.line is not None:
+        line = _LINE % (record.line_width, _hex(record.line))
+    else:
+        line = "" if is_textbox else _NO_LINE
+    sp_pr = _SP_PR % (rot, record.x, record.y, record.cx, record.cy, prst, fill, line)
+
+    if record.paragraphs:
+        auto_fit = "<a:spAutoFit/>" if is_textbox else ""
+        body = [_BODY % (_ANCHOR.get(record.anchor, record.anchor), auto_fit)]
+        levels = record.levels or [(0, False)] * len(record.paragraphs)
+        for runs, (level, bulleted) in zip(record.paragraphs, levels):
+            bullet = None
+            if bulleted:
+                bullet = record.bullet or ("•", runs[0].color if runs else "E5E5E5")
+            body.append(_serialize_paragraph(
+                runs, record.align, rids, level, bullet, record.space_after
+            ))
+        body.append("</p:txBody>")
+        text = "".join(body)
+    elif is_textbox:
+        text = _BODY % ("t", "<a:spAutoFit/>") + "<a:p/></p:txBody>"
+    else:
+        text = ""
+    return head + sp_pr + text + "</p:sp>"
@@ -0,0 +1,226 @@
+"""
+Hyperlink registry: interned URLs, batched relationships, auto-linking.
+
+python-pptx's `part.relate_to(url, ...)` scans every relationship of the
+part to look for a match and again to pick the next free rId, so a slide
+with hundreds of citations pays a quadratic lookup cost. The registry keeps
+one {url: rId} map per part (seeded once from the part's existing
+hyperlink relationships) and creates all missing relationships in a single
+batch with precomputed rIds. That writes python-pptx's relationship
+internals, which is why decks/requirements.txt pins python-pptx.
+
+`autolink_text_frame`/`autolink_slide`/`autolink_presentation` find URLs in
+plain text ("Sources: cursor.com/docs | https://trust.cursor.com") and
+split the runs so every URL becomes a clickable link with a tooltip.
+
+    registry = registry_for(prs)
+    rid = registry.rid(slide.part, "https://cursor.com/pricing")
+    autolink_presentation(prs)
+"""
+
+import copy
+import re
+import sys
+import threading
+import weakref
+
+from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import _Relationship
+from pptx.oxml.ns import qn
+
+# Explicit http(s) URLs, or bare domains on common TLDs ("cursor.com/docs").
+# Bare matches need a known TLD so "Node.js" or "v1.2" are not linked.
+URL_PATTERN = re.compile(
+    r"""(?:https?://[^\s|<>"]+"""
+    r"""|(?<![\w@./-])(?:[a-z0-9-]+\.)+(?:com|org|net|io|dev|ai|app|co|ke|edu|gov)"""
+    r"""(?:/[^\s|<>"]*)?(?![\w-]))""",
+    re.IGNORECASE,
+)
+_TRAILING_PUNCTUATION = ".,;:!?)]}'\""
+
+_A_R = qn("a:r")
+_A_T = qn("a:t")
+_A_RPR = qn("a:rPr")
+_A_HLINK_CLICK = qn("a:hlinkClick")
+_R_ID = qn("r:id")
+
+
+def normalize_url(url):
+    """Canonical form used for relationships: scheme added to bare domains."""
+    if not url.lower().startswith(("http://", "https://", "mailto:")):
+        return "https://" + url
+    return url
+
+
+def find_urls(text):
+    """Yield (start, end, url) for every URL in `text`."""
+    for match in URL_PATTERN.finditer(text):
+        start, end = match.span()
+        while end > start and text[end - 1] in _TRAILING_PUNCTUATION:
+            end -= 1
+        if end > start:
+            yield start, end, text[start:end]
+
+
+class HyperlinkRegistry:
+    """Interns URLs and allocates hyperlink relationships in bulk per part."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_part = weakref.WeakKeyDictionary()
+
+    def _part_map(self, part):
+        mapping = self._by_part.get(part)
+        if mapping is None:
+            mapping = {}
+            for rel in part.rels.values():
+                if rel.reltype == RT.HYPERLINK and rel.is_external:
+                    mapping.setdefault(sys.intern(rel.target_ref), rel.rId)
+            self._by_part[part] = mapping
+        return mapping
+
+    def rids(self, part, urls):
+        """Return {url: rId} for `urls`, adding missing relationships at once."""
+        with self._lock:
+            mapping = self._part_map(part)
+            missing = []
+            for url in urls:
+                url = sys.intern(normalize_url(url))
+                if url not in mapping and url not in missing:
+                    missing.append(url)
+            if missing:
+                self._add_relationships(part, mapping, missing)
+            return {url: mapping[normalize_url(url)] for url in urls}
+
+    def rid(self, part, url):
+        """rId of the hyperlink relationship from `part` to `url`."""
+        return self.rids(part, (url,))[url]
+
+    @staticmethod
+    def _add_relationships(part, mapping, urls):
+        rels = part.rels
+        # python-pptx allocates one rId per call by rescanning the collection;
+        # allocate the whole batch from a single pass over the used ids.
+        used = set(rels.keys())
+        n = 0
+        for url in urls:
+            n += 1
+            while f"rId{n}" in used:
+                n += 1
+            rid = f"rId{n}"
+            rels._rels[rid] = _Relationship(
+                rels._base_uri, rid, RT.HYPERLINK, RTM.EXTERNAL, url
+            )
+            mapping[url] = rid
+
+
+_registries = weakref.WeakKeyDictionary()
+_registries_lock = threading.Lock()
+
+
+def registry_for(obj):
+    """The HyperlinkRegistry of the package behind `obj` (a Presentation,
+    slide or part), created on first use."""
+    part = getattr(obj, "part", obj)
+    package = part.package
+    with _registries_lock:
+        registry = _registries.get(package)
+        if registry is None:
+            registry = _registries[package] = HyperlinkRegistry()
+    return registry
+
+
+def set_run_hyperlink(r, rid, tooltip=None):
+    """Attach (or replace) an a:hlinkClick on the a:r element `r`."""
+    rPr = r.get_or_add_rPr()
+    existing = rPr.find(_A_HLINK_CLICK)
+    if existing is not None:
+        rPr.remove(existing)
+    hlink = rPr.makeelement(_A_HLINK_CLICK, {})
+    hlink.set(_R_ID, rid)
+    if tooltip:
+        hlink.set("tooltip", tooltip)
+    # hlinkClick follows fills/effects/fonts inside rPr; append keeps that order
+    # except before an a:hlinkMouseOver or a:extLst, which helpers never emit.
+    rPr.append(hlink)
+    return hlink
+
+
+def _is_linked(r):
+    rPr = r.find(_A_RPR)
+    return rPr is not None and rPr.find(_A_HLINK_CLICK) is not None
+
+
+def _pending_links(txBody):
+    """(a:r, [(start, end, url)]) for unlinked runs containing URLs."""
+    pending = []
+    for r in txBody.iter(_A_R):
+        if _is_linked(r):
+            continue
+        t = r.find(_A_T)
+        if t is None or not t.text:
+            continue
+        spans = list(find_urls(t.text))
+        if spans:
+            pending.append((r, spans))
+    return pending
+
+
+def _split_run(r, spans, rids, tooltip):
+    text = r.find(_A_T).text
+    pieces = []
+    pos = 0
+    for start, end, url in spans:
+        if start > pos:
+            pieces.append((text[pos:start], None))
+        pieces.append((text[start:end], url))
+        pos = end
+    if pos < len(text):
+        pieces.append((text[pos:], None))
+
+    template = copy.deepcopy(r)
+    anchor = r
+    for i, (piece, url) in enumerate(pieces):
+        run = r if i == 0 else copy.deepcopy(template)
+        run.find(_A_T).text = piece
+        if url is not None:
+            target = normalize_url(url)
+            set_run_hyperlink(run, rids[url], tooltip(target) if tooltip else None)
+        if i:
+            anchor.addnext(run)
+            anchor = run
+
+
+def _default_tooltip(url):
+    return f"Open {url}"
+
+
+def _link_pending(part, pending, registry, tooltip):
+    if not pending:
+        return 0
+    urls = [url for _, spans in pending for _, _, url in spans]
+    rids = (registry or registry_for(part)).rids(part, urls)
+    for r, spans in pending:
+        _split_run(r, spans, rids, tooltip)
+    return len(urls)
+
+
+def autolink_text_frame(text_frame, part, registry=None, tooltip=_default_tooltip):
+    """Turn every URL in `text_frame` (on `part`) into a link; return links added."""
+    return _link_pending(part, _pending_links(text_frame._txBody), registry, tooltip)
+
+
+def autolink_slide(slide, registry=None, tooltip=_default_tooltip):
+    """Auto-link URLs in every text frame on `slide`; return links added."""
+    # Collect the whole slide first so the registry is called once per slide
+    pending = []
+    for txBody in slide.shapes._spTree.iter(qn("p:txBody")):
+        pending.extend(_pending_links(txBody))
+    return _link_pending(slide.part, pending, registry, tooltip)
+
+
+def autolink_presentation(prs, tooltip=_default_tooltip):
+    """Auto-link URLs on every slide of `prs`; return links added."""
+    registry = registry_for(prs)
+    return sum(autolink_slide(slide, registry, tooltip) for slide in prs.slides)
@@ -0,0 +1,245 @@
+"""
+Batch manifest: checkpoint and resume for long generation runs.
+
+A manifest is an append-only JSON Lines journal next to the outputs. Each
+line records one state change of one batch item:
+
+    {"id": "00042-ab12", "state": "done", "output": "...", "sha256": "...",
+     "seconds": 0.41, "attempts": 1, "at": 1718000000.0}
+
+Items without a line are pending; a later line for the same id supersedes
+earlier ones. Only the coordinating process appends, one flushed line per
+finished item, so a crash loses at most the items that were in flight and
+the torn last line (if any) is ignored on reload. On restart the runner
+skips items that are done and whose output still exists, and builds the
+rest; failed items are retried.
+
+`run_jobs` drives a bounded process pool (or, for many small decks, a
+thread pool in this process; see "Thread safety" in decks/__init__.py)
+from a stream of jobs and keeps the manifest up to date:
+
+    jobs = ((deck_id, path, build_deck, (data, path)) for ... in rows)
+    with BatchManifest(os.path.join(output_dir, MANIFEST_NAME)) as manifest:
+        built, skipped, failed = run_jobs(jobs, manifest, workers=8)
+"""
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+MANIFEST_NAME = "manifest.jsonl"
+
+PENDING = "pending"
+DONE = "done"
+FAILED = "failed"
+
+DEFAULT_RETRIES = 2
+DEFAULT_BACKOFF = 0.5
+
+# Pool kinds run_jobs can build decks in
+EXECUTORS = {"process": ProcessPoolExecutor, "thread": ThreadPoolExecutor}
+
+
+def file_sha256(path):
+    """Hex SHA-256 of the file at `path`."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def run_with_retries(func, *args, retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF):
+    """Call func(*args), retrying up to `retries` times with exponential backoff.
+
+    Returns (result, attempts); the last exception propagates.
+    """
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            return func(*args), attempt
+        except Exception:
+            if attempt > retries:
+                raise
+            time.sleep(backoff * 2 ** (attempt - 1))
+
+
+def timed_build(func, output_path, *args, retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF):
+    """Run a build step that writes `output_path`, with retries.
+
+    Returns (fields of a "done" manifest record, progress fields of the
+    deck). Used inside workers, so hashing happens off the coordinating
+    process and the deck's progress events are collected for it to report.
+    """
+    from decks.progress import ProgressReporter, use_reporter, worker_id
+
+    events = []
+    started = time.perf_counter()
+    with use_reporter(ProgressReporter([events.append])):
+        _, attempts = run_with_retries(func, *args, retries=retries, backoff=backoff)
+    finished = [e for e in events if e["event"] == "deck_finished"]
+    progress = {"worker": worker_id()}
+    if finished:
+        progress["bytes"] = finished[-1].get("bytes")
+        progress["slides"] = finished[-1].get("slides")
+    return {
+        "output": output_path,
+        "sha256": file_sha256(output_path),
+        "seconds": round(time.perf_counter() - started, 3),
+        "attempts": attempts,
+    }, progress
+
+
+class BatchManifest:
+    """Per-item state of a batch, persisted as an append-only journal."""
+
+    def __init__(self, path):
+        self.path = path
+        self._items = {}
+        if os.path.exists(path):
+            self._load()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+
+    def _load(self):
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Torn line from a crash mid-write
+                    continue
+                if isinstance(record, dict) and "id" in record:
+                    self._items[record["id"]] = record
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._file.close()
+
+    def __len__(self):
+        return len(self._items)
+
+    def state(self, item_id):
+        """"pending", "done" or "failed"."""
+        record = self._items.get(item_id)
+        return record["state"] if record else PENDING
+
+    def record(self, item_id):
+        """The latest record of `item_id`, or None."""
+        return self._items.get(item_id)
+
+    def is_done(self, item_id, output=None):
+        """True if `item_id` finished and its output (if given) still exists."""
+        record = self._items.get(item_id)
+        if record is None or record["state"] != DONE:
+            return False
+        return output is None or os.path.exists(output)
+
+    def _append(self, record):
+        record["at"] = round(time.time(), 3)
+        self._items[record["id"]] = record
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def mark_done(self, item_id, output, sha256=None, seconds=None, attempts=1):
+        self._append({
+            "id": item_id, "state": DONE, "output": output,
+            "sha256": sha256, "seconds": seconds, "attempts": attempts,
+        })
+
+    def mark_failed(self, item_id, error, attempts=1):
+        self._append({
+            "id": item_id, "state": FAILED, "error": str(error), "attempts": attempts,
+        })
+
+    def counts(self):
+        """{state: number of items} over the items seen so far."""
+        counts = {DONE: 0, FAILED: 0}
+        for record in self._items.values():
+            counts[record["state"]] = counts.get(record["state"], 0) + 1
+        return counts
+
+
+def run_jobs(jobs, manifest, workers=None, retries=DEFAULT_RETRIES,
+             backoff=DEFAULT_BACKOFF, reporter=None, executor="process"):
+    """Run (item_id, output_path, func, args) jobs in a bounded pool.
+
+    At most ``2 * workers`` jobs are held in memory at a time. Items that are
+    done (or whose output already exists from an earlier run without a
+    manifest) are skipped; the rest are built with retries, and their
+    outcome is journalled and reported (decks.progress) as soon as each
+    finishes. `executor` is "process" (jobs and results are pickled) or
+    "thread" (no pickling; for small decks built by thread-safe code).
+    A job whose id or output path repeats an earlier one raises ValueError.
+    Returns (built, skipped, failed).
+    """
+    from decks.progress import get_reporter
+
+    workers = workers or os.cpu_count() or 1
+    reporter = reporter or get_reporter()
+    reporter.workers = workers
+    max_in_flight = workers * 2
+    built = skipped = failed = 0
+
+    def collect(futures):
+        nonlocal built, failed
+        for future in futures:
+            item_id, output_path = in_flight.pop(future)
+            try:
+                fields, progress = future.result()
+            except Exception as exc:
+                error = f"{type(exc).__name__}: {exc}"
+                manifest.mark_failed(item_id, error, retries + 1)
+                reporter.deck_failed(output_path, error, id=item_id)
+                failed += 1
+            else:
+                manifest.mark_done(item_id, **fields)
+                reporter.deck_finished(
+                    output_path, fields["seconds"], id=item_id,
+                    attempts=fields["attempts"], **progress,
+                )
+                built += 1
+
+    in_flight = {}
+    seen_ids = set()
+    seen_outputs = set()
+    with EXECUTORS[executor](max_workers=workers) as pool:
+        for item_id, output_path, func, args in jobs:
+            # Two jobs writing one output would race and silently drop one deck
+            real_path = os.path.realpath(output_path)
+            if item_id in seen_ids or real_path in seen_outputs:
+                raise ValueError(
+                    f"duplicate batch job {item_id!r} writing {output_path!r}"
+                )
+            seen_ids.add(item_id)
+            seen_outputs.add(real_path)
+            if manifest.is_done(item_id, output_path):
+                skipped += 1
+                continue
+            if manifest.record(item_id) is None and os.path.exists(output_path):
+                # Outputs are written atomically, so an existing one is complete
+                manifest.mark_done(item_id, output_path, file_sha256(output_path))
+                skipped += 1
+                continue
+            if len(in_flight) >= max_in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                collect(done)
+            future = pool.submit(
+                timed_build, func, output_path, *args, retries=retries, backoff=backoff,
+            )
+            in_flight[future] = (item_id, output_path)
+            reporter.deck_started(output_path, id=item_id)
+        collect(list(wait(in_flight).done))
+
+    reporter.finish()
+    return built, skipped, failed
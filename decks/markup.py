@@ -0,0 +1,192 @@
+"""
+Inline rich-text markup for bullets and text boxes.
+
+Mixed formatting used to mean stacking text boxes: one for a colored "•",
+another for the item, a third for a bold lead-in. With markup, one string
+per paragraph carries all of it and one text box holds the whole list:
+
+    **Pro**: $20/mo with {green:usage credits}
+    - Bulleted item with *italic* text and a [link](https://cursor.com/pricing)
+      - Nested bullet (two spaces of indent per level)
+
+- `**bold**`, `*italic*`;
+- `{name:text}` colors text with a palette color (`blue`, `light_gray`,
+  ... from the CURSOR_* constants of decks.helpers) or `{#3B82F6:text}`;
+- `[text](url)` makes the text a hyperlink;
+- a leading `- ` (or `• `) makes a bulleted paragraph, and every two
+  leading spaces nest it one level deeper;
+- `\\` escapes the next character, so `\\*` is a literal asterisk.
+
+Markers nest (`**bold {green:and green}**`). Markers that are not closed,
+or closed out of order, are kept as literal text, so a plain string never
+fails to render. A string is tokenized by one compiled regex, and parsed
+results are memoized per string, so repeated labels (legends, card
+bullets, report rows) are parsed once per process. `markup_runs` turns a
+parsed paragraph into decks.ir TextRuns in one pass, and
+`SlideIR.rich_textbox` lays a list of markup strings out as one text box.
+
+    scene.rich_textbox(x, y, w, h, ["{blue:•} Hobby: Free tier", ...],
+                       font_size=9, font_color=CURSOR_OFF_WHITE)
+"""
+
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+Span = namedtuple("Span", "text bold italic color link")
+Span.__doc__ = """A run of uniformly formatted text: color is a palette
+name, "#RRGGBB" or None (the box's color), link a URL or None."""
+
+Paragraph = namedtuple("Paragraph", "level bullet spans")
+
+_TOKENS = re.compile(
+    r"""\\(?P<escaped>.)"""
+    r"""|(?P<bold>\*\*)"""
+    r"""|(?P<italic>\*)"""
+    r"""|\{(?P<color>\#[0-9A-Fa-f]{6}|[A-Za-z_]+):"""
+    r"""|(?P<close>\})"""
+    r"""|(?P<link_open>\[)"""
+    r"""|\]\((?P<url>[^()\s]+)\)"""
+    r"""|(?P<text>[^\\*{}\[\]]+|.)""",
+    re.DOTALL,
+)
+_BULLET = re.compile(r"(?P<indent> *)(?:(?P<bullet>[-•]) )?")
+_CACHE_SIZE = 4096
+
+
+def _is_color(color):
+    return color.startswith("#") or color.lower() in palette()
+
+
+def _unmatched(tokens):
+    """Indices of the marker tokens in `tokens` that are not closed in order.
+
+    Markers pair up like brackets: a closer only matches the innermost open
+    marker, and everything that does not pair up is literal text, so
+    strings such as "5 * 3", "[draft]" or "{x}" come through unchanged. A
+    `{name:` whose name is not a color is literal too ("{hh:mm}").
+    """
+    literal = set()
+    # (kind, token index) of the open markers, innermost last
+    stack = []
+    for i, match in enumerate(tokens):
+        kind = match.lastgroup
+        if kind in ("bold", "italic"):
+            if stack and stack[-1][0] == kind:
+                stack.pop()
+            else:
+                stack.append((kind, i))
+        elif kind == "color" and not _is_color(match.group("color")):
+            literal.add(i)
+        elif kind in ("color", "link_open"):
+            stack.append((kind, i))
+        elif kind in ("close", "url"):
+            opener = "color" if kind == "close" else "link_open"
+            if stack and stack[-1][0] == opener:
+                stack.pop()
+            else:
+                literal.add(i)
+    literal.update(i for _, i in stack)
+    return literal
+
+
+def _parse_spans(text):
+    """[Span] of `text` (one paragraph)."""
+    spans = []
+    # Open markers, innermost last: ("bold",), ("italic",), ("color", value)
+    # or ("link", index of its first span)
+    stack = []
+    pending = []
+
+    def flush():
+        if pending:
+            bold = any(frame[0] == "bold" for frame in stack)
+            italic = any(frame[0] == "italic" for frame in stack)
+            color = next((frame[1] for frame in reversed(stack) if frame[0] == "color"), None)
+            spans.append(["".join(pending), bold, italic, color, None])
+            pending.clear()
+
+    tokens = list(_TOKENS.finditer(text))
+    literal = _unmatched(tokens)
+    for i, match in enumerate(tokens):
+        kind = match.lastgroup
+        if kind in ("text", "escaped"):
+            pending.append(match.group(kind))
+            continue
+        if i in literal:
+            pending.append(match.group(0))
+            continue
+        flush()
+        if kind in ("bold", "italic"):
+            if stack and stack[-1][0] == kind:
+                stack.pop()
+            else:
+                stack.append((kind,))
+        elif kind == "color":
+            stack.append(("color", match.group("color")))
+        elif kind == "close":
+            stack.pop()
+        elif kind == "link_open":
+            stack.append(("link", len(spans)))
+        else:
+            for span in spans[stack.pop()[1]:]:
+                span[4] = match.group("url")
+    flush()
+    return [Span(*span) for span in spans]
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def parse_markup(text):
+    """Parsed Paragraph(level, bullet, spans) of one markup string."""
+    prefix = _BULLET.match(text)
+    level = min(len(prefix.group("indent")) // 2, 8)
+    return Paragraph(level, prefix.group("bullet") is not None,
+                     tuple(_parse_spans(text[prefix.end():])))
+
+
+def plain_text(text):
+    """`text` without its markup, e.g. for measuring with decks.text_fit."""
+    return "".join(span.text for span in parse_markup(text).spans)
+
+
+@lru_cache(maxsize=None)
+def palette():
+    """{name: "RRGGBB"} of the CURSOR_* colors of decks.helpers."""
+    from decks import helpers
+
+    return {
+        name[len("CURSOR_"):].lower(): str(value)
+        for name, value in vars(helpers).items()
+        if name.startswith("CURSOR_")
+    }
+
+
+def resolve_color(color):
+    """"RRGGBB" of a palette name or "#RRGGBB" markup color."""
+    if color.startswith("#"):
+        return color[1:].upper()
+    try:
+        return palette()[color.lower()]
+    except KeyError:
+        raise ValueError(f"unknown markup color {color!r}") from None
+
+
+def _tooltip(url):
+    return f"Open {url}"
+
+
+def markup_runs(paragraph, size, color, bold=False, tooltip=_tooltip):
+    """decks.ir TextRuns of a parsed Paragraph, in `size` pt and `color`
+    wherever the markup sets no color; `tooltip(url)` labels the links."""
+    from decks.ir import TextRun
+
+    default = color if isinstance(color, str) else str(color)
+    return [
+        TextRun(
+            span.text, size,
+            resolve_color(span.color) if span.color else default,
+            bold or span.bold, span.italic,
+            (span.link, tooltip(span.link)) if span.link else None,
+        )
+        for span in paragraph.spans
+    ]
@@ -0,0 +1,215 @@
+"""
+Shared slide layouts holding the Cursor deck chrome.
+
+Every content slide of the pro deck repeats the same chrome: a black
+background, a title and subtitle, a short accent rule, a source footer
+and a slide number. Instead of copying that XML onto each slide, these
+helpers add custom slide layouts to the presentation's master that hold
+the chrome once:
+
+- background, accent rule and slide number (a slidenum field) are drawn
+  by the layout and rendered on every slide that uses it;
+- title, subtitle and footer are layout placeholders, so a slide only
+  carries its own text and inherits position and formatting.
+
+Layouts are created on first use and found again by name, so a deck gets
+one layout per (title block, accent color) combination however long it is.
+
+    slide = add_chrome_slide(prs, "Value Proposition",
+                             "Why Developers Choose Cursor", CURSOR_PURPLE,
+                             footer="Sources: cursor.com/docs")
+"""
+
+from collections import namedtuple
+
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import qn
+from pptx.parts.slide import SlideLayoutPart
+from pptx.util import Inches, Pt
+
+from decks.helpers import (
+    CURSOR_BLACK, CURSOR_LIGHT_GRAY, CURSOR_MID_GRAY, CURSOR_WHITE,
+)
+from decks.links import autolink_text_frame
+
+# Geometry and type sizes of the title block, in inches and points
+TitleBlock = namedtuple(
+    "TitleBlock",
+    "name title_top title_height title_size "
+    "subtitle_top subtitle_height subtitle_size rule_top",
+)
+
+STANDARD_TITLE_BLOCK = TitleBlock("Standard", 0.3, 0.6, 34, 0.85, 0.4, 14, 1.25)
+COMPACT_TITLE_BLOCK = TitleBlock("Compact", 0.25, 0.55, 32, 0.75, 0.35, 12, 1.1)
+ROOMY_TITLE_BLOCK = TitleBlock("Roomy", 0.4, 0.6, 36, 0.95, 0.4, 14, 1.4)
+
+FOOTER_IDX = 11
+SUBTITLE_IDX = 1
+
+_NSDECLS = (
+    'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+    'xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+)
+
+_LAYOUT = (
+    '<p:sldLayout %s preserve="1" userDrawn="1">'
+    '<p:cSld name="%s">'
+    '<p:bg><p:bgPr><a:solidFill><a:srgbClr val="%s"/></a:solidFill><a:effectLst/></p:bgPr></p:bg>'
+    '<p:spTree><p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr>'
+    '<p:grpSpPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="0" cy="0"/>'
+    '<a:chOff x="0" y="0"/><a:chExt cx="0" cy="0"/></a:xfrm></p:grpSpPr>'
+    '%s</p:spTree></p:cSld>'
+    '<p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr></p:sldLayout>'
+)
+
+_XFRM = '<a:xfrm><a:off x="%d" y="%d"/><a:ext cx="%d" cy="%d"/></a:xfrm>'
+
+_PLACEHOLDER = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="%d" name="%s"/>'
+    '<p:cNvSpPr><a:spLocks noGrp="1"/></p:cNvSpPr><p:nvPr>%s</p:nvPr></p:nvSpPr>'
+    '<p:spPr>' + _XFRM + '</p:spPr>'
+    '<p:txBody><a:bodyPr wrap="square" lIns="91440" tIns="45720" rIns="91440" '
+    'bIns="45720" anchor="t"><a:noAutofit/></a:bodyPr>'
+    '<a:lstStyle><a:lvl1pPr marL="0" indent="0" algn="%s">'
+    '<a:lnSpc><a:spcPct val="100000"/></a:lnSpc><a:spcBef><a:spcPts val="0"/></a:spcBef>'
+    '<a:buNone/><a:defRPr sz="%d"%s><a:solidFill><a:srgbClr val="%s"/></a:solidFill>'
+    '<a:latin typeface="+mn-lt"/></a:defRPr></a:lvl1pPr></a:lstStyle>'
+    '<a:p><a:r><a:rPr lang="en-US"/><a:t>%s</a:t></a:r></a:p></p:txBody></p:sp>'
+)
+
+_RULE = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="%d" name="Accent Rule"/><p:cNvSpPr/>'
+    '<p:nvPr userDrawn="1"/></p:nvSpPr>'
+    '<p:spPr>' + _XFRM + '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom>'
+    '<a:solidFill><a:srgbClr val="%s"/></a:solidFill><a:ln><a:noFill/></a:ln></p:spPr></p:sp>'
+)
+
+_SLIDE_NUMBER = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="%d" name="Slide Number"/><p:cNvSpPr txBox="1"/>'
+    '<p:nvPr userDrawn="1"/></p:nvSpPr>'
+    '<p:spPr>' + _XFRM + '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+    '<p:txBody><a:bodyPr wrap="square" rtlCol="0"/><a:lstStyle/><a:p><a:pPr algn="r"/>'
+    '<a:fld id="{B6F15528-21DE-4FAA-801E-634DDDAF4B2B}" type="slidenum">'
+    '<a:rPr lang="en-US" sz="1000"><a:solidFill><a:srgbClr val="%s"/></a:solidFill></a:rPr>'
+    '<a:t>&#8249;#&#8250;</a:t></a:fld></a:p></p:txBody></p:sp>'
+)
+
+_SLIDE_FOOTER = (
+    '<p:sp %s><p:nvSpPr><p:cNvPr id="%d" name="Footer"/>'
+    '<p:cNvSpPr><a:spLocks noGrp="1"/></p:cNvSpPr>'
+    '<p:nvPr><p:ph type="ftr" sz="quarter" idx="%d"/></p:nvPr></p:nvSpPr><p:spPr/>'
+    '<p:txBody><a:bodyPr/><a:lstStyle/><a:p><a:r><a:rPr lang="en-US" dirty="0"/>'
+    '<a:t></a:t></a:r></a:p></p:txBody></p:sp>'
+)
+
+
+def _layout_name(block, accent):
+    if block is None:
+        return "Cursor Blank"
+    return f"Cursor {block.name} {accent}"
+
+
+def _chrome_shapes_xml(prs, block, accent):
+    """Layout spTree children for `block` (None for the blank variant)."""
+    width = prs.slide_width
+    height = prs.slide_height
+    shapes = []
+    if block is not None:
+        shapes.append(_PLACEHOLDER % (
+            2, "Title Placeholder", '<p:ph type="title"/>',
+            Inches(0.5), Inches(block.title_top), Inches(9), Inches(block.title_height),
+            "l", block.title_size * 100, ' b="1"', CURSOR_WHITE, "Click to edit title",
+        ))
+        shapes.append(_PLACEHOLDER % (
+            3, "Subtitle Placeholder",
+            '<p:ph type="body" idx="%d"/>' % SUBTITLE_IDX,
+            Inches(0.5), Inches(block.subtitle_top), Inches(9), Inches(block.subtitle_height),
+            "l", block.subtitle_size * 100, "", CURSOR_LIGHT_GRAY, "Click to edit subtitle",
+        ))
+        shapes.append(_RULE % (
+            4, Inches(0.5), Inches(block.rule_top), Inches(2), Pt(3), accent,
+        ))
+        shapes.append(_PLACEHOLDER % (
+            5, "Footer Placeholder",
+            '<p:ph type="ftr" sz="quarter" idx="%d"/>' % FOOTER_IDX,
+            Inches(0.3), height - Inches(0.35), width - Inches(0.6), Inches(0.3),
+            "l", 700, "", CURSOR_MID_GRAY, "Sources",
+        ))
+    shapes.append(_SLIDE_NUMBER % (
+        6, width - Inches(0.6), height - Inches(0.4), Inches(0.4), Inches(0.3),
+        CURSOR_MID_GRAY,
+    ))
+    return "".join(shapes)
+
+
+def _next_layout_id(prs):
+    """Next free id shared by p:sldMasterId and p:sldLayoutId entries."""
+    ids = [int(i) for i in prs.part._element.xpath("//p:sldMasterId/@id")]
+    for master in prs.slide_masters:
+        ids.extend(int(i) for i in master._element.xpath(".//p:sldLayoutId/@id"))
+    return max(ids + [2147483648]) + 1
+
+
+def get_chrome_layout(prs, accent=None, block=STANDARD_TITLE_BLOCK):
+    """The chrome layout for `block` and `accent`, created on first use.
+
+    Pass block=None for the blank variant (background and slide number only).
+    """
+    accent = str(accent) if accent is not None else None
+    name = _layout_name(block, accent)
+    layout = prs.slide_layouts.get_by_name(name)
+    if layout is not None:
+        return layout
+
+    master = prs.slide_master
+    master_part = master.part
+    package = master_part.package
+    element = parse_xml(_LAYOUT % (
+        _NSDECLS, name, CURSOR_BLACK, _chrome_shapes_xml(prs, block, accent),
+    ))
+    partname = package.next_partname("/ppt/slideLayouts/slideLayout%d.xml")
+    layout_part = SlideLayoutPart(partname, CT.PML_SLIDE_LAYOUT, package, element)
+    layout_part.relate_to(master_part, RT.SLIDE_MASTER)
+    rId = master_part.relate_to(layout_part, RT.SLIDE_LAYOUT)
+
+    id_lst = master._element.get_or_add_sldLayoutIdLst()
+    entry = id_lst.makeelement(qn("p:sldLayoutId"), {})
+    entry.set("id", str(_next_layout_id(prs)))
+    entry.set(qn("r:id"), rId)
+    id_lst.append(entry)
+    return prs.slide_layouts.get_by_name(name)
+
+
+def set_footer(slide, text):
+    """Fill the layout's footer placeholder on `slide`; URLs become links."""
+    sp_tree = slide.shapes._spTree
+    shape_id = max(int(i) for i in sp_tree.xpath(".//p:cNvPr/@id")) + 1
+    sp = parse_xml(_SLIDE_FOOTER % (_NSDECLS, shape_id, FOOTER_IDX))
+    sp.find(".//" + qn("a:t")).text = text
+    sp_tree.append(sp)
+    text_frame = slide.placeholders[FOOTER_IDX].text_frame
+    autolink_text_frame(text_frame, slide.part)
+    return text_frame
+
+
+def add_chrome_slide(prs, title, subtitle=None, accent=None, footer=None,
+                     block=STANDARD_TITLE_BLOCK):
+    """Add a content slide whose chrome comes from a shared layout."""
+    slide = prs.slides.add_slide(get_chrome_layout(prs, accent, block))
+    slide.shapes.title.text_frame.text = title
+    subtitle_ph = slide.placeholders[SUBTITLE_IDX]
+    if subtitle:
+        subtitle_ph.text_frame.text = subtitle
+    else:
+        subtitle_ph._element.getparent().remove(subtitle_ph._element)
+    if footer:
+        set_footer(slide, footer)
+    return slide
+
+
+def add_blank_chrome_slide(prs):
+    """Add a slide with only the shared background and slide number."""
+    return prs.slides.add_slide(get_chrome_layout(prs, block=None))
@@ -0,0 +1,422 @@
+"""
+Linked media for draft decks, and the finalize pass that embeds it.
+
+Embedding full-resolution photos makes review drafts tens of MB, and slow
+to save and copy. In draft mode a picture is written as linked media
+instead: the slide holds an `a:blip r:link` pointing at the image file
+(as a file: URI) or URL, and the deck holds no image bytes. PowerPoint
+and LibreOffice show linked pictures on any machine that can reach the
+asset path, such as a shared `public/collections/` directory.
+
+    media = link_media("collections/Man.jpg", root="public")
+    add_linked_picture(slide, media, x, y, cx, cy)
+
+`finalize_deck` turns a draft into a self-contained deck in one pass:
+
+- every linked picture is loaded once, however many slides use it;
+- each image is downscaled to the largest size it is shown at, at `dpi`,
+  and re-encoded (JPEG, or PNG when it has transparency) only when that
+  makes it smaller;
+- the embedded parts are shared between slides, and the picture is fitted
+  to its box at the image's real aspect ratio (drafts of remote images
+  only know the box);
+- pictures whose media cannot be read stay linked and are reported.
+
+    python3 -m decks catalogue products.csv --draft --output-dir catalogue-draft
+    python3 -m decks finalize catalogue-draft/*.pptx --output-dir catalogue
+
+`add_media` embeds videos and animated GIFs, such as the brand clips in
+`public/collections/`:
+
+    add_media(slide, "public/collections/Scroll Down.mp4", x, y, cx, cy)
+
+Videos show their first frame as the poster until played. Poster frames
+are extracted once per clip (Pillow for GIFs, ffmpeg for videos) and cached
+on disk by the clip's SHA1 under POSTER_CACHE, so a clip used in thousands
+of decks is decoded once. Clips and posters are embedded once per package,
+and media parts are stored in the zip without recompression (see
+decks.outputs.write_package).
+"""
+
+import hashlib
+import io
+import mimetypes
+import os
+import pathlib
+import shutil
+import subprocess
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict, namedtuple
+from functools import lru_cache
+from urllib.parse import unquote, urlparse
+
+MEDIA_MODES = ("embed", "link")
+MEDIA_TIMEOUT = 10
+# Embedded pictures get this many pixels per inch of their largest display size
+FINALIZE_DPI = 150
+EMU_PER_INCH = 914400
+# Poster frames of videos and GIFs, by media SHA1
+POSTER_CACHE = os.path.join(os.path.expanduser("~"), ".cache", "decks", "posters")
+
+_A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+_P = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+_R = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_RT_IMAGE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/image"
+
+LinkedMedia = namedtuple("LinkedMedia", "target width height")
+LinkedMedia.__doc__ = """A picture to link: its URI and pixel size (None if
+unknown without downloading it)."""
+
+# (sha1, cache_dir) -> (png, width, height) of poster frames seen this process
+_posters = {}
+# Bytes of local clips kept in memory between decks (see load_clip)
+CLIP_CACHE_BYTES = 64 << 20
+# (path, mtime_ns, size) -> Clip, least recently used first
+_clips = OrderedDict()
+_clip_bytes = 0
+_clips_lock = threading.Lock()
+
+
+def is_url(ref):
+    return ref.startswith(("http://", "https://"))
+
+
+def resolve_media(ref, root="."):
+    """Local path (relative refs resolved against `root`) or URL of `ref`."""
+    if is_url(ref):
+        return ref
+    if ref.startswith("file:"):
+        return unquote(urlparse(ref).path)
+    return ref if os.path.isabs(ref) else os.path.join(root, ref.lstrip("/"))
+
+
+def read_media(ref, root="."):
+    """Bytes of the image at `ref` (a path, file: URI or http(s) URL)."""
+    location = resolve_media(ref, root)
+    if is_url(location):
+        from urllib.request import urlopen
+
+        with urlopen(location, timeout=MEDIA_TIMEOUT) as response:
+            return response.read()
+    with open(location, "rb") as f:
+        return f.read()
+
+
+def link_media(ref, root="."):
+    """LinkedMedia for `ref`, or None if it is a local file that is missing
+    or not an image. Only the image header of local files is read."""
+    from PIL import Image
+
+    location = resolve_media(ref, root)
+    if is_url(location):
+        return LinkedMedia(location, None, None)
+    try:
+        with Image.open(location) as image:
+            width, height = image.size
+    except (OSError, ValueError):
+        return None
+    return LinkedMedia(pathlib.Path(os.path.abspath(location)).as_uri(), width, height)
+
+
+def fit_box(px_width, px_height, x, y, width, height):
+    """(x, y, cx, cy) of an image of the given pixel size, fitted and centred
+    in the box."""
+    scale = min(width / px_width, height / px_height)
+    cx = int(px_width * scale)
+    cy = int(px_height * scale)
+    return x + (width - cx) // 2, y + (height - cy) // 2, cx, cy
+
+
+def add_linked_picture(slide, media, x, y, width, height):
+    """Add a picture linking to `media` (LinkedMedia), fitted in the box when
+    its size is known; returns the p:pic element."""
+    if media.width and media.height:
+        x, y, width, height = fit_box(media.width, media.height, x, y, width, height)
+    r_id = slide.part.relate_to(media.target, _RT_IMAGE, is_external=True)
+    sp_tree = slide.shapes._spTree
+    shape_id = max(int(i) for i in sp_tree.xpath("//p:cNvPr/@id")) + 1
+    name = os.path.basename(urlparse(media.target).path)
+    pic = sp_tree.add_pic(shape_id, f"Picture {shape_id}", unquote(name), r_id, x, y, width, height)
+    blip = pic.find(f"{_P}blipFill/{_A}blip")
+    del blip.attrib[_R + "embed"]
+    blip.set(_R + "link", r_id)
+    return pic
+
+
+# =============================================================================
+# FINALIZE
+# =============================================================================
+
+def optimize_image(data, max_px):
+    """(bytes, width, height) of the image in `data` with its longest edge at
+    most `max_px`; the original bytes are kept unless re-encoding is smaller."""
+    from PIL import Image, ImageOps
+
+    with Image.open(io.BytesIO(data)) as image:
+        original_size = image.size
+        # Orientation is applied to the pixels, since slides ignore EXIF
+        transposed = image.getexif().get(0x0112, 1) != 1
+        image = ImageOps.exif_transpose(image)
+        if max(image.size) <= max_px and not transposed:
+            return data, image.width, image.height
+        image.thumbnail((max_px, max_px))
+        out = io.BytesIO()
+        if image.mode in ("RGBA", "LA") or "transparency" in image.info:
+            image.save(out, "PNG", optimize=True)
+        else:
+            image.convert("RGB").save(out, "JPEG", quality=82, optimize=True)
+        encoded = out.getvalue()
+        if len(encoded) >= len(data) and not transposed:
+            return data, original_size[0], original_size[1]
+        return encoded, image.width, image.height
+
+
+def _load(target, max_px):
+    try:
+        return optimize_image(read_media(target), max_px)
+    except (OSError, ValueError):
+        return None
+
+
+def _linked_pictures(prs):
+    """{target: [(slide part, p:pic, r:link id)]} of every linked picture."""
+    uses = {}
+    for slide in prs.slides:
+        part = slide.part
+        for pic in slide._element.iter(_P + "pic"):
+            blip = pic.find(f"{_P}blipFill/{_A}blip")
+            if blip is None or blip.get(_R + "embed") or not blip.get(_R + "link"):
+                continue
+            r_id = blip.get(_R + "link")
+            rel = part.rels.get(r_id)
+            if rel is None or not rel.is_external:
+                continue
+            uses.setdefault(rel.target_ref, []).append((part, pic, r_id))
+    return uses
+
+
+def finalize_deck(path, output=None, dpi=FINALIZE_DPI, workers=8):
+    """Embed the linked pictures of the deck at `path` and save it to
+    `output` (default: in place). Returns (embedded, missing targets)."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from pptx import Presentation
+
+    from decks.outputs import save_presentation
+
+    prs = Presentation(path)
+    uses = _linked_pictures(prs)
+    # Pixels needed: the largest display size of each image at `dpi`
+    needed = {
+        target: max(
+            max(int(ext.get("cx")), int(ext.get("cy"))) * dpi // EMU_PER_INCH
+            for _, pic, _ in pictures
+            for ext in pic.iter(_A + "ext")
+            if ext.get("cx") is not None
+        ) or 1
+        for target, pictures in uses.items()
+    }
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        loaded = dict(zip(needed, pool.map(_load, needed, needed.values())))
+
+    embedded = 0
+    missing = []
+    for target, pictures in uses.items():
+        image = loaded[target]
+        if image is None:
+            missing.append(target)
+            continue
+        data, px_width, px_height = image
+        for part, pic, link_id in pictures:
+            # Parts are shared by SHA1, so every use embeds the bytes once
+            _, r_id = part.get_or_add_image_part(io.BytesIO(data))
+            blip = pic.find(f"{_P}blipFill/{_A}blip")
+            del blip.attrib[_R + "link"]
+            blip.set(_R + "embed", r_id)
+            part.drop_rel(link_id)
+            _refit(pic, px_width, px_height)
+            embedded += 1
+    save_presentation(prs, output or path)
+    return embedded, missing
+
+
+def _refit(pic, px_width, px_height):
+    xfrm = pic.find(f"{_P}spPr/{_A}xfrm")
+    off, ext = xfrm.find(_A + "off"), xfrm.find(_A + "ext")
+    x, y, cx, cy = fit_box(
+        px_width, px_height,
+        int(off.get("x")), int(off.get("y")), int(ext.get("cx")), int(ext.get("cy")),
+    )
+    off.set("x", str(x))
+    off.set("y", str(y))
+    ext.set("cx", str(cx))
+    ext.set("cy", str(cy))
+
+
+# =============================================================================
+# VIDEO AND ANIMATED GIFS
+# =============================================================================
+
+Clip = namedtuple("Clip", "location data sha1 mime_type")
+Clip.__doc__ = """Bytes of a video or GIF, with their SHA1 (the key of
+poster frames and of media parts in a package) and MIME type."""
+
+
+def load_clip(ref, root="."):
+    """Clip of the media at `ref`.
+
+    Local files are read once per process while unchanged (same mtime and
+    size), however many decks embed them; the cache holds at most
+    CLIP_CACHE_BYTES of clips, least recently used first out, and skips
+    larger files. URLs are fetched on every call, since nothing tells when
+    a remote clip changed.
+    """
+    global _clip_bytes
+
+    location = resolve_media(ref, root)
+    if is_url(location):
+        return _read_clip(location)
+    stat = os.stat(location)
+    key = (location, stat.st_mtime_ns, stat.st_size)
+    with _clips_lock:
+        clip = _clips.get(key)
+        if clip is not None:
+            _clips.move_to_end(key)
+            return clip
+    clip = _read_clip(location)
+    if len(clip.data) > CLIP_CACHE_BYTES:
+        return clip
+    with _clips_lock:
+        # Older versions of the file are never asked for again
+        for stale in [k for k in _clips if k[0] == location and k != key]:
+            _clip_bytes -= len(_clips.pop(stale).data)
+        if key not in _clips:
+            _clips[key] = clip
+            _clip_bytes += len(clip.data)
+        while _clip_bytes > CLIP_CACHE_BYTES:
+            _clip_bytes -= len(_clips.popitem(last=False)[1].data)
+    return clip
+
+
+def _read_clip(location):
+    data = read_media(location)
+    path = urlparse(location).path if is_url(location) else location
+    mime_type = mimetypes.guess_type(path)[0] or "video/unknown"
+    return Clip(location, data, hashlib.sha1(data).hexdigest(), mime_type)
+
+
+def is_gif(clip):
+    return clip.data[:6] in (b"GIF87a", b"GIF89a")
+
+
+def poster_frame(clip, cache_dir=POSTER_CACHE):
+    """(png, width, height) of the first frame of `clip`, or None when it
+    cannot be decoded here.
+
+    GIFs are decoded with Pillow, videos with ffmpeg (when on PATH). Frames
+    are cached by the clip's SHA1 in memory and, unless `cache_dir` is None,
+    as `<sha1>.png` files in it, so other processes and later runs reuse them.
+    """
+    from PIL import Image
+
+    key = (clip.sha1, cache_dir)
+    if key in _posters:
+        return _posters[key]
+    cached = os.path.join(cache_dir, clip.sha1 + ".png") if cache_dir else None
+    if cached and os.path.exists(cached):
+        with open(cached, "rb") as f:
+            png = f.read()
+    else:
+        png = _first_frame(clip)
+        if png is None:
+            return None
+        if cached:
+            # Written under a unique name and renamed, for concurrent builds
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = f"{cached}.{uuid.uuid4().hex}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(png)
+            os.replace(tmp_path, cached)
+    with Image.open(io.BytesIO(png)) as image:
+        _posters[key] = (png, *image.size)
+    return _posters[key]
+
+
+def _first_frame(clip):
+    from PIL import Image
+
+    if is_gif(clip):
+        with Image.open(io.BytesIO(clip.data)) as image:
+            out = io.BytesIO()
+            image.convert("RGBA").save(out, "PNG", optimize=True)
+            return out.getvalue()
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        return None
+    local = not is_url(clip.location)
+    if not local:
+        # The moov atom may come last, so ffmpeg needs a seekable file
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(clip.data)
+    source = clip.location if local else f.name
+    try:
+        result = subprocess.run(
+            [ffmpeg, "-v", "error", "-i", source, "-frames:v", "1",
+             "-f", "image2pipe", "-vcodec", "png", "-"],
+            capture_output=True, timeout=MEDIA_TIMEOUT,
+        )
+    except subprocess.TimeoutExpired:
+        return None
+    finally:
+        if not local:
+            os.remove(source)
+    return result.stdout if result.returncode == 0 and result.stdout else None
+
+
+@lru_cache(maxsize=1)
+def placeholder_poster():
+    """(png, width, height) of the poster used when no frame can be
+    extracted: a play button on the decks' dark gray."""
+    from PIL import Image, ImageDraw
+
+    width, height = 640, 360
+    image = Image.new("RGB", (width, height), "#262626")
+    draw = ImageDraw.Draw(image)
+    cx, cy, r = width // 2, height // 2, 48
+    draw.ellipse((cx - r, cy - r, cx + r, cy + r), fill="#3B82F6")
+    draw.polygon([(cx - 16, cy - 24), (cx - 16, cy + 24), (cx + 26, cy)], fill="#FFFFFF")
+    out = io.BytesIO()
+    image.save(out, "PNG", optimize=True)
+    return out.getvalue(), width, height
+
+
+def add_media(slide, ref, x, y, width, height, root=".", animate=True,
+              cache_dir=POSTER_CACHE):
+    """Embed the video or animated GIF at `ref`, fitted and centred in the
+    box; returns the new shape.
+
+    A GIF is added as a picture of its original bytes, which PowerPoint
+    animates (with `animate=False`, its poster frame is added instead). A
+    video is added as a movie that shows its poster frame until played;
+    without one, a placeholder poster fills the box. The media and poster
+    are embedded once per package however often they are used.
+    """
+    clip = load_clip(ref, root)
+    if is_gif(clip):
+        png, px_width, px_height = poster_frame(clip, cache_dir)
+        data = clip.data if animate else png
+        return slide.shapes.add_picture(
+            io.BytesIO(data), *fit_box(px_width, px_height, x, y, width, height)
+        )
+    poster = poster_frame(clip, cache_dir)
+    if poster is None:
+        png = placeholder_poster()[0]
+    else:
+        png, px_width, px_height = poster
+        x, y, width, height = fit_box(px_width, px_height, x, y, width, height)
+    return slide.shapes.add_movie(
+        io.BytesIO(clip.data), x, y, width, height,
+        poster_frame_image=io.BytesIO(png), mime_type=clip.mime_type,
+    )
@@ -0,0 +1,307 @@
+"""
+Fast OOXML checks for generated decks.
+
+Parts of the decks are written as raw XML (decks.ir, decks.masters) or
+patched by hand (hyperlinks), and a mistake there does not fail the build:
+PowerPoint "repairs" the file when it is opened. This module reads a saved
+.pptx and checks it against a small, precompiled subset of the
+PresentationML/DrawingML schema plus the package's relationship graph:
+
+- every part has a content type and every internal relationship target
+  exists; relationship ids are unique within each .rels part;
+- every r:id / r:embed / r:link reference is non-empty and resolves in the
+  part's relationships (an empty hlinkClick r:id is only valid on action
+  links such as ppaction://hlinkshowjump);
+- child order, required children and attributes, and value formats of the
+  elements the generators emit (shapes, text bodies, runs, fills, xfrm);
+- shape ids are unique within each slide, layout and master.
+
+XML parts are checked independently, so they are spread across a process
+pool; pass an existing executor to share one across a batch of decks.
+
+    issues = validate_package("cursor_presentation_pro.pptx")
+    check_package("out.pptx")  # raises PackageError listing every issue
+"""
+
+import posixpath
+import re
+import zipfile
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from lxml import etree
+
+_NS = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "ct": "http://schemas.openxmlformats.org/package/2006/content-types",
+    "rel": "http://schemas.openxmlformats.org/package/2006/relationships",
+}
+
+Issue = namedtuple("Issue", "part message")
+
+
+class PackageError(ValueError):
+    """A generated package failed the OOXML checks."""
+
+    def __init__(self, path, issues):
+        self.path = path
+        self.issues = list(issues)
+        super().__init__(
+            f"{path}: " + "; ".join(f"{i.part}: {i.message}" for i in self.issues)
+        )
+
+
+def _clark(name):
+    prefix, local = name.split(":")
+    return "{%s}%s" % (_NS[prefix], local)
+
+
+# =============================================================================
+# SCHEMA SUBSET
+# =============================================================================
+
+_FILL = "a:noFill a:solidFill a:gradFill a:blipFill a:pattFill a:grpFill"
+_EFFECT = "a:effectLst a:effectDag"
+_LONG = r"-?\d+"
+_ULONG = r"\d+"
+
+# element: (child order groups, required children, required attributes,
+#           {attribute: value pattern}). Each order group is a space-separated
+# list of children that may appear at that position; children not listed
+# are outside the subset and ignored.
+_SCHEMA = {
+    "p:sp": (
+        ["p:nvSpPr", "p:spPr", "p:style", "p:txBody", "p:extLst"],
+        ["p:nvSpPr", "p:spPr"], [], {},
+    ),
+    "p:pic": (
+        ["p:nvPicPr", "p:blipFill", "p:spPr", "p:style", "p:extLst"],
+        ["p:nvPicPr", "p:blipFill", "p:spPr"], [], {},
+    ),
+    "p:cNvPr": (
+        ["a:hlinkClick", "a:hlinkHover", "a:extLst"],
+        [], ["id", "name"], {"id": _ULONG},
+    ),
+    "p:spPr": (
+        ["a:xfrm", "a:custGeom a:prstGeom", _FILL, "a:ln", _EFFECT,
+         "a:scene3d", "a:sp3d", "a:extLst"],
+        [], [], {},
+    ),
+    "a:xfrm": (
+        ["a:off", "a:ext", "a:chOff", "a:chExt"], [], [], {"rot": _LONG},
+    ),
+    "a:off": ([], [], ["x", "y"], {"x": _LONG, "y": _LONG}),
+    "a:ext": ([], [], [], {"cx": _ULONG, "cy": _ULONG}),
+    "p:txBody": (
+        ["a:bodyPr", "a:lstStyle", "a:p"], ["a:bodyPr", "a:p"], [], {},
+    ),
+    "a:bodyPr": (
+        ["a:prstTxWarp", "a:noAutofit a:normAutofit a:spAutoFit",
+         "a:scene3d", "a:sp3d", "a:flatTx", "a:extLst"],
+        [], [], {},
+    ),
+    "a:p": (
+        ["a:pPr", "a:r a:br a:fld", "a:endParaRPr"], [], [], {},
+    ),
+    "a:r": (["a:rPr", "a:t"], ["a:t"], [], {}),
+    "a:srgbClr": ([], [], ["val"], {"val": r"[0-9A-Fa-f]{6}"}),
+}
+
+_RUN_PROPERTIES = (
+    ["a:ln", _FILL, _EFFECT, "a:highlight", "a:uLnTx a:uLn", "a:uFillTx a:uFill",
+     "a:latin", "a:ea", "a:cs", "a:sym", "a:hlinkClick", "a:hlinkMouseOver",
+     "a:rtl", "a:extLst"],
+    [], [], {"sz": _ULONG},
+)
+for _name in ("a:rPr", "a:endParaRPr", "a:defRPr"):
+    _SCHEMA[_name] = _RUN_PROPERTIES
+
+Rule = namedtuple("Rule", "name order required_children required_attrs patterns")
+
+
+def _compile(schema):
+    """{clark tag: Rule} with order positions and compiled value patterns."""
+    rules = {}
+    for name, (order, children, attrs, patterns) in schema.items():
+        positions = {}
+        for i, group in enumerate(order):
+            for child in group.split():
+                positions[_clark(child)] = i
+        rules[_clark(name)] = Rule(
+            name,
+            positions,
+            tuple((_clark(c), c) for c in children),
+            tuple(attrs),
+            tuple((attr, re.compile(pattern + r"\Z")) for attr, pattern in patterns.items()),
+        )
+    return rules
+
+
+_RULES = _compile(_SCHEMA)
+_SZ_RANGE = (100, 400000)
+_R_ATTRS = tuple(
+    "{%s}%s" % (_NS["r"], name) for name in ("id", "embed", "link", "pict", "dm", "lo", "qs", "cs")
+)
+_C_NV_PR = _clark("p:cNvPr")
+_HLINK_TAGS = {_clark("a:hlinkClick"), _clark("a:hlinkHover"), _clark("a:hlinkMouseOver")}
+
+
+# =============================================================================
+# PART CHECKS
+# =============================================================================
+
+def _check_element(element, rule, issues, part):
+    last = -1
+    for child in element:
+        position = rule.order.get(child.tag)
+        if position is None:
+            continue
+        if position < last:
+            issues.append(Issue(part, f"{rule.name}: {child.tag.split('}')[1]} out of order"))
+        last = max(last, position)
+    for tag, name in rule.required_children:
+        if element.find(tag) is None:
+            issues.append(Issue(part, f"{rule.name}: missing {name}"))
+    for attr in rule.required_attrs:
+        if element.get(attr) is None:
+            issues.append(Issue(part, f"{rule.name}: missing @{attr}"))
+    for attr, pattern in rule.patterns:
+        value = element.get(attr)
+        if value is not None and not pattern.match(value):
+            issues.append(Issue(part, f"{rule.name}: bad @{attr}={value!r}"))
+    if rule.name in ("a:rPr", "a:endParaRPr", "a:defRPr"):
+        size = element.get("sz")
+        if size is not None and size.isdigit() and not _SZ_RANGE[0] <= int(size) <= _SZ_RANGE[1]:
+            issues.append(Issue(part, f"{rule.name}: font size {size} out of range"))
+
+
+def check_part(task):
+    """Issues of one XML part; `task` is (partname, xml bytes, rIds)."""
+    part, blob, rids = task
+    issues = []
+    try:
+        root = etree.fromstring(blob)
+    except etree.XMLSyntaxError as exc:
+        return [Issue(part, f"not well-formed: {exc}")]
+
+    shape_ids = set()
+    for element in root.iter(tag=etree.Element):
+        rule = _RULES.get(element.tag)
+        if rule is not None:
+            _check_element(element, rule, issues, part)
+        if element.tag == _C_NV_PR:
+            shape_id = element.get("id")
+            if shape_id in shape_ids:
+                issues.append(Issue(part, f"duplicate shape id {shape_id}"))
+            shape_ids.add(shape_id)
+        for attr in _R_ATTRS:
+            rid = element.get(attr)
+            if rid is None:
+                continue
+            if not rid:
+                if element.tag in _HLINK_TAGS and element.get("action"):
+                    continue
+                issues.append(Issue(part, f"empty r:{attr.split('}')[1]} reference"))
+            elif rid not in rids:
+                issues.append(Issue(part, f"dangling relationship {rid}"))
+    return issues
+
+
+# =============================================================================
+# PACKAGE CHECKS
+# =============================================================================
+
+def _source_of(rels_name):
+    directory, name = posixpath.split(rels_name)
+    return posixpath.join(posixpath.dirname(directory), name[: -len(".rels")])
+
+
+def _content_types(zf, issues):
+    root = etree.fromstring(zf.read("[Content_Types].xml"))
+    defaults = {
+        d.get("Extension").lower(): d.get("ContentType")
+        for d in root.iter(_clark("ct:Default"))
+    }
+    overrides = {
+        o.get("PartName").lstrip("/"): o.get("ContentType")
+        for o in root.iter(_clark("ct:Override"))
+    }
+    for name in overrides:
+        if name not in zf.NameToInfo:
+            issues.append(Issue("[Content_Types].xml", f"override for missing part /{name}"))
+    types = {}
+    for name in zf.namelist():
+        if name == "[Content_Types].xml" or name.endswith("/"):
+            continue
+        content_type = overrides.get(name) or defaults.get(name.rsplit(".", 1)[-1].lower())
+        if content_type is None:
+            issues.append(Issue(name, "no content type"))
+        types[name] = content_type
+    return types
+
+
+def _relationships(zf, names, issues):
+    """{source part: set of rIds}, checking ids and internal targets."""
+    rids_by_part = {}
+    for rels_name in names:
+        if not rels_name.endswith(".rels"):
+            continue
+        source = _source_of(rels_name)
+        if source and source not in zf.NameToInfo:
+            issues.append(Issue(rels_name, "relationships of a missing part"))
+        base = posixpath.dirname(source)
+        rids = set()
+        for rel in etree.fromstring(zf.read(rels_name)).iter(_clark("rel:Relationship")):
+            rid = rel.get("Id")
+            if rid in rids:
+                issues.append(Issue(rels_name, f"duplicate relationship id {rid}"))
+            rids.add(rid)
+            if rel.get("TargetMode") == "External":
+                continue
+            target = rel.get("Target", "")
+            target = target.lstrip("/") if target.startswith("/") else posixpath.normpath(
+                posixpath.join(base, target)
+            )
+            if target not in zf.NameToInfo:
+                issues.append(Issue(rels_name, f"{rid} targets missing part /{target}"))
+        rids_by_part[source] = rids
+    return rids_by_part
+
+
+def validate_package(path, workers=None, executor=None):
+    """Every issue found in the .pptx at `path` (an empty list when valid).
+
+    Package-level checks run here; XML parts are checked in `executor`, or
+    in a new pool of `workers` processes (workers=1 checks inline).
+    """
+    issues = []
+    with zipfile.ZipFile(path) as zf:
+        types = _content_types(zf, issues)
+        rids_by_part = _relationships(zf, types, issues)
+        tasks = [
+            (name, zf.read(name), frozenset(rids_by_part.get(name, ())))
+            for name, content_type in types.items()
+            if content_type and content_type.endswith("xml") and not name.endswith(".rels")
+        ]
+
+    if executor is not None:
+        results = executor.map(check_part, tasks, chunksize=8)
+    elif workers == 1:
+        results = map(check_part, tasks)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(check_part, tasks, chunksize=8))
+    for part_issues in results:
+        issues.extend(part_issues)
+    return issues
+
+
+def check_package(path, workers=None, executor=None, name=None):
+    """Raise PackageError if the .pptx at `path` (or a binary file object)
+    has any issue; `name` labels the deck in the error instead of `path`."""
+    issues = validate_package(path, workers, executor)
+    if issues:
+        raise PackageError(name or path, issues)
+    return path
@@ -0,0 +1,318 @@
+"""
+Where decks are written: local files, memory buffers or S3-compatible
+object storage.
+
+Generators save through an Output instead of a hard-coded path, and the
+deck bytes stream straight from python-pptx's zip writer into it:
+
+- LocalOutput("out/deck.pptx") writes a temporary file next to the target
+  and renames it into place, so a finished file is always complete;
+- MemoryOutput() keeps the bytes in memory (`.value`), for tests and for
+  services that send the deck on themselves;
+- S3Output("bucket", "decks/deck.pptx") uploads with S3 multipart upload
+  while the zip is still being written. At most `max_in_flight` parts of
+  `part_size` bytes are buffered at a time and up to `upload_workers` of
+  them upload in parallel. A deck smaller than one part is sent with a
+  single PUT. A failed save aborts the upload, so no partial object is
+  left behind.
+
+`output_for` turns a target string into an Output: "s3://bucket/key" is
+an S3Output, anything else a LocalOutput. S3 uses boto3 (imported on first
+use) with its usual configuration. Set AWS_ENDPOINT_URL to point it at
+MinIO or another S3-compatible server, or pass any object with the boto3
+client methods used here as `client`.
+
+    output = save_presentation(prs, "s3://reports/2025-06/acme.pptx")
+    print(output.size)
+
+Media that is compressed already (JPEG, PNG, GIF, video, audio) is stored
+in the zip as-is rather than deflated again, which costs CPU for a
+fraction of a percent; XML parts are still deflated. See
+`write_package`.
+"""
+
+import io
+import os
+import threading
+import uuid
+from contextlib import contextmanager
+
+PART_SIZE = 8 << 20
+MAX_IN_FLIGHT = 4
+UPLOAD_WORKERS = 4
+# Part extensions written to the zip without (re)compression
+STORED_EXTENSIONS = frozenset(
+    ("jpg", "jpeg", "png", "gif", "mp4", "m4v", "mov", "webm", "wmv", "mp3", "m4a")
+)
+
+
+def is_remote(target):
+    """True if `target` names object storage rather than a local path."""
+    return isinstance(target, str) and target.startswith("s3://")
+
+
+def output_for(target):
+    """The Output for `target`: an Output, "s3://bucket/key" or a local path."""
+    if not isinstance(target, str):
+        return target
+    if is_remote(target):
+        bucket, _, key = target[len("s3://"):].partition("/")
+        if not bucket or not key:
+            raise ValueError(f"expected s3://bucket/key, got {target!r}")
+        return S3Output(bucket, key)
+    return LocalOutput(target)
+
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" '
+    'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>%s</Types>'
+)
+
+
+def write_package(prs, stream):
+    """Write `prs` to the binary `stream` as a .pptx zip.
+
+    The parts and relationships are python-pptx's own, as `prs.save` writes
+    them; every part gets an explicit content type, and parts with
+    STORED_EXTENSIONS are stored rather than deflated.
+    """
+    import zipfile
+    from xml.sax.saxutils import quoteattr
+
+    package = prs.part.package
+    parts = list(package.iter_parts())
+    overrides = "".join(
+        '<Override PartName=%s ContentType=%s/>'
+        % (quoteattr(part.partname), quoteattr(part.content_type))
+        for part in parts
+    )
+    with zipfile.ZipFile(stream, "w", zipfile.ZIP_DEFLATED, strict_timestamps=False) as zf:
+        zf.writestr("[Content_Types].xml", _CONTENT_TYPES % overrides)
+        zf.writestr("_rels/.rels", package._rels.xml)
+        for part in parts:
+            stored = part.partname.ext.lower() in STORED_EXTENSIONS
+            zf.writestr(
+                part.partname.membername, part.blob,
+                compress_type=zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED,
+            )
+            if len(part.rels):
+                zf.writestr(part.partname.rels_uri.membername, part.rels.xml)
+
+
+def save_presentation(prs, target, check=False):
+    """Stream `prs` into the output for `target`; returns the Output.
+
+    With `check`, the written package is run through the decks.ooxml checks
+    before it is published, and a deck with issues raises PackageError and
+    is not published.
+    """
+    output = output_for(target)
+    verify = None
+    if check:
+        from decks.ooxml import check_package
+
+        def verify(package):
+            check_package(package, workers=1, name=str(output))
+
+    with output.open(verify) as stream:
+        write_package(prs, stream)
+    return output
+
+
+class LocalOutput:
+    """A file on local disk, written atomically."""
+
+    def __init__(self, path):
+        self.path = path
+        self.size = None
+
+    def __str__(self):
+        return self.path
+
+    @contextmanager
+    def open(self, verify=None):
+        """Stream to write the deck into; `verify(path)` may reject the
+        complete file (by raising) before it replaces the target."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                yield f
+            if verify is not None:
+                verify(tmp_path)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self.size = os.path.getsize(self.path)
+
+
+class MemoryOutput:
+    """An in-memory buffer; the deck bytes end up in `.value`."""
+
+    def __init__(self, name="memory"):
+        self.name = name
+        self.value = None
+        self.size = None
+
+    def __str__(self):
+        return self.name
+
+    @contextmanager
+    def open(self, verify=None):
+        buffer = io.BytesIO()
+        yield buffer
+        if verify is not None:
+            verify(buffer)
+        self.value = buffer.getvalue()
+        self.size = len(self.value)
+
+
+class S3Output:
+    """An object in S3-compatible storage, written with multipart upload."""
+
+    def __init__(self, bucket, key, client=None, part_size=PART_SIZE,
+                 max_in_flight=MAX_IN_FLIGHT, upload_workers=UPLOAD_WORKERS):
+        self.bucket = bucket
+        self.key = key
+        self.client = client
+        self.part_size = part_size
+        self.max_in_flight = max_in_flight
+        self.upload_workers = upload_workers
+        self.size = None
+
+    def __str__(self):
+        return f"s3://{self.bucket}/{self.key}"
+
+    def _client(self):
+        if self.client is None:
+            try:
+                import boto3
+            except ImportError as exc:
+                raise ImportError("writing to s3:// needs boto3 (pip install boto3)") from exc
+            self.client = boto3.client("s3")
+        return self.client
+
+    @contextmanager
+    def open(self, verify=None):
+        """Stream that uploads while it is written. With `verify`, the deck
+        is spooled to a temporary file and verified before any upload."""
+        if verify is not None:
+            import shutil
+            import tempfile
+
+            with tempfile.TemporaryFile() as spool:
+                yield spool
+                verify(spool)
+                spool.seek(0)
+                with self.open() as writer:
+                    shutil.copyfileobj(spool, writer, self.part_size)
+            return
+        writer = _MultipartWriter(self, self._client())
+        try:
+            yield writer
+            writer.finish()
+        except BaseException:
+            writer.abort()
+            raise
+        self.size = writer.size
+
+
+class _MultipartWriter(io.RawIOBase):
+    """Write-only stream that uploads every `part_size` bytes as one part.
+
+    Not seekable: zipfile notices and writes data descriptors instead of
+    seeking back to patch local headers.
+    """
+
+    def __init__(self, output, client):
+        from concurrent.futures import ThreadPoolExecutor
+
+        super().__init__()
+        self._output = output
+        self._client = client
+        self._buffer = bytearray()
+        self._upload_id = None
+        self._futures = []
+        self._slots = threading.BoundedSemaphore(output.max_in_flight)
+        self._pool = ThreadPoolExecutor(
+            max_workers=output.upload_workers, thread_name_prefix="s3-part"
+        )
+        self.size = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._buffer += data
+        self.size += len(data)
+        part_size = self._output.part_size
+        while len(self._buffer) >= part_size:
+            self._send(bytes(self._buffer[:part_size]))
+            del self._buffer[:part_size]
+        return len(data)
+
+    def _send(self, body):
+        output = self._output
+        if self._upload_id is None:
+            self._upload_id = self._client.create_multipart_upload(
+                Bucket=output.bucket, Key=output.key
+            )["UploadId"]
+        # Blocks the zip writer while max_in_flight parts are still uploading
+        self._slots.acquire()
+        for future in self._futures:
+            if future.done() and future.exception() is not None:
+                self._slots.release()
+                raise future.exception()
+        self._futures.append(
+            self._pool.submit(self._upload_part, len(self._futures) + 1, body)
+        )
+
+    def _upload_part(self, number, body):
+        output = self._output
+        try:
+            response = self._client.upload_part(
+                Bucket=output.bucket, Key=output.key, UploadId=self._upload_id,
+                PartNumber=number, Body=body,
+            )
+            return {"PartNumber": number, "ETag": response["ETag"]}
+        finally:
+            self._slots.release()
+
+    def finish(self):
+        output = self._output
+        try:
+            if self._upload_id is None:
+                self._client.put_object(
+                    Bucket=output.bucket, Key=output.key, Body=bytes(self._buffer)
+                )
+                return
+            if self._buffer:
+                self._send(bytes(self._buffer))
+                self._buffer.clear()
+            parts = [future.result() for future in self._futures]
+            self._client.complete_multipart_upload(
+                Bucket=output.bucket, Key=output.key, UploadId=self._upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        finally:
+            self._pool.shutdown()
+
+    def abort(self):
+        self._pool.shutdown(cancel_futures=True)
+        if self._upload_id is not None:
+            output = self._output
+            try:
+                self._client.abort_multipart_upload(
+                    Bucket=output.bucket, Key=output.key, UploadId=self._upload_id
+                )
+            except Exception:
+                # Best effort: the save's own error is the one worth raising,
+                # and bucket lifecycle rules clean up stale uploads anyway
+                pass
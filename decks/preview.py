@@ -0,0 +1,627 @@
+"""
+HTML previews of slides, rendered straight from their XML.
+
+A preview does not need PowerPoint or LibreOffice. Each shape becomes an
+absolutely positioned element, placed and sized in container query units
+(`cqw`, hundredths of the slide width). The browser does the text layout,
+and the preview scales to any width. What is drawn:
+
+- the slide background, and the non-placeholder shapes of its layout and
+  master (the chrome of decks.masters: accent rule, slide number);
+- autoshapes with solid fills, outlines, corner radius, rotation, and clip
+  paths for the common arrows and polygons; text boxes; pictures; tables;
+  connectors as straight lines; group shapes;
+- text with the usual inheritance: run, paragraph, shape list style,
+  layout and master placeholders, then the master text styles and theme
+  colors and fonts. Slide number fields show the slide's number.
+
+Charts are drawn as labelled boxes. Gradients use their first stop, and
+effects and 3-D are ignored. This is an editing preview, not a
+pixel-exact render.
+
+    html = render_slide(prs.slides[0], number=1)
+    page = f"<style>{PREVIEW_CSS}</style>{html}"
+
+decks.watch pushes these fragments to the browser while a deck is edited.
+"""
+
+import base64
+import colorsys
+import html
+from functools import lru_cache
+
+_A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+_P = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+_R = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+
+_RT_THEME = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/theme"
+
+PREVIEW_CSS = """
+.slide{position:relative;container-type:inline-size;overflow:hidden;
+  font-family:Calibri,Carlito,"Segoe UI",Arial,sans-serif}
+.slide .sp{position:absolute;box-sizing:border-box}
+.slide .tx{position:absolute;inset:0;display:flex;flex-direction:column}
+.slide .tx p{margin:0;white-space:pre-wrap;overflow-wrap:break-word;line-height:1.2}
+.slide .tx a{color:inherit}
+.slide img.sp{object-fit:fill}
+.slide svg.sp{overflow:visible}
+.slide table.sp{border-collapse:collapse;table-layout:fixed}
+.slide table.sp td{position:relative;vertical-align:top;padding:0}
+.slide .chart{display:flex;align-items:center;justify-content:center;
+  border:1px dashed #888;color:#888;font-size:1.5cqw}
+"""
+
+_ALIGN = {"l": "left", "ctr": "center", "r": "right", "just": "justify", "dist": "justify"}
+_ANCHOR = {"t": "flex-start", "ctr": "center", "b": "flex-end"}
+_TITLE_TYPES = {"title", "ctrTitle"}
+
+# clip-path outlines of preset geometries with their default adjustments
+_CLIP = {
+    "rightArrow": "polygon(0 25%,70% 25%,70% 0,100% 50%,70% 100%,70% 75%,0 75%)",
+    "leftArrow": "polygon(100% 25%,30% 25%,30% 0,0 50%,30% 100%,30% 75%,100% 75%)",
+    "upArrow": "polygon(25% 100%,25% 30%,0 30%,50% 0,100% 30%,75% 30%,75% 100%)",
+    "downArrow": "polygon(25% 0,25% 70%,0 70%,50% 100%,100% 70%,75% 70%,75% 0)",
+    "triangle": "polygon(50% 0,100% 100%,0 100%)",
+    "rtTriangle": "polygon(0 0,100% 100%,0 100%)",
+    "diamond": "polygon(50% 0,100% 50%,50% 100%,0 50%)",
+    "chevron": "polygon(0 0,75% 0,100% 50%,75% 100%,0 100%,25% 50%)",
+    "homePlate": "polygon(0 0,80% 0,100% 50%,80% 100%,0 100%)",
+    "parallelogram": "polygon(25% 0,100% 0,75% 100%,0 100%)",
+    "trapezoid": "polygon(25% 0,75% 0,100% 100%,0 100%)",
+    "pentagon": "polygon(50% 0,100% 38%,81% 100%,19% 100%,0 38%)",
+    "hexagon": "polygon(25% 0,75% 0,100% 50%,75% 100%,25% 100%,0 50%)",
+}
+
+# Identity group transform: (offset x, offset y, scale x, scale y)
+_IDENTITY = (0, 0, 1.0, 1.0)
+
+
+@lru_cache(maxsize=8)
+def _theme(blob):
+    """(colors, fonts) of a theme part: {"accent1": "4F81BD", ...} and
+    {"major": typeface, "minor": typeface}."""
+    from lxml import etree
+
+    root = etree.fromstring(blob)
+    colors = {}
+    scheme = root.find(f"{_A}themeElements/{_A}clrScheme")
+    for entry in scheme if scheme is not None else ():
+        value = entry[0].get("val") if entry[0].tag == _A + "srgbClr" else entry[0].get("lastClr")
+        colors[entry.tag[len(_A):]] = value or "000000"
+    fonts = {}
+    for kind in ("major", "minor"):
+        latin = root.find(f"{_A}themeElements/{_A}fontScheme/{_A}{kind}Font/{_A}latin")
+        fonts[kind] = latin.get("typeface") if latin is not None else "Calibri"
+    return colors, fonts
+
+
+def _modified(rgb, color):
+    """Apply the lumMod/lumOff/shade/tint/alpha children of `color` to `rgb`."""
+    r, g, b = (int(rgb[i:i + 2], 16) / 255 for i in (0, 2, 4))
+    alpha = 1.0
+    for mod in color:
+        name = mod.tag[len(_A):]
+        value = int(mod.get("val", "100000")) / 100000
+        if name in ("lumMod", "lumOff"):
+            h, l, s = colorsys.rgb_to_hls(r, g, b)
+            l = min(1.0, l * value if name == "lumMod" else l + value)
+            r, g, b = colorsys.hls_to_rgb(h, l, s)
+        elif name == "shade":
+            r, g, b = r * value, g * value, b * value
+        elif name == "tint":
+            r, g, b = (c + (1 - c) * (1 - value) for c in (r, g, b))
+        elif name == "alpha":
+            alpha = value
+    r, g, b = (round(min(max(c, 0.0), 1.0) * 255) for c in (r, g, b))
+    if alpha < 1:
+        return f"rgba({r},{g},{b},{alpha:.2f})"
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def _first_attr(elements, name):
+    for element in elements:
+        if element is not None and element.get(name) is not None:
+            return element.get(name)
+    return None
+
+
+def _first_child(elements, *tags):
+    for element in elements:
+        if element is None:
+            continue
+        for child in element:
+            if child.tag in tags:
+                return child
+    return None
+
+
+def _placeholder_type(ph):
+    return ph.get("type", "body")
+
+
+def _find_placeholder(root, ph, by_idx):
+    """The sp of `root` (layout or master) that placeholder `ph` inherits from."""
+    kind = _placeholder_type(ph)
+    idx = ph.get("idx")
+    if not by_idx and kind not in _TITLE_TYPES | {"dt", "ftr", "sldNum"}:
+        kind = "body"
+    by_type = None
+    for sp in root.iter(_P + "sp"):
+        other = sp.find(f"{_P}nvSpPr/{_P}nvPr/{_P}ph")
+        if other is None:
+            continue
+        if by_idx and idx is not None and other.get("idx") == idx:
+            return sp
+        other_kind = _placeholder_type(other)
+        if other_kind == kind or (kind in _TITLE_TYPES and other_kind in _TITLE_TYPES):
+            by_type = by_type if by_type is not None else sp
+    return by_type
+
+
+class _SlideRenderer:
+    def __init__(self, slide, number):
+        layout = slide.slide_layout
+        master = layout.slide_master
+        self.slide = slide
+        self.layout = layout
+        self.master = master
+        self.number = number
+        self.width = slide.part.package.presentation_part.presentation.slide_width
+        self.colors, self.fonts = _theme(master.part.part_related_by(_RT_THEME).blob)
+        clr_map = master._element.find(_P + "clrMap")
+        self.clr_map = dict(clr_map.attrib) if clr_map is not None else {}
+        self.part = slide.part
+        self.images = {}
+
+    # ----- units, colors, fills -----
+
+    def cqw(self, emu):
+        return f"{emu * 100 / self.width:.3f}cqw"
+
+    def pt(self, hundredths):
+        # sz and spcPts are in hundredths of a point; 12700 EMU per point
+        return self.cqw(int(hundredths) * 127)
+
+    def color(self, parent):
+        """CSS color of the first color child of `parent`, or None."""
+        if parent is None:
+            return None
+        for color in parent:
+            tag = color.tag[len(_A):]
+            if tag == "srgbClr":
+                rgb = color.get("val")
+            elif tag == "schemeClr":
+                name = color.get("val")
+                rgb = self.colors.get(self.clr_map.get(name, name), "000000")
+            elif tag == "sysClr":
+                rgb = color.get("lastClr", "000000")
+            elif tag == "prstClr":
+                return color.get("val")
+            else:
+                continue
+            return _modified(rgb, color)
+        return None
+
+    def fill(self, sp_pr, style=None):
+        fill = _first_child([sp_pr], _A + "solidFill", _A + "noFill", _A + "gradFill")
+        if fill is not None:
+            if fill.tag == _A + "noFill":
+                return None
+            if fill.tag == _A + "gradFill":
+                return self.color(fill.find(f"{_A}gsLst/{_A}gs"))
+            return self.color(fill)
+        if style is not None:
+            ref = style.find(_A + "fillRef")
+            if ref is not None and ref.get("idx", "0") != "0":
+                return self.color(ref)
+        return None
+
+    def line(self, sp_pr, style=None):
+        """(css color, width in EMU) of the outline, or None."""
+        ln = sp_pr.find(_A + "ln") if sp_pr is not None else None
+        width = int(ln.get("w", 9525)) if ln is not None else 9525
+        fill = _first_child([ln], _A + "solidFill", _A + "noFill", _A + "gradFill")
+        if fill is not None:
+            if fill.tag == _A + "noFill":
+                return None
+            if fill.tag == _A + "gradFill":
+                return self.color(fill.find(f"{_A}gsLst/{_A}gs")), width
+            return self.color(fill), width
+        if style is not None:
+            ref = style.find(_A + "lnRef")
+            if ref is not None and ref.get("idx", "0") != "0":
+                return self.color(ref), width
+        return None
+
+    def background(self):
+        for owner in (self.slide, self.layout, self.master):
+            bg = owner._element.find(f"{_P}cSld/{_P}bg")
+            if bg is None:
+                continue
+            bg_pr = bg.find(_P + "bgPr")
+            if bg_pr is not None:
+                return self.fill(bg_pr) or "#ffffff"
+            ref = bg.find(_P + "bgRef")
+            if ref is not None:
+                return self.color(ref) or "#ffffff"
+        return "#ffffff"
+
+    # ----- geometry -----
+
+    @staticmethod
+    def xfrm(element):
+        """(x, y, cx, cy, rot, flipH, flipV) of a shape, or None if it has no
+        a:xfrm/p:xfrm of its own."""
+        for path in (f"{_P}spPr/{_A}xfrm", f"{_P}grpSpPr/{_A}xfrm", f"{_P}xfrm"):
+            xfrm = element.find(path)
+            if xfrm is not None:
+                break
+        else:
+            return None
+        off, ext = xfrm.find(_A + "off"), xfrm.find(_A + "ext")
+        if off is None or ext is None:
+            return None
+        return (
+            int(off.get("x")), int(off.get("y")), int(ext.get("cx")), int(ext.get("cy")),
+            int(xfrm.get("rot", 0)) / 60000, xfrm.get("flipH") == "1", xfrm.get("flipV") == "1",
+        )
+
+    def box(self, frame, geometry):
+        ox, oy, sx, sy = frame
+        x, y, cx, cy, rot = geometry[:5]
+        style = (
+            f"left:{self.cqw(ox + x * sx)};top:{self.cqw(oy + y * sy)};"
+            f"width:{self.cqw(cx * sx)};height:{self.cqw(cy * sy)}"
+        )
+        if rot:
+            style += f";transform:rotate({rot:g}deg)"
+        return style
+
+    # ----- text -----
+
+    def text_styles(self, sp, inherited, kind):
+        """The list-style and bodyPr chains of shape `sp`: its own, those of
+        the `inherited` placeholders, then the master text style for `kind`
+        ("title", "body" or "other")."""
+        styles = [sp.find(f"{_P}txBody/{_A}lstStyle")]
+        bodies = [sp.find(f"{_P}txBody/{_A}bodyPr")]
+        for source in inherited:
+            styles.append(source.find(f"{_P}txBody/{_A}lstStyle"))
+            bodies.append(source.find(f"{_P}txBody/{_A}bodyPr"))
+        styles.append(self.master._element.find(f"{_P}txStyles/{_P}{kind}Style"))
+        return styles, bodies
+
+    def inherited(self, sp):
+        """Layout and master placeholders behind placeholder `sp`, nearest first."""
+        ph = sp.find(f"{_P}nvSpPr/{_P}nvPr/{_P}ph")
+        if ph is None or self.part is not self.slide.part:
+            return []
+        found = []
+        layout_sp = _find_placeholder(self.layout._element, ph, by_idx=True)
+        if layout_sp is not None:
+            found.append(layout_sp)
+        master_sp = _find_placeholder(self.master._element, ph, by_idx=False)
+        if master_sp is not None:
+            found.append(master_sp)
+        return found
+
+    def text(self, tx_body, styles, bodies, font_color=None):
+        anchor = _first_attr(bodies, "anchor") or "t"
+        insets = [
+            int(_first_attr(bodies, name) or default)
+            for name, default in (("tIns", 45720), ("rIns", 91440), ("bIns", 45720), ("lIns", 91440))
+        ]
+        scale = 1.0
+        autofit = _first_child(bodies, _A + "normAutofit")
+        if autofit is not None:
+            scale = int(autofit.get("fontScale", 100000)) / 100000
+        style = (
+            f"padding:{' '.join(self.cqw(i) for i in insets)};"
+            f"justify-content:{_ANCHOR.get(anchor, 'flex-start')}"
+        )
+        if (_first_attr(bodies, "wrap") or "square") == "none":
+            style += ";white-space:nowrap"
+        paragraphs = "".join(
+            self.paragraph(p, styles, font_color, scale) for p in tx_body.iter(_A + "p")
+        )
+        return f'<div class="tx" style="{style}">{paragraphs}</div>'
+
+    def paragraph(self, p, styles, font_color, scale):
+        p_pr = p.find(_A + "pPr")
+        level = int(p_pr.get("lvl", 0)) if p_pr is not None else 0
+        level_tag = f"{_A}lvl{level + 1}pPr"
+        # Positional: the last entry is always the master text style
+        p_prs = [p_pr] + [s.find(level_tag) if s is not None else None for s in styles]
+        def_rprs = [e.find(_A + "defRPr") if e is not None else None for e in p_prs]
+
+        css = [f"text-align:{_ALIGN.get(_first_attr(p_prs, 'algn') or 'l', 'left')}"]
+        margin = _first_attr(p_prs, "marL")
+        indent = _first_attr(p_prs, "indent")
+        if margin and int(margin):
+            css.append(f"padding-left:{self.cqw(int(margin))}")
+        if indent and int(indent):
+            css.append(f"text-indent:{self.cqw(int(indent))}")
+        for tag, prop in (("spcBef", "margin-top"), ("spcAft", "margin-bottom")):
+            spacing = _first_child(p_prs, _A + tag)
+            if spacing is not None and len(spacing):
+                value = int(spacing[0].get("val", 0))
+                if spacing[0].tag == _A + "spcPts":
+                    css.append(f"{prop}:{self.pt(value * scale)}")
+                else:
+                    css.append(f"{prop}:{value / 100000:.2f}em")
+        line_spacing = _first_child(p_prs, _A + "lnSpc")
+        if line_spacing is not None and len(line_spacing):
+            value = int(line_spacing[0].get("val", 100000))
+            if line_spacing[0].tag == _A + "spcPts":
+                css.append(f"line-height:{self.pt(value)}")
+            else:
+                css.append(f"line-height:{value / 100000 * 1.2:.3f}")
+
+        runs = []
+        bullet = _first_child(p_prs, _A + "buChar", _A + "buNone", _A + "buAutoNum")
+        has_text = any(t.text for t in p.iter(_A + "t"))
+        if bullet is not None and bullet.tag == _A + "buChar" and has_text:
+            runs.append(f"{html.escape(bullet.get('char', '•'))} ")
+        for child in p:
+            tag = child.tag[len(_A):]
+            if tag == "br":
+                runs.append("<br>")
+            elif tag in ("r", "fld"):
+                text = child.findtext(_A + "t") or ""
+                if tag == "fld" and child.get("type") == "slidenum" and self.number is not None:
+                    text = str(self.number)
+                runs.append(self.run(child.find(_A + "rPr"), def_rprs, text, font_color, scale))
+        if not has_text:
+            # Empty paragraphs keep their height
+            end = p.find(_A + "endParaRPr")
+            runs.append(self.run(end, def_rprs, " ", font_color, scale))
+        return f'<p style="{";".join(css)}">{"".join(runs)}</p>'
+
+    def run(self, r_pr, def_rprs, text, font_color, scale):
+        chain = [r_pr] + def_rprs
+        size = int(_first_attr(chain, "sz") or 1800) * scale
+        css = [f"font-size:{self.pt(size)}"]
+        if _first_attr(chain, "b") in ("1", "true"):
+            css.append("font-weight:bold")
+        if _first_attr(chain, "i") in ("1", "true"):
+            css.append("font-style:italic")
+        if (_first_attr(chain, "u") or "none") != "none":
+            css.append("text-decoration:underline")
+        # A shape style's font color sits between the shape's own list
+        # styles and the master text styles (the last entry of the chain)
+        fill = _first_child(chain[:-1], _A + "solidFill")
+        if fill is None and font_color is None:
+            fill = _first_child(chain[-1:], _A + "solidFill")
+        color = self.color(fill) if fill is not None else font_color
+        css.append(f"color:{color or self.color_named('tx1')}")
+        latin = _first_child(chain, _A + "latin")
+        if latin is not None:
+            face = latin.get("typeface", "")
+            face = {"+mn-lt": self.fonts["minor"], "+mj-lt": self.fonts["major"]}.get(face, face)
+            css.append(f"font-family:'{face}',Carlito,Arial,sans-serif")
+        content = f'<span style="{";".join(css)}">{html.escape(text)}</span>'
+        link = r_pr.find(_A + "hlinkClick") if r_pr is not None else None
+        if link is not None:
+            target = self.link_target(link.get(_R + "id"))
+            if target:
+                tooltip = html.escape(link.get("tooltip", ""), quote=True)
+                content = (
+                    f'<a href="{html.escape(target, quote=True)}" title="{tooltip}" '
+                    f'target="_blank" rel="noopener">{content}</a>'
+                )
+        return content
+
+    def color_named(self, name):
+        rgb = self.colors.get(self.clr_map.get(name, name), "000000")
+        return f"#{rgb.lower()}"
+
+    def link_target(self, r_id):
+        try:
+            rel = self.part.rels[r_id]
+        except KeyError:
+            return None
+        return rel.target_ref if rel.is_external else None
+
+    # ----- shapes -----
+
+    def shapes(self, tree, frame=_IDENTITY):
+        out = []
+        for element in tree:
+            tag = element.tag[len(_P):] if element.tag.startswith(_P) else ""
+            if tag == "sp":
+                out.append(self.sp(element, frame))
+            elif tag == "pic":
+                out.append(self.pic(element, frame))
+            elif tag == "cxnSp":
+                out.append(self.connector(element, frame))
+            elif tag == "graphicFrame":
+                out.append(self.graphic_frame(element, frame))
+            elif tag == "grpSp":
+                out.append(self.group(element, frame))
+        return "".join(out)
+
+    def sp(self, sp, frame):
+        ph = sp.find(f"{_P}nvSpPr/{_P}nvPr/{_P}ph")
+        inherited = self.inherited(sp)
+        geometry = self.xfrm(sp)
+        for source in inherited:
+            if geometry is not None:
+                break
+            geometry = self.xfrm(source)
+        if geometry is None:
+            return ""
+        sp_pr = sp.find(_P + "spPr")
+        style_el = sp.find(_P + "style")
+        css = [self.box(frame, geometry)]
+        fill = self.fill(sp_pr, style_el)
+        if fill is None:
+            for source in inherited:
+                fill = self.fill(source.find(_P + "spPr"))
+                if fill is not None:
+                    break
+        if fill:
+            css.append(f"background:{fill}")
+        line = self.line(sp_pr, style_el)
+        if line is not None and line[0]:
+            css.append(f"border:{self.cqw(line[1])} solid {line[0]}")
+        geom = sp_pr.find(_A + "prstGeom") if sp_pr is not None else None
+        preset = geom.get("prst") if geom is not None else "rect"
+        if preset == "roundRect":
+            adj = geom.find(f"{_A}avLst/{_A}gd")
+            ratio = int(adj.get("fmla", "val 16667").split()[-1]) if adj is not None else 16667
+            css.append(f"border-radius:{self.cqw(min(geometry[2:4]) * ratio // 100000)}")
+        elif preset in ("ellipse", "flowChartConnector"):
+            css.append("border-radius:50%")
+        elif preset in _CLIP:
+            css.append(f"clip-path:{_CLIP[preset]}")
+
+        body = ""
+        tx_body = sp.find(_P + "txBody")
+        if tx_body is not None:
+            if ph is None:
+                kind = "other"
+            else:
+                kind = "title" if _placeholder_type(ph) in _TITLE_TYPES else "body"
+            styles, bodies = self.text_styles(sp, inherited, kind)
+            font_ref = style_el.find(_A + "fontRef") if style_el is not None else None
+            body = self.text(tx_body, styles, bodies, self.color(font_ref))
+        return f'<div class="sp" style="{";".join(css)}">{body}</div>'
+
+    def pic(self, pic, frame):
+        geometry = self.xfrm(pic)
+        blip = pic.find(f"{_P}blipFill/{_A}blip")
+        if geometry is None or blip is None:
+            return ""
+        r_id = blip.get(_R + "embed")
+        if r_id is None and blip.get(_R + "link"):
+            # Linked draft media (decks.media): point the browser at the file or URL
+            rel = self.part.rels.get(blip.get(_R + "link"))
+            if rel is None or not rel.is_external:
+                return ""
+            src = html.escape(rel.target_ref, quote=True)
+            return f'<img class="sp" style="{self.box(frame, geometry)}" src="{src}" alt="">'
+        src = self.images.get((self.part, r_id))
+        if src is None:
+            try:
+                image = self.part.related_part(r_id)
+            except KeyError:
+                return ""
+            data = base64.b64encode(image.blob).decode("ascii")
+            src = self.images[self.part, r_id] = f"data:{image.content_type};base64,{data}"
+        return f'<img class="sp" style="{self.box(frame, geometry)}" src="{src}" alt="">'
+
+    def connector(self, cxn, frame):
+        geometry = self.xfrm(cxn)
+        if geometry is None:
+            return ""
+        line = self.line(cxn.find(_P + "spPr"), cxn.find(_P + "style"))
+        if line is None:
+            return ""
+        color, width = line
+        _, _, _, _, _, flip_h, flip_v = geometry
+        x1, x2 = (100, 0) if flip_h else (0, 100)
+        y1, y2 = (100, 0) if flip_v else (0, 100)
+        stroke = max(width * 96 / 914400, 1)
+        return (
+            f'<svg class="sp" style="{self.box(frame, geometry)}" viewBox="0 0 100 100" '
+            f'preserveAspectRatio="none"><line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" '
+            f'stroke="{color}" stroke-width="{stroke:.1f}" vector-effect="non-scaling-stroke"/></svg>'
+        )
+
+    def graphic_frame(self, frame_el, frame):
+        geometry = self.xfrm(frame_el)
+        if geometry is None:
+            return ""
+        data = frame_el.find(f"{_A}graphic/{_A}graphicData")
+        table = data.find(_A + "tbl") if data is not None else None
+        if table is None:
+            label = "chart" if data is not None and data.get("uri", "").endswith("/chart") else "object"
+            return f'<div class="sp chart" style="{self.box(frame, geometry)}">{label}</div>'
+        from lxml import etree
+
+        sx, sy = frame[2], frame[3]
+        styles = [None, self.master._element.find(f"{_P}txStyles/{_P}otherStyle")]
+        columns = "".join(
+            f'<col style="width:{self.cqw(int(col.get("w")) * sx)}">'
+            for col in table.iter(_A + "gridCol")
+        )
+        rows = []
+        for tr in table.iter(_A + "tr"):
+            cells = []
+            for tc in tr.iter(_A + "tc"):
+                if tc.get("hMerge") == "1" or tc.get("vMerge") == "1":
+                    continue
+                tc_pr = tc.find(_A + "tcPr")
+                css = []
+                fill = self.fill(tc_pr)
+                if fill:
+                    css.append(f"background:{fill}")
+                spans = "".join(
+                    f' {attr.lower()}="{tc.get(attr)}"' for attr in ("gridSpan", "rowSpan")
+                    if tc.get(attr)
+                ).replace("gridspan", "colspan")
+                bodies = []
+                if tc_pr is not None:
+                    # Cell margins and anchor, in the shape of a bodyPr
+                    bodies.append(etree.Element(_A + "bodyPr", {
+                        "lIns": tc_pr.get("marL", "91440"), "rIns": tc_pr.get("marR", "91440"),
+                        "tIns": tc_pr.get("marT", "45720"), "bIns": tc_pr.get("marB", "45720"),
+                        "anchor": tc_pr.get("anchor", "t"),
+                    }))
+                tx_body = tc.find(_A + "txBody")
+                styles[0] = tx_body.find(_A + "lstStyle") if tx_body is not None else None
+                text = self.text(tx_body, styles, bodies) if tx_body is not None else ""
+                cells.append(f'<td style="{";".join(css)}"{spans}>{text}</td>')
+            rows.append(f'<tr style="height:{self.cqw(int(tr.get("h", 0)) * sy)}">{"".join(cells)}</tr>')
+        return (
+            f'<table class="sp" style="{self.box(frame, geometry)}">'
+            f'<colgroup>{columns}</colgroup>{"".join(rows)}</table>'
+        )
+
+    def group(self, grp, frame):
+        xfrm = grp.find(f"{_P}grpSpPr/{_A}xfrm")
+        if xfrm is None:
+            return self.shapes(grp, frame)
+        off, ext = xfrm.find(_A + "off"), xfrm.find(_A + "ext")
+        ch_off, ch_ext = xfrm.find(_A + "chOff"), xfrm.find(_A + "chExt")
+        if off is None or ext is None or ch_off is None or ch_ext is None:
+            return self.shapes(grp, frame)
+        gsx = int(ext.get("cx")) / (int(ch_ext.get("cx")) or 1)
+        gsy = int(ext.get("cy")) / (int(ch_ext.get("cy")) or 1)
+        gox = int(off.get("x")) - int(ch_off.get("x")) * gsx
+        goy = int(off.get("y")) - int(ch_off.get("y")) * gsy
+        ox, oy, sx, sy = frame
+        return self.shapes(grp, (ox + gox * sx, oy + goy * sy, sx * gsx, sy * gsy))
+
+    def chrome(self, owner):
+        """Non-placeholder shapes of a layout or master, drawn in its own part."""
+        tree = owner._element.find(f"{_P}cSld/{_P}spTree")
+        drawn = [
+            element for element in tree
+            if element.find(f"./*/{_P}nvPr/{_P}ph") is None
+        ]
+        self.part = owner.part
+        try:
+            return self.shapes(drawn)
+        finally:
+            self.part = self.slide.part
+
+    def render(self):
+        slide_el = self.slide._element
+        height = self.slide.part.package.presentation_part.presentation.slide_height
+        parts = []
+        if slide_el.get("showMasterSp") != "0":
+            if self.layout._element.get("showMasterSp") != "0":
+                parts.append(self.chrome(self.master))
+            parts.append(self.chrome(self.layout))
+        parts.append(self.shapes(slide_el.find(f"{_P}cSld/{_P}spTree")))
+        return (
+            f'<div class="slide" style="aspect-ratio:{self.width}/{height};'
+            f'background:{self.background()}">{"".join(parts)}</div>'
+        )
+
+
+def render_slide(slide, number=None):
+    """HTML fragment previewing the python-pptx `slide` (see PREVIEW_CSS).
+    `number` fills slide number fields."""
+    return _SlideRenderer(slide, number).render()
@@ -0,0 +1,253 @@
+"""
+Structured progress events and rolling throughput stats.
+
+Generators report what they do through the current ProgressReporter
+instead of printing: a deck run emits "deck_started" and "deck_finished"
+(with duration, bytes written and per-slide timings), batch runners add
+"deck_failed" and periodic "stats" events. Each event is a flat dict
+delivered to the reporter's sinks: JsonLinesSink (one JSON object per
+line, for log shippers and dashboards), TextSink (short human-readable
+lines) or any callable.
+
+    with deck_run(output_path) as deck:
+        with deck.slide("Title"):
+            create_title_slide(prs, ...)
+        deck.saved(save_presentation(prs, output_path))
+
+The reporter keeps rolling stats over the events it has seen: decks per
+second over the last `window` seconds, ETA when the batch size is known,
+worker utilization (busy deck-seconds over workers x wall time) and the
+slowest decks so far, to size batch jobs and spot stragglers.
+
+Batch workers run in other processes; there the deck events are collected
+(see decks.manifest.timed_build) and re-emitted by the coordinating
+process, so only one process ever writes to the sinks.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+STATS_INTERVAL = 5.0
+SLOWEST_KEPT = 5
+
+
+class JsonLinesSink:
+    """Write every event as one JSON line."""
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+
+    def __call__(self, event):
+        self.stream.write(json.dumps(event, ensure_ascii=False) + "\n")
+        self.stream.flush()
+
+
+def _format_bytes(size):
+    return f"{size / 1024:,.0f} KB" if size < 1 << 20 else f"{size / (1 << 20):,.1f} MB"
+
+
+def _format_seconds(seconds):
+    if seconds < 90:
+        return f"{seconds:.0f}s"
+    if seconds < 5400:
+        return f"{seconds / 60:.0f}m"
+    return f"{seconds / 3600:.1f}h"
+
+
+class TextSink:
+    """Short human-readable lines for interactive runs."""
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+
+    def __call__(self, event):
+        kind = event["event"]
+        if kind == "deck_finished":
+            details = [f"{event['seconds']:.2f}s"]
+            if event.get("slides"):
+                details.append(f"{len(event['slides'])} slides")
+            if event.get("bytes"):
+                details.append(_format_bytes(event["bytes"]))
+            line = f"✅ Saved: {event['deck']} ({', '.join(details)})"
+        elif kind == "deck_failed":
+            line = f"✗ {event['deck']}: {event['error']}"
+        elif kind == "preview_updated":
+            details = [f"built in {event['build_ms']:.0f} ms"]
+            if event.get("latency_ms") is not None:
+                details.append(f"edit to preview {event['latency_ms']:.0f} ms")
+            line = f"↻ {event['deck']}: {', '.join(event['slides']) or 'no changes'} ({', '.join(details)})"
+        elif kind == "preview_failed":
+            line = f"✗ {event['deck']}: {event['error']}"
+        elif kind == "stats":
+            total = f"/{event['total']}" if event.get("total") else ""
+            line = (
+                f"[{event['done']}{total}] {event['decks_per_second']:.1f} decks/s, "
+                f"utilization {event['utilization']:.0%}"
+            )
+            if event.get("eta_seconds") is not None:
+                line += f", ETA {_format_seconds(event['eta_seconds'])}"
+        else:
+            return
+        print(line, file=self.stream, flush=True)
+
+
+class ProgressReporter:
+    """Fan events out to sinks and keep rolling throughput stats."""
+
+    def __init__(self, sinks=(), total=None, workers=1, window=60.0,
+                 stats_interval=STATS_INTERVAL):
+        self.sinks = list(sinks)
+        self.total = total
+        self.workers = workers
+        self.window = window
+        self.stats_interval = stats_interval
+        self._lock = threading.Lock()
+        self._sink_lock = threading.Lock()
+        self._started = time.monotonic()
+        self._finished_at = deque()
+        self._busy_seconds = 0.0
+        self._done = 0
+        self._failed = 0
+        self._slowest = []
+        self._last_stats = self._started
+
+    def emit(self, event, **fields):
+        """Deliver one event to every sink and return it."""
+        record = {"event": event, "t": round(time.time(), 3), **fields}
+        # One event at a time, so lines from builder threads never interleave
+        with self._sink_lock:
+            for sink in self.sinks:
+                sink(record)
+        return record
+
+    def deck_started(self, deck, **fields):
+        return self.emit("deck_started", deck=deck, **fields)
+
+    def deck_finished(self, deck, seconds, **fields):
+        now = time.monotonic()
+        with self._lock:
+            self._done += 1
+            self._busy_seconds += seconds
+            self._finished_at.append(now)
+            self._slowest.append((seconds, deck))
+            self._slowest.sort(reverse=True)
+            del self._slowest[SLOWEST_KEPT:]
+            due = now - self._last_stats >= self.stats_interval
+            if due:
+                self._last_stats = now
+        record = self.emit("deck_finished", deck=deck, seconds=round(seconds, 3), **fields)
+        if due:
+            self.emit("stats", **self.stats())
+        return record
+
+    def deck_failed(self, deck, error, **fields):
+        with self._lock:
+            self._failed += 1
+        return self.emit("deck_failed", deck=deck, error=str(error), **fields)
+
+    def stats(self):
+        """Rolling throughput, ETA, utilization and stragglers."""
+        now = time.monotonic()
+        with self._lock:
+            while self._finished_at and now - self._finished_at[0] > self.window:
+                self._finished_at.popleft()
+            elapsed = max(now - self._started, 1e-9)
+            span = min(elapsed, self.window)
+            rate = len(self._finished_at) / span
+            remaining = None if self.total is None else self.total - self._done - self._failed
+            return {
+                "done": self._done,
+                "failed": self._failed,
+                "total": self.total,
+                "elapsed_seconds": round(elapsed, 3),
+                "decks_per_second": round(rate, 3),
+                "eta_seconds": round(remaining / rate, 1) if remaining is not None and rate else None,
+                "utilization": round(min(self._busy_seconds / (self.workers * elapsed), 1.0), 3),
+                "slowest": [{"deck": deck, "seconds": round(s, 3)} for s, deck in self._slowest],
+            }
+
+    def finish(self):
+        """Emit the final stats event."""
+        return self.emit("batch_finished", **self.stats())
+
+
+_current = ContextVar("decks_progress", default=None)
+
+
+def get_reporter():
+    """The reporter of the current context (text to stdout by default)."""
+    reporter = _current.get()
+    if reporter is None:
+        reporter = ProgressReporter([TextSink()])
+        _current.set(reporter)
+    return reporter
+
+
+@contextmanager
+def use_reporter(reporter):
+    """Make `reporter` current for the duration of the block."""
+    token = _current.set(reporter)
+    try:
+        yield reporter
+    finally:
+        _current.reset(token)
+
+
+class DeckRun:
+    """Timings of one deck build; see deck_run."""
+
+    __slots__ = ("deck", "started", "slides", "bytes")
+
+    def __init__(self, deck):
+        self.deck = deck
+        self.started = time.perf_counter()
+        self.slides = []
+        self.bytes = None
+
+    @contextmanager
+    def slide(self, name):
+        """Time the slide built inside the block."""
+        started = time.perf_counter()
+        yield
+        self.slides.append([name, round(time.perf_counter() - started, 4)])
+
+    def saved(self, output):
+        """Record the size of the written deck (a path or a decks.outputs Output)."""
+        size = getattr(output, "size", None)
+        self.bytes = size if size is not None else os.path.getsize(output)
+
+
+def worker_id():
+    """Id of the worker building a deck: the process id, qualified with the
+    thread id ("1234/5678") in threads other than the main one, so decks
+    built by a thread pool are told apart."""
+    if threading.current_thread() is threading.main_thread():
+        return os.getpid()
+    return f"{os.getpid()}/{threading.get_native_id()}"
+
+
+@contextmanager
+def deck_run(deck, reporter=None):
+    """Report the start and end of building `deck` (usually its output path)."""
+    reporter = reporter or get_reporter()
+    deck = str(deck)
+    run = DeckRun(deck)
+    reporter.deck_started(deck, worker=worker_id())
+    try:
+        yield run
+    except Exception as exc:
+        reporter.deck_failed(
+            deck, f"{type(exc).__name__}: {exc}",
+            seconds=round(time.perf_counter() - run.started, 3), worker=worker_id(),
+        )
+        raise
+    reporter.deck_finished(
+        deck, time.perf_counter() - run.started,
+        bytes=run.bytes, slides=run.slides, worker=worker_id(),
+    )
@@ -0,0 +1,280 @@
+"""
+Lazy, read-only access to built decks.
+
+`Presentation(path)` loads and parses every part of a deck before the
+first title can be read. A DeckReader memory-maps the file, opens the zip
+directory, and parses an XML part only the first time something needs it.
+Counting slides reads presentation.xml and its .rels. A slide's shapes
+are one streaming pass over that slide's XML, and its notes are parsed
+only when asked for. Audit and QA jobs over thousands of decks then cost
+little more than reading the bytes they look at.
+
+    with DeckReader("out.pptx") as deck:
+        print(len(deck), deck.slide_size)
+        for slide in deck:
+            if not slide.notes:
+                print(f"slide {slide.number} ({slide.title}) has no notes")
+            if "Slide Number" not in slide.shape_names:
+                ...
+
+    python3 -m decks inspect out/*.pptx --require-notes --require-shape "Slide Number"
+
+Nothing here writes to the deck, and no python-pptx object is built.
+"""
+
+import mmap
+import posixpath
+import zipfile
+from collections import namedtuple
+from functools import cached_property
+
+_A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+_P = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+_R = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+RT = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/"
+RT_SLIDE = RT + "slide"
+RT_SLIDE_LAYOUT = RT + "slideLayout"
+RT_NOTES = RT + "notesSlide"
+RT_HYPERLINK = RT + "hyperlink"
+
+PRESENTATION = "ppt/presentation.xml"
+
+_TITLE_TYPES = {"title", "ctrTitle"}
+_SHAPE_TAGS = {_P + "sp", _P + "pic", _P + "graphicFrame", _P + "cxnSp", _P + "grpSp"}
+# Shapes whose text is collected: autoshapes/text boxes and tables
+_TEXT_TAGS = {_P + "sp", _P + "graphicFrame"}
+_RUN_PROPERTIES = (_A + "rPr", _A + "endParaRPr", _A + "defRPr")
+
+class _Map(mmap.mmap):
+    # zipfile asks its file for seekable(), which mmap only has from 3.13
+    def seekable(self):
+        return True
+
+
+Shape = namedtuple("Shape", "id name kind placeholder text top font_size")
+Shape.__doc__ = """One shape of a slide: cNvPr id and name, element kind
+("sp", "pic", "graphicFrame", ...), placeholder type ("" when not a
+placeholder, "body" for untyped placeholders), its text, its top offset in
+EMU and its largest font size in points (None when the slide does not set
+them)."""
+
+
+class DeckReader:
+    """A memory-mapped .pptx whose parts are parsed on first access."""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._map = _Map(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.zip = zipfile.ZipFile(self._map)
+        except (ValueError, zipfile.BadZipFile):
+            # mmap refuses empty files; report both as "not a deck"
+            self._file.close()
+            raise zipfile.BadZipFile("not a .pptx (zip) file") from None
+        self._rels = {}
+
+    def close(self):
+        self.zip.close()
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ----- parts -----
+
+    def read(self, part):
+        """Raw bytes of `part` (e.g. "ppt/slides/slide1.xml")."""
+        return self.zip.read(part)
+
+    def parse(self, part):
+        """Parsed root element of the XML `part`."""
+        from lxml import etree
+
+        with self.zip.open(part) as f:
+            return etree.parse(f).getroot()
+
+    def iterparse(self, part, events=("end",), tag=None):
+        """Stream (event, element) pairs of the XML `part`."""
+        from lxml import etree
+
+        with self.zip.open(part) as f:
+            yield from etree.iterparse(f, events=events, tag=tag)
+
+    def rels(self, part):
+        """{rId: (reltype, target)} of `part`; internal targets are resolved
+        to part names."""
+        rels = self._rels.get(part)
+        if rels is None:
+            rels = self._rels[part] = {}
+            directory, name = posixpath.split(part)
+            rels_name = posixpath.join(directory, "_rels", name + ".rels")
+            if rels_name in self.zip.NameToInfo:
+                for _, rel in self.iterparse(rels_name, tag=_REL + "Relationship"):
+                    target = rel.get("Target", "")
+                    if rel.get("TargetMode") != "External":
+                        target = posixpath.normpath(posixpath.join(directory, target))
+                    rels[rel.get("Id")] = (rel.get("Type"), target)
+        return rels
+
+    # ----- presentation -----
+
+    @cached_property
+    def _presentation(self):
+        return self.parse(PRESENTATION)
+
+    @cached_property
+    def slide_parts(self):
+        """Slide part names in presentation order."""
+        rels = self.rels(PRESENTATION)
+        parts = []
+        for slide_id in self._presentation.iter(_P + "sldId"):
+            reltype, target = rels.get(slide_id.get(_R + "id"), (None, None))
+            if reltype == RT_SLIDE:
+                parts.append(target)
+        return parts
+
+    @cached_property
+    def slide_size(self):
+        """(width, height) in EMU."""
+        size = self._presentation.find(_P + "sldSz")
+        return int(size.get("cx")), int(size.get("cy"))
+
+    @cached_property
+    def properties(self):
+        """Core document properties (title, creator, modified, ...) as strings."""
+        if "docProps/core.xml" not in self.zip.NameToInfo:
+            return {}
+        return {
+            element.tag.rsplit("}", 1)[-1]: element.text or ""
+            for element in self.parse("docProps/core.xml")
+        }
+
+    def __len__(self):
+        return len(self.slide_parts)
+
+    def __getitem__(self, index):
+        parts = self.slide_parts
+        return SlideView(self, range(1, len(parts) + 1)[index], parts[index])
+
+    def __iter__(self):
+        for number, part in enumerate(self.slide_parts, 1):
+            yield SlideView(self, number, part)
+
+
+def _paragraph_text(paragraph):
+    # Line breaks (a:br) inside a paragraph read as newlines
+    return "".join(
+        "\n" if node.tag == _A + "br" else node.text or ""
+        for node in paragraph.iter(_A + "t", _A + "br")
+    )
+
+
+def _shape_text(element):
+    paragraphs = (_paragraph_text(paragraph) for paragraph in element.iter(_A + "p"))
+    return "\n".join(p for p in paragraphs if p)
+
+
+class SlideView:
+    """One slide of a DeckReader; every attribute is computed on first use."""
+
+    def __init__(self, deck, number, part):
+        self.deck = deck
+        self.number = number
+        self.part = part
+
+    def __repr__(self):
+        return f"<SlideView {self.number} {self.part}>"
+
+    @cached_property
+    def rels(self):
+        return self.deck.rels(self.part)
+
+    @cached_property
+    def shapes(self):
+        """[Shape] in document order, from one streaming pass over the slide."""
+        shapes = []
+        for _, element in self.deck.iterparse(self.part):
+            if element.tag not in _SHAPE_TAGS:
+                continue
+            c_nv_pr = element.find(f"./*/{_P}cNvPr")
+            ph = element.find(f"./*/{_P}nvPr/{_P}ph")
+            placeholder = "" if ph is None else ph.get("type", "body")
+            text = _shape_text(element) if element.tag in _TEXT_TAGS else ""
+            offset = element.find(f"./*/{_A}xfrm/{_A}off")
+            if offset is None:
+                offset = element.find(f"./{_P}xfrm/{_A}off")
+            sizes = [
+                int(props.get("sz")) for props in element.iter(*_RUN_PROPERTIES)
+                if props.get("sz")
+            ] if text else []
+            shapes.append(Shape(
+                int(c_nv_pr.get("id", 0)) if c_nv_pr is not None else 0,
+                c_nv_pr.get("name", "") if c_nv_pr is not None else "",
+                element.tag[len(_P):],
+                placeholder,
+                text,
+                int(offset.get("y", 0)) if offset is not None else None,
+                max(sizes) / 100 if sizes else None,
+            ))
+            element.clear()
+        return shapes
+
+    @cached_property
+    def shape_names(self):
+        return [shape.name for shape in self.shapes]
+
+    @cached_property
+    def title(self):
+        """Text of the title placeholder, else of the text box most likely
+        to be the title (generated decks often draw titles as plain text
+        boxes): the one in the largest font, then the topmost. Shapes with
+        a single character (logo marks, bullets, badge numbers) are skipped."""
+        texts = [shape for shape in self.shapes if shape.text]
+        for shape in texts:
+            if shape.placeholder in _TITLE_TYPES:
+                return shape.text
+        candidates = [shape for shape in texts if len(shape.text.strip()) > 1] or texts
+        if not candidates:
+            return ""
+        best = max(candidates, key=lambda shape: (
+            shape.font_size or 0, -(shape.top if shape.top is not None else float("inf")),
+        ))
+        return best.text
+
+    @cached_property
+    def texts(self):
+        """Text of every shape that has some, in document order."""
+        return [shape.text for shape in self.shapes if shape.text]
+
+    @cached_property
+    def notes_part(self):
+        return next((t for rt, t in self.rels.values() if rt == RT_NOTES), None)
+
+    @cached_property
+    def notes(self):
+        """Speaker notes: the body placeholder of the notes page only (the
+        page also holds the slide image and slide number placeholders)."""
+        if self.notes_part is None:
+            return ""
+        texts = []
+        for shape in self.deck.parse(self.notes_part).iter(_P + "sp"):
+            ph = shape.find(f"{_P}nvSpPr/{_P}nvPr/{_P}ph")
+            if ph is not None and ph.get("type") == "body":
+                texts.append(_shape_text(shape))
+        return "\n".join(t for t in texts if t)
+
+    @cached_property
+    def links(self):
+        """External hyperlink targets of the slide."""
+        return [t for rt, t in self.rels.values() if rt == RT_HYPERLINK]
+
+    @cached_property
+    def layout_part(self):
+        return next((t for rt, t in self.rels.values() if rt == RT_SLIDE_LAYOUT), None)
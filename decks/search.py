@@ -0,0 +1,276 @@
+"""
+Searchable index over an archive of generated decks.
+
+Support needs to know which decks cited a source URL or mentioned a
+seller. `update_index` walks directories of .pptx files and, for each new
+or changed deck, reads only the slide, notes and relationship entries of
+the zip through decks.reader (streaming, no python-pptx objects).
+Titles, body text, notes and hyperlinks go into a SQLite database:
+
+- `slides`, an FTS5 full-text table with one row per slide (title, body,
+  notes, links), queried with bm25 ranking. A slide's rowid is
+  deck_id << 16 | slide number, so a changed deck's slides are deleted by
+  rowid range instead of scanning the table;
+- `links`, one row per (slide, URL), with a B-tree index for exact and
+  prefix URL lookups;
+- `decks`, the path, size and mtime of every indexed deck. A re-run only
+  re-reads decks whose size or mtime changed and drops decks that are gone.
+
+Queries match every word (or "quoted phrase") literally, so seller
+handles, domains and hyphenated names need no escaping; `raw=True` passes
+the query through in SQLite FTS5 syntax (prefixes, NEAR, NOT, columns).
+
+URL lookups and selective text queries (a seller name, a product, a
+phrase) are index lookups that take a few milliseconds over 100k decks.
+Terms that match a large share of all slides cost more, because bm25
+ranks every match before the LIMIT applies.
+
+    update_index("decks.db", ["seller_reports/", "catalogue/"])
+    search("decks.db", "Jane Wanjiru")
+    decks_citing("decks.db", "https://cursor.com/blog/series-d")
+
+    python3 -m decks index decks.db seller_reports/ catalogue/
+    python3 -m decks search decks.db "Jane Wanjiru"
+    python3 -m decks search decks.db --raw "jacket* NOT denim"
+    python3 -m decks search decks.db --url https://cursor.com/blog/
+"""
+
+import os
+import re
+import sqlite3
+import zipfile
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from decks.reader import DeckReader
+
+SlideText = namedtuple("SlideText", "number title body notes links")
+Hit = namedtuple("Hit", "path slide title snippet")
+
+_TERM = re.compile(r'"([^"]*)"|(\S+)')
+
+SCHEMA_VERSION = 2
+SLIDE_BITS = 16
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS decks (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS slides USING fts5(
+    deck_id UNINDEXED, slide UNINDEXED, title, body, notes, links,
+    tokenize = 'unicode61'
+);
+CREATE TABLE IF NOT EXISTS links (
+    deck_id INTEGER NOT NULL,
+    slide INTEGER NOT NULL,
+    url TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS links_url ON links (url);
+CREATE INDEX IF NOT EXISTS links_deck ON links (deck_id);
+"""
+
+
+# =============================================================================
+# EXTRACTION
+# =============================================================================
+
+def read_slide_texts(path):
+    """[SlideText] of every slide of the deck at `path`."""
+    with DeckReader(path) as deck:
+        return [
+            SlideText(
+                slide.number, slide.title,
+                "\n".join(shape.text for shape in slide.shapes
+                          if shape.text and shape.text != slide.title),
+                slide.notes, slide.links,
+            )
+            for slide in deck
+        ]
+
+
+def _read_deck(path):
+    try:
+        return path, read_slide_texts(path), None
+    # lxml's XMLSyntaxError is a SyntaxError
+    except (OSError, KeyError, zipfile.BadZipFile, ValueError, SyntaxError) as exc:
+        return path, None, f"{type(exc).__name__}: {exc}"
+
+
+# =============================================================================
+# INDEX
+# =============================================================================
+
+def connect(index_path):
+    """Open (creating if needed) the index database at `index_path`.
+
+    An index written with an older layout is emptied; the next update
+    re-reads every deck.
+    """
+    conn = sqlite3.connect(index_path)
+    if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        conn.executescript(
+            "DROP TABLE IF EXISTS slides; DROP TABLE IF EXISTS links; "
+            "DROP TABLE IF EXISTS decks;"
+            f"PRAGMA user_version = {SCHEMA_VERSION};"
+        )
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def iter_deck_paths(roots):
+    """Every .pptx file under `roots` (files or directories), sorted per directory."""
+    for root in roots:
+        if os.path.isfile(root):
+            yield os.path.abspath(root)
+            continue
+        for directory, subdirs, files in os.walk(root):
+            subdirs.sort()
+            for name in sorted(files):
+                if name.endswith(".pptx") and not name.startswith("~$"):
+                    yield os.path.abspath(os.path.join(directory, name))
+
+
+def _slide_rowid(deck_id, slide):
+    return deck_id << SLIDE_BITS | slide
+
+
+def _remove(conn, deck_id):
+    conn.execute(
+        "DELETE FROM slides WHERE rowid BETWEEN ? AND ?",
+        (_slide_rowid(deck_id, 0), _slide_rowid(deck_id, (1 << SLIDE_BITS) - 1)),
+    )
+    conn.execute("DELETE FROM links WHERE deck_id = ?", (deck_id,))
+    conn.execute("DELETE FROM decks WHERE id = ?", (deck_id,))
+
+
+def update_index(index_path, roots, workers=None, prune=True):
+    """Index new and changed decks under `roots`; returns (indexed, unchanged,
+    removed, errors). With `prune`, decks under `roots` that no longer exist
+    are dropped from the index.
+    """
+    conn = connect(index_path)
+    known = {
+        path: (deck_id, size, mtime_ns)
+        for deck_id, path, size, mtime_ns in conn.execute(
+            "SELECT id, path, size, mtime_ns FROM decks"
+        )
+    }
+    seen = set()
+    stale = []
+    for path in iter_deck_paths(roots):
+        seen.add(path)
+        stat = os.stat(path)
+        record = known.get(path)
+        if record is None or record[1:] != (stat.st_size, stat.st_mtime_ns):
+            stale.append((path, stat.st_size, stat.st_mtime_ns))
+
+    removed = 0
+    if prune:
+        files = {os.path.abspath(root) for root in roots if not os.path.isdir(root)}
+        directories = tuple(
+            os.path.join(os.path.abspath(root), "") for root in roots if os.path.isdir(root)
+        )
+        for path, (deck_id, _, _) in known.items():
+            if path not in seen and (path in files or path.startswith(directories)):
+                _remove(conn, deck_id)
+                removed += 1
+
+    errors = []
+    stats = {path: (size, mtime_ns) for path, size, mtime_ns in stale}
+    paths = [path for path, _, _ in stale]
+    if workers == 1 or len(paths) < 2:
+        results = map(_read_deck, paths)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        results = pool.map(_read_deck, paths, chunksize=16)
+    try:
+        for path, slides, error in results:
+            if error is None and len(slides) >= 1 << SLIDE_BITS:
+                error = f"more than {(1 << SLIDE_BITS) - 1} slides"
+            if error is not None:
+                errors.append((path, error))
+                continue
+            record = known.get(path)
+            if record is not None:
+                _remove(conn, record[0])
+            size, mtime_ns = stats[path]
+            deck_id = conn.execute(
+                "INSERT INTO decks (path, size, mtime_ns) VALUES (?, ?, ?)",
+                (path, size, mtime_ns),
+            ).lastrowid
+            conn.executemany(
+                "INSERT INTO slides (rowid, deck_id, slide, title, body, notes, links) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(_slide_rowid(deck_id, s.number), deck_id, s.number, s.title, s.body,
+                  s.notes, " ".join(s.links))
+                 for s in slides],
+            )
+            conn.executemany(
+                "INSERT INTO links (deck_id, slide, url) VALUES (?, ?, ?)",
+                [(deck_id, s.number, url) for s in slides for url in s.links],
+            )
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        conn.commit()
+        conn.close()
+    indexed = len(paths) - len(errors)
+    return indexed, len(seen) - len(paths), removed, errors
+
+
+# =============================================================================
+# QUERIES
+# =============================================================================
+
+def literal_query(text):
+    """FTS5 query matching each word or "quoted phrase" of `text` as a
+    phrase, so punctuation in it is never read as query syntax."""
+    phrases = (phrase or word for phrase, word in _TERM.findall(text))
+    return " ".join('"%s"' % phrase.replace('"', '""') for phrase in phrases if phrase.strip())
+
+
+def search(index_path, query, limit=20, raw=False):
+    """[Hit] of the slides matching `query`, best first.
+
+    Words and "quoted phrases" of `query` must all appear; with `raw` it is
+    an FTS5 query, and invalid syntax raises sqlite3.OperationalError.
+    """
+    if not raw:
+        query = literal_query(query)
+        if not query:
+            return []
+    conn = connect(index_path)
+    try:
+        rows = conn.execute(
+            "SELECT d.path, s.slide, s.title, "
+            "snippet(slides, -1, '[', ']', '…', 12) "
+            "FROM slides s JOIN decks d ON d.id = s.deck_id "
+            "WHERE slides MATCH ? ORDER BY bm25(slides, 0, 0, 10, 1, 2, 1) LIMIT ?",
+            (query, limit),
+        ).fetchall()
+    finally:
+        conn.close()
+    return [Hit(*row) for row in rows]
+
+
+def decks_citing(index_path, url, prefix=False, limit=1000):
+    """[(path, slide, url)] of slides linking to `url` (or any URL under it)."""
+    conn = connect(index_path)
+    try:
+        if prefix:
+            # Range scan on the url index: [url, url + highest code point)
+            where, args = "l.url >= ? AND l.url < ?", (url, url + "\U0010ffff")
+        else:
+            where, args = "l.url = ?", (url,)
+        rows = conn.execute(
+            "SELECT d.path, l.slide, l.url FROM links l JOIN decks d ON d.id = l.deck_id "
+            f"WHERE {where} ORDER BY d.path, l.slide LIMIT ?",
+            (*args, limit),
+        ).fetchall()
+    finally:
+        conn.close()
+    return rows
@@ -0,0 +1,411 @@
+"""
+Monthly Seller Report Deck Generator
+Builds one deck per seller from the seller leaderboard data
+(get_top_sellers_by_sales / get_top_sellers_by_views in
+supabase/migrations/010_seller_leaderboard.sql), reusing the Cursor pro
+slide helpers for styling.
+
+Rows are streamed one seller at a time from a CSV export, a SQLite export
+or a Postgres database, so memory stays flat no matter how many sellers
+the export holds. The export must be ordered by seller (rank_position),
+with one row per (seller, top product):
+
+    rank_position, seller_id, full_name, location, items_sold, total_views,
+    follower_count, rating, product_title, product_price, product_views
+
+Large CSV or Parquet exports can be read column-wise instead (decks.columns,
+`columnar=True`; always used for .parquet): the file is memory-mapped, only
+the columns above are loaded, and sellers are grouped with NumPy. Columnar
+exports need not be ordered; sellers come out in rank order.
+
+Decks are built in a bounded process (or thread) pool and written
+atomically, and every finished or failed deck is journalled in
+<output_dir>/manifest.jsonl (decks.manifest): re-running the same command
+skips every seller the manifest records as done and retries the ones that
+failed.
+
+Run: python3 -m decks seller-reports leaderboard.csv --month 2025-06
+Output: seller_reports/<month>/<rank>-<seller_id>.pptx
+"""
+
+import os
+import re
+import shutil
+import subprocess
+from itertools import groupby
+
+from decks import sources
+from decks.manifest import DEFAULT_RETRIES, MANIFEST_NAME, BatchManifest, run_jobs
+from decks.progress import deck_run
+from decks.sources import to_float, to_int
+
+SELLER_FIELDS = (
+    "rank_position", "seller_id", "full_name", "location",
+    "items_sold", "total_views", "follower_count", "rating",
+)
+PRODUCT_FIELDS = ("product_title", "product_price", "product_views")
+TEXT_FIELDS = ("seller_id", "full_name", "location", "product_title")
+
+MAX_TOP_PRODUCTS = 5
+
+
+# =============================================================================
+# ROW GROUPING
+# =============================================================================
+
+def iter_rows(source, table="seller_leaderboard"):
+    """Stream leaderboard rows from `source`, ordered by rank."""
+    return sources.iter_rows(source, table, "rank_position, seller_id")
+
+
+def iter_sellers(rows, max_products=MAX_TOP_PRODUCTS):
+    """Group consecutive rows into one small dict per seller."""
+    for seller_id, seller_rows in groupby(rows, key=lambda r: str(r["seller_id"])):
+        seller = None
+        products = []
+        for row in seller_rows:
+            if seller is None:
+                seller = {
+                    "seller_id": seller_id,
+                    "rank_position": to_int(row.get("rank_position")),
+                    "full_name": row.get("full_name") or "Unknown seller",
+                    "location": row.get("location") or "",
+                    "items_sold": to_int(row.get("items_sold")),
+                    "total_views": to_int(row.get("total_views")),
+                    "follower_count": to_int(row.get("follower_count")),
+                    "rating": to_float(row.get("rating")),
+                }
+            if row.get("product_title") and len(products) < max_products:
+                products.append({
+                    "title": row["product_title"],
+                    "price": to_float(row.get("product_price")),
+                    "views": to_int(row.get("product_views")),
+                })
+        seller["products"] = products
+        yield seller
+
+
+def iter_seller_columns(table, max_products=MAX_TOP_PRODUCTS):
+    """Like iter_sellers, over a decks.columns.ColumnTable.
+
+    Grouping and the top-product cut are done on whole columns; Python
+    objects are only made for the values that end up in a deck.
+    """
+    import numpy as np
+
+    table.load(*(name for name in SELLER_FIELDS + PRODUCT_FIELDS if name in table))
+    if "rank_position" in table:
+        table = table.sort_by("rank_position")
+    order, starts, stops = table.group_index("seller_id")
+    firsts = order[starts]
+    seller_values = {
+        name: table[name][firsts].tolist() for name in SELLER_FIELDS if name in table
+    }
+
+    # Rows (in group order) that carry one of the first `max_products` products
+    products = [[] for _ in range(len(starts))]
+    if "product_title" in table and len(order):
+        sizes = stops - starts
+        offsets = np.cumsum(sizes) - sizes
+        group_of = np.repeat(np.arange(len(starts)), sizes)
+        within = np.arange(len(order)) - offsets[group_of]
+        rows = order[starts[group_of] + within]
+        titled = table["product_title"][rows] != ""
+        seen = np.cumsum(titled)
+        rank_in_group = seen - (seen - titled)[offsets][group_of]
+        keep = titled & (rank_in_group <= max_products)
+        picked = rows[keep]
+        columns = [
+            table[name][picked].tolist() if name in table else [None] * len(picked)
+            for name in PRODUCT_FIELDS
+        ]
+        for group, title, price, views in zip(group_of[keep].tolist(), *columns):
+            products[group].append({
+                "title": title, "price": to_float(price), "views": to_int(views),
+            })
+
+    for i, seller_id in enumerate(table["seller_id"][firsts].tolist()):
+        first = {name: values[i] for name, values in seller_values.items()}
+        yield {
+            "seller_id": str(seller_id),
+            "rank_position": to_int(first.get("rank_position")),
+            "full_name": first.get("full_name") or "Unknown seller",
+            "location": first.get("location") or "",
+            "items_sold": to_int(first.get("items_sold")),
+            "total_views": to_int(first.get("total_views")),
+            "follower_count": to_int(first.get("follower_count")),
+            "rating": to_float(first.get("rating")),
+            "products": products[i],
+        }
+
+
+def open_sellers(source, table="seller_leaderboard", columnar=False):
+    """Sellers of `source`, column-wise for Parquet files or when `columnar`."""
+    if columnar or source.endswith(".parquet"):
+        from decks.columns import open_columns
+
+        def sellers():
+            # Closes the memory map once the sellers are used up (or dropped)
+            with open_columns(source, dict.fromkeys(TEXT_FIELDS, str)) as table:
+                yield from iter_seller_columns(table)
+
+        return sellers()
+    return iter_sellers(iter_rows(source, table))
+
+
+# =============================================================================
+# DECK BUILDING
+# =============================================================================
+
+def deck_filename(seller):
+    """Stable output name for a seller's deck; the seller id is reduced to
+    letters, digits, "-" and "_" so it cannot leave the output directory."""
+    seller_id = re.sub(r"[^A-Za-z0-9_-]+", "-", str(seller["seller_id"])).strip("-")
+    return f"{seller['rank_position']:05d}-{seller_id or 'seller'}.pptx"
+
+
+def build_seller_deck(seller, month, output_path, check=False, charts="static"):
+    """Build one seller's deck and write it atomically to `output_path`.
+
+    `charts` is the decks.charts.ChartBook mode of the product chart.
+    """
+    from pptx.chart.data import CategoryChartData
+    from pptx.enum.chart import XL_CHART_TYPE
+    from pptx.enum.text import PP_ALIGN
+    from pptx.util import Inches, Pt
+
+    from decks.charts import ChartBook
+
+    from decks.helpers import (
+        CURSOR_AMBER, CURSOR_BLACK, CURSOR_BLUE, CURSOR_DARK_GRAY,
+        CURSOR_GREEN, CURSOR_LIGHT_GRAY, CURSOR_MID_GRAY, CURSOR_OFF_WHITE,
+        CURSOR_PURPLE, CURSOR_WHITE, add_circle, add_horizontal_line,
+        add_rounded_rectangle, add_slide_number, add_source_footer,
+        add_speaker_notes, add_text_to_shape, add_textbox, set_slide_background,
+    )
+    from decks.outputs import save_presentation
+    from decks.prototype import new_presentation
+    from decks.slim import slim_presentation
+
+    prs = new_presentation()
+    chart_book = ChartBook(prs, mode=charts)
+    slide_width = prs.slide_width
+    slide_height = prs.slide_height
+    blank_layout = prs.slide_layouts[6]
+    source = f"Source: Outfittr seller leaderboard, {month}"
+
+    # ========== SLIDE 1: Title ==========
+    slide = prs.slides.add_slide(blank_layout)
+    set_slide_background(slide, CURSOR_BLACK)
+    rank_badge = add_circle(slide, Inches(4.25), Inches(1.2), Inches(1.5), CURSOR_PURPLE)
+    add_text_to_shape(
+        rank_badge, f"#{seller['rank_position']}",
+        font_size=40, font_color=CURSOR_WHITE, bold=True
+    )
+    add_textbox(
+        slide, Inches(1), Inches(3.1), Inches(8), Inches(0.9),
+        seller["full_name"],
+        font_size=40, font_color=CURSOR_WHITE, bold=True, alignment=PP_ALIGN.CENTER
+    )
+    add_textbox(
+        slide, Inches(1), Inches(4), Inches(8), Inches(0.5),
+        f"Monthly Seller Report  •  {month}",
+        font_size=18, font_color=CURSOR_PURPLE, bold=True, alignment=PP_ALIGN.CENTER
+    )
+    if seller["location"]:
+        add_textbox(
+            slide, Inches(1), Inches(4.6), Inches(8), Inches(0.4),
+            seller["location"],
+            font_size=14, font_color=CURSOR_LIGHT_GRAY, alignment=PP_ALIGN.CENTER
+        )
+    add_speaker_notes(
+        slide,
+        f"{seller['full_name']} ranked #{seller['rank_position']} on the Outfittr "
+        f"seller leaderboard for {month}."
+    )
+    add_slide_number(slide, 1, slide_width, slide_height)
+
+    # ========== SLIDE 2: Metrics ==========
+    slide = prs.slides.add_slide(blank_layout)
+    set_slide_background(slide, CURSOR_BLACK)
+    add_textbox(
+        slide, Inches(0.5), Inches(0.3), Inches(9), Inches(0.6),
+        "Month at a Glance",
+        font_size=32, font_color=CURSOR_WHITE, bold=True
+    )
+    add_horizontal_line(slide, Inches(0.5), Inches(1), Inches(2), CURSOR_GREEN, thickness=3)
+
+    metrics = [
+        {"value": f"#{seller['rank_position']}", "label": "Leaderboard Rank", "color": CURSOR_PURPLE},
+        {"value": f"{seller['items_sold']:,}", "label": "Items Sold", "color": CURSOR_GREEN},
+        {"value": f"{seller['total_views']:,}", "label": "Listing Views", "color": CURSOR_BLUE},
+        {"value": f"{seller['follower_count']:,}", "label": "Followers", "color": CURSOR_AMBER},
+    ]
+    metric_width = Inches(2.05)
+    gap = Inches(0.25)
+    metrics_y = Inches(1.6)
+    for i, metric in enumerate(metrics):
+        x = Inches(0.5) + (metric_width + gap) * i
+        add_rounded_rectangle(
+            slide, x, metrics_y, metric_width, Inches(1.4), CURSOR_DARK_GRAY,
+            border_color=metric["color"], border_width=2
+        )
+        add_textbox(
+            slide, x + Inches(0.1), metrics_y + Inches(0.2),
+            metric_width - Inches(0.2), Inches(0.6),
+            metric["value"],
+            font_size=26, font_color=metric["color"], bold=True, alignment=PP_ALIGN.CENTER
+        )
+        add_textbox(
+            slide, x + Inches(0.1), metrics_y + Inches(0.85),
+            metric_width - Inches(0.2), Inches(0.35),
+            metric["label"],
+            font_size=11, font_color=CURSOR_LIGHT_GRAY, alignment=PP_ALIGN.CENTER
+        )
+
+    views_per_sale = (
+        seller["total_views"] / seller["items_sold"] if seller["items_sold"] else 0
+    )
+    add_textbox(
+        slide, Inches(0.5), Inches(3.4), Inches(9), Inches(0.4),
+        f"Rating {seller['rating']:.1f} / 5   •   "
+        f"{views_per_sale:,.1f} views per item sold",
+        font_size=14, font_color=CURSOR_OFF_WHITE, alignment=PP_ALIGN.CENTER
+    )
+    add_speaker_notes(
+        slide,
+        f"{seller['items_sold']} items sold and {seller['total_views']} listing views "
+        f"this month, with {seller['follower_count']} followers."
+    )
+    add_source_footer(slide, source, slide_width, slide_height)
+    add_slide_number(slide, 2, slide_width, slide_height)
+
+    # ========== SLIDE 3: Top Products ==========
+    slide = prs.slides.add_slide(blank_layout)
+    set_slide_background(slide, CURSOR_BLACK)
+    add_textbox(
+        slide, Inches(0.5), Inches(0.3), Inches(9), Inches(0.6),
+        "Top Products",
+        font_size=32, font_color=CURSOR_WHITE, bold=True
+    )
+    add_horizontal_line(slide, Inches(0.5), Inches(1), Inches(2), CURSOR_BLUE, thickness=3)
+
+    if not seller["products"]:
+        add_textbox(
+            slide, Inches(0.5), Inches(3), Inches(9), Inches(0.5),
+            "No product activity recorded this month",
+            font_size=16, font_color=CURSOR_MID_GRAY, alignment=PP_ALIGN.CENTER
+        )
+    row_y = Inches(1.3)
+    for i, product in enumerate(seller["products"]):
+        add_rounded_rectangle(
+            slide, Inches(0.5), row_y, Inches(9), Inches(0.85), CURSOR_DARK_GRAY,
+            border_color=CURSOR_MID_GRAY, border_width=1
+        )
+        add_textbox(
+            slide, Inches(0.7), row_y + Inches(0.2), Inches(0.5), Inches(0.45),
+            str(i + 1),
+            font_size=18, font_color=CURSOR_PURPLE, bold=True
+        )
+        add_textbox(
+            slide, Inches(1.3), row_y + Inches(0.2), Inches(5.2), Inches(0.45),
+            product["title"],
+            font_size=14, font_color=CURSOR_WHITE, bold=True
+        )
+        add_textbox(
+            slide, Inches(6.5), row_y + Inches(0.2), Inches(1.4), Inches(0.45),
+            f"KES {product['price']:,.0f}",
+            font_size=13, font_color=CURSOR_GREEN, alignment=PP_ALIGN.RIGHT
+        )
+        add_textbox(
+            slide, Inches(7.9), row_y + Inches(0.2), Inches(1.4), Inches(0.45),
+            f"{product['views']:,} views",
+            font_size=12, font_color=CURSOR_LIGHT_GRAY, alignment=PP_ALIGN.RIGHT
+        )
+        row_y += Inches(0.95)
+
+    add_source_footer(slide, source, slide_width, slide_height)
+    add_slide_number(slide, 3, slide_width, slide_height)
+
+    # ========== SLIDE 4: Views by Product ==========
+    if seller["products"]:
+        slide = prs.slides.add_slide(blank_layout)
+        set_slide_background(slide, CURSOR_BLACK)
+        add_textbox(
+            slide, Inches(0.5), Inches(0.3), Inches(9), Inches(0.6),
+            "Views by Product",
+            font_size=32, font_color=CURSOR_WHITE, bold=True
+        )
+        add_horizontal_line(slide, Inches(0.5), Inches(1), Inches(2), CURSOR_PURPLE, thickness=3)
+
+        chart_data = CategoryChartData(number_format="#,##0")
+        chart_data.categories = [product["title"] for product in seller["products"]]
+        chart_data.add_series("Views", [product["views"] for product in seller["products"]])
+        chart = chart_book.add_chart(
+            slide, XL_CHART_TYPE.COLUMN_CLUSTERED,
+            Inches(0.5), Inches(1.3), Inches(9), Inches(5.2), chart_data
+        ).chart
+        chart.has_legend = False
+        chart.font.size = Pt(11)
+        chart.font.color.rgb = CURSOR_LIGHT_GRAY
+        fill = chart.plots[0].series[0].format.fill
+        fill.solid()
+        fill.fore_color.rgb = CURSOR_PURPLE
+
+        add_source_footer(slide, source, slide_width, slide_height)
+        add_slide_number(slide, 4, slide_width, slide_height)
+
+    chart_book.finish()
+    slim_presentation(prs)
+    save_presentation(prs, output_path, check=check)
+    return output_path
+
+
+def convert_to_pdf(pptx_path):
+    """Convert a deck to PDF with a headless LibreOffice, if one is installed."""
+    soffice = shutil.which("soffice") or shutil.which("libreoffice")
+    if soffice is None:
+        raise RuntimeError("PDF export needs LibreOffice (soffice) on PATH")
+    subprocess.run(
+        [soffice, "--headless", "--convert-to", "pdf",
+         "--outdir", os.path.dirname(pptx_path) or ".", pptx_path],
+        check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+
+
+def _build_job(seller, month, output_path, pdf, check, charts):
+    with deck_run(output_path) as deck:
+        build_seller_deck(seller, month, output_path, check, charts)
+        deck.saved(output_path)
+    if pdf:
+        convert_to_pdf(output_path)
+
+
+# =============================================================================
+# BATCH RUNNER
+# =============================================================================
+
+def generate_reports(source, month, output_dir, table="seller_leaderboard",
+                     workers=None, pdf=False, check=False, retries=DEFAULT_RETRIES,
+                     columnar=False, executor="process", charts="static"):
+    """Stream sellers from `source` and build their decks in a bounded pool.
+
+    Progress is journalled in `output_dir`/manifest.jsonl, so an interrupted
+    run picks up where it stopped: sellers whose deck is done are skipped
+    and failed ones are retried. With `check`, each deck is run through
+    decks.ooxml in its worker before it is published. With `columnar`, a
+    CSV export is read through decks.columns (see open_sellers). `executor`
+    picks a process or thread pool (see decks.manifest.run_jobs), and
+    `charts` the decks.charts mode of the product chart. Returns (built, skipped, failed).
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = (
+        (seller["seller_id"], output_path, _build_job,
+         (seller, month, output_path, pdf, check, charts))
+        for seller in open_sellers(source, table, columnar)
+        for output_path in (os.path.join(output_dir, deck_filename(seller)),)
+    )
+    with BatchManifest(os.path.join(output_dir, MANIFEST_NAME)) as manifest:
+        return run_jobs(
+            jobs, manifest, workers=workers, retries=retries, executor=executor
+        )
@@ -0,0 +1,350 @@
+"""
+Sharded batch runs coordinated through a shared directory.
+
+A spec is split into shards of a few decks each, stored in a directory all
+nodes can reach (NFS, or a local path when several processes share one
+box):
+
+    <shared>/shards/00000.json    entries of shard 0
+    <shared>/leases/00000.*.json  who is building shard 0, and until when
+    <shared>/done/00000.json      per-deck results once shard 0 finished
+    <shared>/summary.json         written by `gather`
+
+Nodes run `work`: claim a shard that is neither done nor leased, renew the
+lease from a heartbeat thread while building it, record the results and
+move on. A lease that is not renewed expires and another node takes the
+shard over; decks the dead node already wrote are kept (outputs are
+written atomically), so a takeover only costs the unfinished decks.
+Every claim, renewal and release publishes a new lease generation with a
+hard link, which only one node can create (see Lease), so two nodes never
+hold one shard. The shared directory must support hard links (local disks
+and NFS do). Lease expiry uses wall-clock time, so node clocks should be
+roughly in sync.
+
+A deck that still fails after its retries is recorded with its error and
+the shard counts as done, so one bad deck cannot keep nodes rebuilding a
+shard forever; `gather` reports it. Once the cause is fixed, `work
+--retry-failed` makes shards with failed decks claimable again and rebuilds
+only those decks (each node retries a shard at most once per run).
+
+Relative output paths in the spec are resolved against the shared
+directory, so every node writes to the same place. `gather` checks that
+every shard is done and that every local output exists with the recorded
+hash (s3:// objects only appear once their upload has completed).
+
+    python3 -m decks shard init month_end.json /mnt/decks --shard-size 50
+    python3 -m decks shard work /mnt/decks          # on every node
+    python3 -m decks shard gather /mnt/decks
+    python3 -m decks shard work /mnt/decks --retry-failed
+"""
+
+import json
+import os
+import socket
+import threading
+import time
+import uuid
+
+from decks.outputs import is_remote
+from decks.spec import build_entry, entry_id_of
+
+SHARD_SIZE = 50
+LEASE_SECONDS = 60
+POLL_SECONDS = 5
+
+
+def _write_json(path, data):
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1)
+    os.replace(tmp_path, path)
+
+
+def _read_json(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def _dir(shared_dir, kind):
+    return os.path.join(shared_dir, kind)
+
+
+def shard_ids(shared_dir):
+    """Sorted ids of every shard in `shared_dir`."""
+    return sorted(
+        name[: -len(".json")]
+        for name in os.listdir(_dir(shared_dir, "shards"))
+        if name.endswith(".json")
+    )
+
+
+def resolve_output(shared_dir, output):
+    """Where a spec output lives: relative paths sit under the shared dir."""
+    if os.path.isabs(output) or is_remote(output):
+        return output
+    return os.path.join(shared_dir, output)
+
+
+# =============================================================================
+# INIT
+# =============================================================================
+
+def init_shards(entries, shared_dir, shard_size=SHARD_SIZE):
+    """Split validated spec `entries` into shard files; return the shard count."""
+    for kind in ("shards", "leases", "done"):
+        os.makedirs(_dir(shared_dir, kind), exist_ok=True)
+    if os.listdir(_dir(shared_dir, "shards")):
+        raise FileExistsError(f"{shared_dir} already holds a sharded run")
+    count = 0
+    for start in range(0, len(entries), shard_size):
+        shard_id = f"{count:05d}"
+        _write_json(
+            os.path.join(_dir(shared_dir, "shards"), shard_id + ".json"),
+            entries[start:start + shard_size],
+        )
+        count += 1
+    return count
+
+
+# =============================================================================
+# LEASES
+# =============================================================================
+
+class Lease:
+    """A node's claim on one shard, renewed by a heartbeat thread.
+
+    The lease is a series of generation files, `<shard>.<generation>.json`;
+    the highest generation is the current lease. Claiming, renewing and
+    releasing all publish the next generation with os.link, which fails if
+    that generation already exists, so every change is a compare-and-swap
+    against the generation the node last saw: of two nodes racing from the
+    same generation, exactly one wins, and a renewal and a takeover can
+    never both succeed.
+    """
+
+    def __init__(self, shared_dir, shard_id, node, seconds=LEASE_SECONDS):
+        self.directory = _dir(shared_dir, "leases")
+        self.shard_id = shard_id
+        self.node = node
+        self.seconds = seconds
+        self.token = uuid.uuid4().hex
+        self.generation = None
+        self.lost = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _path(self, generation):
+        return os.path.join(self.directory, f"{self.shard_id}.{generation:09d}.json")
+
+    def _generations(self):
+        prefix = self.shard_id + "."
+        return sorted(
+            int(name[len(prefix):-len(".json")])
+            for name in os.listdir(self.directory)
+            if name.startswith(prefix) and name.endswith(".json")
+        )
+
+    def current(self):
+        """(generation, record) of the current lease, or (-1, None)."""
+        for generation in reversed(self._generations()):
+            record = _read_json(self._path(generation))
+            if record is not None:
+                return generation, record
+        return -1, None
+
+    def _publish(self, generation, expires):
+        """Write `generation` unless it exists already; True if this node did."""
+        record = {"node": self.node, "token": self.token, "expires": expires}
+        tmp_path = os.path.join(self.directory, f".{self.shard_id}.{self.token}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(record, f)
+        try:
+            os.link(tmp_path, self._path(generation))
+        except FileExistsError:
+            return False
+        finally:
+            os.remove(tmp_path)
+        self.generation = generation
+        return True
+
+    def claim(self):
+        """Take the shard if it is free or its lease expired; True on success."""
+        generation, current = self.current()
+        if current is not None and current.get("expires", 0) > time.time():
+            return False
+        if not self._publish(generation + 1, time.time() + self.seconds):
+            return False
+        # A node working from a stale listing may have published a generation
+        # below one that exists already; only the highest one counts
+        if self._generations()[-1] != self.generation:
+            self.generation = None
+            return False
+        return True
+
+    def renew(self):
+        """Extend the lease; flags it lost if another node took the shard."""
+        if not self._publish(self.generation + 1, time.time() + self.seconds):
+            self.lost.set()
+            return False
+        return True
+
+    def _heartbeat(self):
+        while not self._stop.wait(self.seconds / 3):
+            if not self.renew():
+                return
+
+    def __enter__(self):
+        self._thread = threading.Thread(
+            target=self._heartbeat, name=f"lease-{self.shard_id}", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        if self.lost.is_set() or not self._publish(self.generation + 1, 0):
+            return
+        # Released: drop the generations before the release record
+        for generation in self._generations():
+            if generation < self.generation:
+                try:
+                    os.remove(self._path(generation))
+                except FileNotFoundError:
+                    pass
+
+
+# =============================================================================
+# WORK
+# =============================================================================
+
+def _pending(done_path, retry_failed):
+    """True while a shard needs building: it is not done or, with
+    `retry_failed`, some of its decks failed."""
+    if not retry_failed:
+        return not os.path.exists(done_path)
+    done = _read_json(done_path)
+    return done is None or any("error" in deck for deck in done["decks"])
+
+
+def _build_shard(shared_dir, entries, lease, retries, previous=None):
+    """Per-deck results of building `entries`; decks that succeeded in
+    `previous` (the shard's earlier results) are kept as they are."""
+    from decks.manifest import file_sha256, run_with_retries
+
+    kept = {deck["id"]: deck for deck in (previous or ()) if "error" not in deck}
+    results = []
+    for entry in entries:
+        if lease.lost.is_set():
+            return None
+        output = resolve_output(shared_dir, entry["output"])
+        remote = is_remote(output)
+        kept_result = kept.get(entry_id_of(entry))
+        if kept_result is not None and (remote or os.path.exists(output)):
+            results.append(kept_result)
+            continue
+        result = {"id": entry_id_of(entry), "output": entry["output"]}
+        started = time.perf_counter()
+        try:
+            if remote or not os.path.exists(output):
+                run_with_retries(build_entry, {**entry, "output": output}, retries=retries)
+        except Exception as exc:
+            result["error"] = f"{type(exc).__name__}: {exc}"
+        else:
+            result["sha256"] = None if remote else file_sha256(output)
+        result["seconds"] = round(time.perf_counter() - started, 3)
+        results.append(result)
+    return results
+
+
+def work(shared_dir, node=None, lease_seconds=LEASE_SECONDS,
+         poll_seconds=POLL_SECONDS, retries=2, wait=True, retry_failed=False):
+    """Claim and build shards until every shard is done; return shards built.
+
+    With wait=False the node stops as soon as nothing is claimable instead
+    of waiting to take over the leases of other nodes. With `retry_failed`,
+    shards with failed decks are claimed again and those decks rebuilt; a
+    shard this node already built in this call is not retried.
+    """
+    node = node or f"{socket.gethostname()}:{os.getpid()}"
+    done_dir = _dir(shared_dir, "done")
+    built = 0
+    attempted = set()
+    while True:
+        remaining = [
+            shard_id for shard_id in shard_ids(shared_dir)
+            if shard_id not in attempted
+            and _pending(os.path.join(done_dir, shard_id + ".json"), retry_failed)
+        ]
+        if not remaining:
+            return built
+        claimed = False
+        for shard_id in remaining:
+            lease = Lease(shared_dir, shard_id, node, lease_seconds)
+            if not lease.claim():
+                continue
+            claimed = True
+            with lease:
+                # Another node may have finished it between listing and claiming
+                done_path = os.path.join(done_dir, shard_id + ".json")
+                if not _pending(done_path, retry_failed):
+                    continue
+                attempted.add(shard_id)
+                entries = _read_json(
+                    os.path.join(_dir(shared_dir, "shards"), shard_id + ".json")
+                )
+                previous = _read_json(done_path)
+                results = _build_shard(
+                    shared_dir, entries, lease, retries,
+                    previous["decks"] if previous else None,
+                )
+                if results is not None and not lease.lost.is_set():
+                    _write_json(done_path, {"node": node, "decks": results})
+                    built += 1
+        if not claimed:
+            if not wait:
+                return built
+            time.sleep(poll_seconds)
+
+
+# =============================================================================
+# GATHER
+# =============================================================================
+
+def gather(shared_dir):
+    """Verify every shard and output; write summary.json and return problems."""
+    from decks.manifest import file_sha256
+
+    problems = []
+    decks = []
+    nodes = {}
+    for shard_id in shard_ids(shared_dir):
+        done = _read_json(os.path.join(_dir(shared_dir, "done"), shard_id + ".json"))
+        if done is None:
+            problems.append(f"shard {shard_id} is not done")
+            continue
+        nodes[done["node"]] = nodes.get(done["node"], 0) + 1
+        for deck in done["decks"]:
+            output = resolve_output(shared_dir, deck["output"])
+            if "error" in deck:
+                problems.append(
+                    f"{deck['id']}: failed on {done['node']}: {deck['error']} "
+                    "(retry with `shard work --retry-failed`)"
+                )
+            elif is_remote(output):
+                pass
+            elif not os.path.exists(output):
+                problems.append(f"{deck['id']}: missing output {deck['output']}")
+            elif file_sha256(output) != deck["sha256"]:
+                problems.append(f"{deck['id']}: {deck['output']} changed since it was built")
+            decks.append(deck)
+    _write_json(os.path.join(shared_dir, "summary.json"), {
+        "decks": len(decks),
+        "seconds": round(sum(d["seconds"] for d in decks), 3),
+        "shards_by_node": nodes,
+        "problems": problems,
+    })
+    return problems
@@ -0,0 +1,221 @@
+"""
+Post-build pass that minimizes slide XML without changing how it renders.
+
+The helpers write verbose XML: every text box repeats its full run
+properties, python-pptx adds empty list styles and geometry guide lists,
+`tf.clear()` leaves text bodies with nothing but an empty paragraph, and
+runs built piece by piece are never joined. `slim_presentation` rewrites
+each slide part in place:
+
+- attributes equal to the value the text would inherit anyway are removed
+  (`lang="en-US"`, `b="0"`, `algn="l"` against the master's otherStyle and
+  the presentation's defaultTextStyle, `wrap="square"` and other bodyPr
+  schema defaults). This only applies to non-placeholder shapes whose own
+  list style is empty, where the inheritance chain is fully known;
+- adjacent runs with identical properties are merged, and empty runs next
+  to text are dropped;
+- elements with no effect are dropped: empty `a:lstStyle`, `a:avLst`,
+  `a:pPr`, `a:rPr` and `a:endParaRPr`, and the text body of a
+  non-placeholder shape that holds no text at all.
+
+Placeholders, tables and charts keep every attribute, because their text
+inherits from layouts and table styles.
+
+    slim_presentation(prs)
+    save_presentation(prs, "out.pptx")
+
+    python3 -m decks slim out/*.pptx
+"""
+
+from lxml import etree
+from pptx.oxml.ns import qn
+
+_A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+_P = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+
+# Schema defaults of attributes that no text style sets in practice
+_PPR_DEFAULTS = {"lvl": "0", "algn": "l", "rtl": "0"}
+_RPR_DEFAULTS = {
+    "b": "0", "i": "0", "u": "none", "strike": "noStrike",
+    "baseline": "0", "cap": "none", "noProof": "0",
+}
+# bodyPr attributes of non-placeholder shapes, which inherit nothing
+_BODY_DEFAULTS = {
+    "rot": "0", "rtlCol": "0", "vert": "horz", "wrap": "square", "anchor": "t",
+    "anchorCtr": "0", "lIns": "91440", "tIns": "45720", "rIns": "91440",
+    "bIns": "45720", "numCol": "1", "upright": "0",
+}
+_BOOLEANS = {"true": "1", "false": "0", "on": "1", "off": "0"}
+_TEXT_CONTENT = (_A + "r", _A + "fld", _A + "br")
+# Elements that have no effect when they have no attributes and no children
+_EMPTY_TAGS = {_A + "lstStyle", _A + "avLst", _A + "pPr", _A + "rPr", _A + "endParaRPr"}
+
+
+def _canonical(value):
+    return _BOOLEANS.get(value, value)
+
+
+# =============================================================================
+# INHERITED TEXT DEFAULTS
+# =============================================================================
+
+def _level_values(style, level):
+    """({pPr attr: value}, {defRPr attr: value}) of `level` (1-9) in the
+    list style `style`, falling back to its defPPr."""
+    p_attrs, r_attrs = {}, {}
+    if style is None:
+        return p_attrs, r_attrs
+    for tag in (f"{_A}lvl{level}pPr", _A + "defPPr"):
+        p_pr = style.find(tag)
+        if p_pr is None:
+            continue
+        for name, value in p_pr.attrib.items():
+            p_attrs.setdefault(name, _canonical(value))
+        def_rpr = p_pr.find(_A + "defRPr")
+        if def_rpr is not None:
+            for name, value in def_rpr.attrib.items():
+                r_attrs.setdefault(name, _canonical(value))
+    return p_attrs, r_attrs
+
+
+def text_defaults(prs, master):
+    """[(pPr defaults, rPr defaults)] per level (index 0 = lvl 0) for
+    non-placeholder text on slides of `master`.
+
+    Whether such text inherits from the master's otherStyle or from the
+    presentation's defaultTextStyle differs between applications, so only
+    values both agree on are kept.
+    """
+    other = master._element.find(f"{_P}txStyles/{_P}otherStyle")
+    default = prs.part._element.find(_P + "defaultTextStyle")
+    levels = []
+    for level in range(1, 10):
+        other_p, other_r = _level_values(other, level)
+        default_p, default_r = _level_values(default, level)
+        levels.append(tuple(
+            {
+                name: value
+                for name, value in {**fallback, **a}.items()
+                if b.get(name, fallback.get(name)) == value
+            }
+            for a, b, fallback in (
+                (other_p, default_p, _PPR_DEFAULTS),
+                (other_r, default_r, _RPR_DEFAULTS),
+            )
+        ))
+    return levels
+
+
+def _drop_inherited(element, defaults, keep=()):
+    removed = 0
+    for name, value in list(element.attrib.items()):
+        if name not in keep and defaults.get(name) == _canonical(value):
+            del element.attrib[name]
+            removed += 1
+    return removed
+
+
+def _slim_inherited(tx_body, levels):
+    removed = _drop_inherited(tx_body.find(_A + "bodyPr"), _BODY_DEFAULTS)
+    for p in tx_body.iter(_A + "p"):
+        p_pr = p.find(_A + "pPr")
+        level = min(int(p_pr.get("lvl", 0)), 8) if p_pr is not None else 0
+        p_defaults, r_defaults = levels[level]
+        # Set at paragraph level, a run attribute is not redundant
+        paragraph_rpr = ()
+        if p_pr is not None:
+            removed += _drop_inherited(p_pr, p_defaults)
+            def_rpr = p_pr.find(_A + "defRPr")
+            if def_rpr is not None:
+                removed += _drop_inherited(def_rpr, r_defaults)
+                paragraph_rpr = set(def_rpr.attrib)
+        for r_pr in p.iter(_A + "rPr", _A + "endParaRPr"):
+            removed += _drop_inherited(r_pr, r_defaults, paragraph_rpr)
+    return removed
+
+
+# =============================================================================
+# STRUCTURE
+# =============================================================================
+
+def _merge_runs(p):
+    """Merge adjacent runs with identical properties and drop empty runs
+    when the paragraph has text; returns the number of runs removed."""
+    runs = [child for child in p if child.tag in _TEXT_CONTENT]
+    if not any(r.tag != _A + "r" or r.findtext(_A + "t") for r in runs):
+        return 0
+    removed = 0
+    previous = None
+    previous_key = None
+    for child in runs:
+        if child.tag != _A + "r":
+            previous = None
+            continue
+        t = child.find(_A + "t")
+        if t is None or not t.text:
+            p.remove(child)
+            removed += 1
+            continue
+        r_pr = child.find(_A + "rPr")
+        key = b"" if r_pr is None else etree.tostring(r_pr, method="c14n")
+        if previous is not None and key == previous_key and child.getprevious() is previous:
+            previous_t = previous.find(_A + "t")
+            previous_t.text += t.text
+            p.remove(child)
+            removed += 1
+            continue
+        previous, previous_key = child, key
+    return removed
+
+
+def _has_text(tx_body):
+    return any(True for _ in tx_body.iter(*_TEXT_CONTENT))
+
+
+def _drop_empty(root):
+    removed = 0
+    # Reversed document order: children are emptied before their parents
+    for element in reversed(list(root.iter(*_EMPTY_TAGS))):
+        if not element.attrib and len(element) == 0:
+            element.getparent().remove(element)
+            removed += 1
+    return removed
+
+
+# =============================================================================
+# SLIDES
+# =============================================================================
+
+def slim_slide(slide, levels=None):
+    """Minimize the XML of `slide` in place; returns the number of elements
+    and attributes removed. `levels` are the master's text_defaults."""
+    removed = 0
+    sp_tree = slide.shapes._spTree
+    for sp in list(sp_tree.iter(qn("p:sp"))):
+        tx_body = sp.find(qn("p:txBody"))
+        if tx_body is None or sp.find(f"{_P}nvSpPr/{_P}nvPr/{_P}ph") is not None:
+            continue
+        if not _has_text(tx_body):
+            sp.remove(tx_body)
+            removed += 1
+            continue
+        lst_style = tx_body.find(_A + "lstStyle")
+        if levels is not None and (lst_style is None or len(lst_style) == 0):
+            removed += _slim_inherited(tx_body, levels)
+    for p in sp_tree.iter(qn("a:p")):
+        removed += _merge_runs(p)
+    return removed + _drop_empty(sp_tree)
+
+
+def slim_presentation(prs):
+    """Minimize the XML of every slide of `prs` in place; returns the number
+    of elements and attributes removed."""
+    defaults = {}
+    removed = 0
+    for slide in prs.slides:
+        master = slide.slide_layout.slide_master
+        levels = defaults.get(master.part.partname)
+        if levels is None:
+            levels = defaults[master.part.partname] = text_defaults(prs, master)
+        removed += slim_slide(slide, levels)
+    return removed
@@ -0,0 +1,79 @@
+"""
+Streaming row sources for data-driven decks.
+
+Rows come from a CSV export, a Parquet export (decks.columns), a SQLite
+export or a live Postgres database (via psycopg, imported only when a
+postgres:// DSN is used) and are yielded one dict at a time, so generators
+never hold a whole export in memory. SQL sources are read in `order_by`
+order; CSV and Parquet exports are expected to be written in that order
+already.
+"""
+
+import csv
+import sqlite3
+
+
+def iter_csv_rows(path):
+    """Stream rows from a CSV export as dicts."""
+    with open(path, newline="", encoding="utf-8") as f:
+        yield from csv.DictReader(f)
+
+
+def iter_parquet_rows(path):
+    """Stream rows from a Parquet export as dicts, a chunk at a time."""
+    from decks.columns import open_columns
+
+    with open_columns(path) as table:
+        yield from table.rows()
+
+
+def iter_sqlite_rows(path, table, order_by):
+    """Stream rows from a SQLite export in `order_by` order."""
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    conn.row_factory = sqlite3.Row
+    try:
+        cursor = conn.execute(f'SELECT * FROM "{table}" ORDER BY {order_by}')
+        for row in cursor:
+            yield dict(row)
+    finally:
+        conn.close()
+
+
+def iter_postgres_rows(dsn, table, order_by):
+    """Stream rows from Postgres using a server-side cursor."""
+    import psycopg
+
+    with psycopg.connect(dsn) as conn:
+        with conn.cursor(name=f"{table}_rows") as cursor:
+            cursor.itersize = 500
+            cursor.execute(f'SELECT * FROM "{table}" ORDER BY {order_by}')
+            columns = None
+            for row in cursor:
+                if columns is None:
+                    columns = [col.name for col in cursor.description]
+                yield dict(zip(columns, row))
+
+
+def iter_rows(source, table, order_by):
+    """Pick a row source from the shape of `source`."""
+    if source.startswith(("postgres://", "postgresql://")):
+        return iter_postgres_rows(source, table, order_by)
+    if source.endswith((".db", ".sqlite", ".sqlite3")):
+        return iter_sqlite_rows(source, table, order_by)
+    if source.endswith(".parquet"):
+        return iter_parquet_rows(source)
+    return iter_csv_rows(source)
+
+
+def to_int(value):
+    """Integer from an export cell; blanks (and NaN) become 0."""
+    if value in (None, "") or value != value:
+        return 0
+    return int(float(value))
+
+
+def to_float(value):
+    """Float from an export cell; blanks (and NaN) become 0.0."""
+    if value in (None, "") or value != value:
+        return 0.0
+    return float(value)
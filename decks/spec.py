@@ -0,0 +1,140 @@
+"""
+Deck spec files: which generator to run and where to write each deck.
+
+A spec is a JSON file holding a list of deck entries (or an object with a
+"decks" list), or a JSON Lines file with one entry per line:
+
+    {"decks": [
+        {"generator": "cursor_pro", "output": "out/pro.pptx"},
+        {"generator": "basic", "output": "out/basic.pptx", "id": "basic-1"},
+        {"generator": "cursor_pro", "output": "out/wide.pptx", "aspects": ["16:9"]}
+    ]}
+
+"aspects" lists extra slide sizes to derive from the built deck
+(out/wide-16x9.pptx above) without running the generator again.
+
+An output may also be an s3://bucket/key URL (see decks.outputs); such
+decks are streamed to object storage and cannot have "aspects".
+
+Loading and validating a spec is pure Python and imports nothing heavy, so
+`python3 -m decks validate spec.json` runs without loading python-pptx.
+Generators are only imported when an entry is actually built.
+"""
+
+import importlib
+import json
+import os
+
+from decks.outputs import is_remote
+
+# Generator name -> (module, function). Functions take the output path.
+GENERATORS = {
+    "basic": ("decks.basic", "create_presentation"),
+    "cursor": ("decks.cursor", "create_presentation"),
+    "cursor_pro": ("decks.cursor_pro", "create_presentation"),
+}
+
+ENTRY_KEYS = {"generator", "output", "id", "aspects"}
+
+# Slide sizes a deck can be re-laid out to (see decks.aspect)
+ASPECTS = ("4:3", "16:9")
+
+
+class SpecError(ValueError):
+    """A deck spec could not be loaded or failed validation."""
+
+    def __init__(self, errors):
+        if isinstance(errors, str):
+            errors = [errors]
+        self.errors = list(errors)
+        super().__init__("; ".join(self.errors))
+
+
+def load_spec(path):
+    """Read the raw entries of a spec file (JSON or JSON Lines)."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            if path.endswith(".jsonl"):
+                return [json.loads(line) for line in f if line.strip()]
+            data = json.load(f)
+    except (OSError, ValueError) as exc:
+        raise SpecError(f"{path}: {exc}") from exc
+    if isinstance(data, dict):
+        data = data.get("decks")
+    if not isinstance(data, list):
+        raise SpecError(f"{path}: expected a list of decks or {{\"decks\": [...]}}")
+    return data
+
+
+def validate_entries(entries):
+    """Return a list of human-readable problems (empty when the spec is valid)."""
+    errors = []
+    seen_ids = set()
+    seen_outputs = set()
+    for i, entry in enumerate(entries):
+        where = f"deck {i}"
+        if not isinstance(entry, dict):
+            errors.append(f"{where}: expected an object")
+            continue
+        unknown = set(entry) - ENTRY_KEYS
+        if unknown:
+            errors.append(f"{where}: unknown keys {sorted(unknown)}")
+        generator = entry.get("generator")
+        if generator not in GENERATORS:
+            errors.append(
+                f"{where}: unknown generator {generator!r} "
+                f"(choose from {', '.join(sorted(GENERATORS))})"
+            )
+        output = entry.get("output")
+        if not isinstance(output, str) or not output.endswith(".pptx"):
+            errors.append(f"{where}: output must be a .pptx path")
+        elif os.path.normpath(output) in seen_outputs:
+            errors.append(f"{where}: duplicate output {output!r}")
+        else:
+            seen_outputs.add(os.path.normpath(output))
+        aspects = entry.get("aspects", [])
+        if not isinstance(aspects, list) or any(a not in ASPECTS for a in aspects):
+            errors.append(f"{where}: aspects must be a list of {', '.join(ASPECTS)}")
+        elif aspects and is_remote(output):
+            errors.append(f"{where}: aspects need a local output")
+        if "id" in entry:
+            if entry["id"] in seen_ids:
+                errors.append(f"{where}: duplicate id {entry['id']!r}")
+            seen_ids.add(entry["id"])
+    return errors
+
+
+def load_and_validate(path):
+    """Load a spec and raise SpecError listing every problem found."""
+    entries = load_spec(path)
+    errors = validate_entries(entries)
+    if errors:
+        raise SpecError(errors)
+    return entries
+
+
+def entry_id_of(entry):
+    """Stable identifier of a spec entry (its "id", else its output path)."""
+    output = entry["output"]
+    return str(entry.get("id") or (output if is_remote(output) else os.path.normpath(output)))
+
+
+def resolve_generator(name):
+    """Import and return the generator function registered as `name`."""
+    module_name, func_name = GENERATORS[name]
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+def build_entry(entry):
+    """Build one spec entry; return the deck path and any variant paths."""
+    output = entry["output"]
+    directory = os.path.dirname(output)
+    if directory and not is_remote(output):
+        os.makedirs(directory, exist_ok=True)
+    resolve_generator(entry["generator"])(output)
+    outputs = [output]
+    if entry.get("aspects"):
+        from decks.aspect import write_variants
+
+        outputs.extend(write_variants(output, entry["aspects"]))
+    return outputs
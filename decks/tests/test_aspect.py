@@ -0,0 +1,85 @@
+import os
+
+from pptx import Presentation
+from pptx.util import Inches
+
+from decks.aspect import transform_shapes, write_variants
+from decks.masters import add_chrome_slide
+from decks.outputs import save_presentation
+from decks.prototype import SLIDE_SIZES, new_presentation
+
+
+def _shape(shapes, name):
+    return next(shape for shape in shapes if shape.name == name)
+
+
+def _variant(tmp_path):
+    prs = new_presentation()
+    slide = add_chrome_slide(prs, "Pricing", "Plans", footer="Source: cursor.com")
+    slide.shapes.add_table(2, 3, Inches(0.5), Inches(2), Inches(9), Inches(2))
+    path = str(tmp_path / "deck.pptx")
+    save_presentation(prs, path)
+    [output] = write_variants(path, ["16:9"])
+    return output
+
+
+def test_variant_is_written_atomically(tmp_path):
+    output = _variant(tmp_path)
+    assert output == str(tmp_path / "deck-16x9.pptx")
+    assert sorted(os.listdir(tmp_path)) == ["deck-16x9.pptx", "deck.pptx"]
+    prs = Presentation(output)
+    assert (prs.slide_width, prs.slide_height) == SLIDE_SIZES["16:9"]
+
+
+def test_accent_rule_stays_under_title(tmp_path):
+    layout = Presentation(_variant(tmp_path)).slides[0].slide_layout
+    title = _shape(layout.shapes, "Title Placeholder")
+    rule = _shape(layout.shapes, "Accent Rule")
+    assert rule.left == title.left == Inches(0.5)
+    assert rule.width == Inches(2)
+    assert title.width > Inches(9)
+
+
+def test_stretched_table_columns_fill_frame(tmp_path):
+    slide = Presentation(_variant(tmp_path)).slides[0]
+    frame = next(shape for shape in slide.shapes if shape.has_table)
+    widths = [column.width for column in frame.table.columns]
+    assert frame.width > Inches(9)
+    assert sum(widths) == frame.width
+    assert max(widths) - min(widths) <= 1
+
+
+def test_transform_anchors():
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    shapes = slide.shapes
+    # 10in wide 4:3 slide to a 12in wide one of the same height
+    old_size, new_size = (Inches(10), Inches(7.5)), (Inches(12), Inches(7.5))
+    left = shapes.add_textbox(Inches(1), Inches(1), Inches(2), Inches(1))
+    wide = shapes.add_textbox(Inches(0.5), Inches(2), Inches(9), Inches(1))
+    number = shapes.add_textbox(Inches(9), Inches(7), Inches(0.5), Inches(0.3))
+    number.name = "Slide Number"
+    pinned = shapes.add_textbox(Inches(4), Inches(4), Inches(2), Inches(1))
+    pinned.name = "Logo"
+
+    transform_shapes(shapes._spTree, old_size, new_size, anchors={"Logo": "left"})
+    # Narrow shapes keep their place relative to the centre
+    assert (left.left, left.width) == (Inches(2), Inches(2))
+    # Shapes spanning most of the slide stretch with it
+    assert (wide.left, wide.width) == (Inches(0.5), Inches(11))
+    # Named anchors: the slide number stays on the right edge
+    assert number.left == Inches(11)
+    assert pinned.left == Inches(4)
+    assert [s.top for s in (left, wide, number, pinned)] == [
+        Inches(1), Inches(2), Inches(7), Inches(4)
+    ]
+
+
+def test_transform_scales_heights():
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    box = slide.shapes.add_textbox(Inches(1), Inches(2), Inches(2), Inches(1))
+    transform_shapes(slide.shapes._spTree, (Inches(10), Inches(7.5)),
+                     (Inches(10), Inches(5.625)))
+    assert (box.left, box.width) == (Inches(1), Inches(2))
+    assert (box.top, box.height) == (Inches(1.5), Inches(0.75))
@@ -0,0 +1,83 @@
+import csv
+import json
+import os
+
+import pytest
+from PIL import Image
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+from decks.catalogue import (
+    PLACEHOLDER_IMAGE, build_catalogue_deck, generate_catalogue, iter_deck_jobs, iter_listings,
+)
+from decks.manifest import BatchManifest, run_jobs
+
+
+def _listing(i, category):
+    return {"id": str(i), "category": category}
+
+
+def test_deck_jobs_bucket_unsorted_categories():
+    listings = [_listing(i, c) for i, c in enumerate("ABABCAB")]
+    jobs = list(iter_deck_jobs(listings, per_page=1, slides_per_deck=3))
+
+    keys = [(category, part) for category, part, _ in jobs]
+    assert len(keys) == len(set(keys))
+    assert sorted(keys) == [("A", 1), ("A", 2), ("B", 1), ("B", 2), ("C", 1)]
+    ids = sorted(l["id"] for _, _, chunk in jobs for l in chunk)
+    assert ids == sorted(l["id"] for l in listings)
+
+
+def test_run_jobs_refuses_duplicate_outputs(tmp_path):
+    path = str(tmp_path / "deck.pptx")
+    jobs = [("a", path, print, ()), ("b", path, print, ())]
+    with BatchManifest(str(tmp_path / "manifest.jsonl")) as manifest:
+        with pytest.raises(ValueError, match="duplicate"):
+            run_jobs(jobs, manifest, workers=1, executor="thread")
+
+
+def test_unsorted_export_builds_every_listing(tmp_path):
+    export = tmp_path / "products.csv"
+    categories = ["outerwear", "shoes", "outerwear", "bags", "shoes", "outerwear"]
+    with open(export, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "title", "price", "category", "status", "images"])
+        for i, category in enumerate(categories):
+            writer.writerow([i, f"Item {i}", 100 + i, category, "active", ""])
+
+    output_dir = tmp_path / "catalogue"
+    built, skipped, failed, listings = generate_catalogue(
+        str(export), str(output_dir), slides_per_deck=3, workers=2,
+        executor="thread", media="link", image_root=str(tmp_path),
+    )
+
+    assert (built, skipped, failed, listings) == (4, 0, 0, 6)
+    decks = sorted(name for name in os.listdir(output_dir) if name.endswith(".pptx"))
+    assert decks == [
+        "bags-001.pptx", "outerwear-001.pptx", "outerwear-002.pptx",
+        "shoes-001.pptx",
+    ]
+    with open(output_dir / "manifest.jsonl") as f:
+        ids = [json.loads(line)["id"] for line in f]
+    assert len(ids) == len(set(ids)) == 4
+
+
+@pytest.mark.parametrize("media", ["embed", "link"])
+def test_listing_without_photo_gets_the_placeholder(tmp_path, media):
+    Image.new("RGB", (60, 40), (90, 90, 90)).save(tmp_path / PLACEHOLDER_IMAGE)
+    Image.new("RGB", (40, 60), (200, 0, 0)).save(tmp_path / "jacket.jpg")
+    listings = list(iter_listings([
+        {"id": 1, "title": "Jacket", "price": 2500, "category": "outerwear",
+         "images": "jacket.jpg"},
+        {"id": 2, "title": "Scarf", "price": 400, "category": "outerwear", "images": ""},
+    ]))
+    path = str(tmp_path / "outerwear-001.pptx")
+    build_catalogue_deck("outerwear", 1, listings, path, image_root=str(tmp_path),
+                         image_workers=1, media=media)
+
+    assert listings[1]["image"] == PLACEHOLDER_IMAGE
+    slides = Presentation(path).slides
+    # The divider, then one slide per listing, each with a picture
+    assert len(slides) == 3
+    for slide in list(slides)[1:]:
+        assert [shape for shape in slide.shapes if shape.shape_type == MSO_SHAPE_TYPE.PICTURE]
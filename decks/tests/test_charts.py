@@ -0,0 +1,128 @@
+"""ChartBook modes: chart XML, workbooks, and the seller deck chart slide."""
+
+import re
+import zipfile
+
+import pytest
+from pptx import Presentation
+from pptx.chart.data import CategoryChartData
+from pptx.enum.chart import XL_CHART_TYPE
+from pptx.util import Inches
+
+from decks.charts import ChartBook
+from decks.seller_reports import build_seller_deck
+
+CHARTS = 3
+
+
+def _chart_data(i):
+    chart_data = CategoryChartData()
+    chart_data.categories = ["Jackets", "Boots", "Scarves"]
+    chart_data.add_series("Views", (10 * i, 20 * i, 30 * i))
+    chart_data.add_series("Sales", (i, 2 * i, 3 * i))
+    return chart_data
+
+
+def _build(tmp_path, mode):
+    prs = Presentation()
+    book = ChartBook(prs, mode=mode)
+    for i in range(1, CHARTS + 1):
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        frame = book.add_chart(
+            slide, XL_CHART_TYPE.COLUMN_CLUSTERED,
+            Inches(1), Inches(1), Inches(6), Inches(4), _chart_data(i)
+        )
+        assert frame.has_chart
+        assert tuple(frame.chart.plots[0].categories) == ("Jackets", "Boots", "Scarves")
+    book.finish()
+    path = tmp_path / f"{mode}.pptx"
+    prs.save(path)
+    return zipfile.ZipFile(path)
+
+
+def _embeddings(zf):
+    return [name for name in zf.namelist() if name.startswith("ppt/embeddings/")]
+
+
+def _cached_values(chart_xml):
+    return re.findall(rb"<c:v>([^<]*)</c:v>", chart_xml)
+
+
+def test_static_charts_cache_values_without_workbooks(tmp_path):
+    with _build(tmp_path, "static") as zf:
+        assert _embeddings(zf) == []
+        for i in range(1, CHARTS + 1):
+            chart_xml = zf.read(f"ppt/charts/chart{i}.xml")
+            assert b"<c:externalData" not in chart_xml
+            values = _cached_values(chart_xml)
+            for value in (10 * i, 20 * i, 30 * i, i, 2 * i, 3 * i):
+                assert str(value).encode() in values
+            assert f"ppt/charts/_rels/chart{i}.xml.rels" not in zf.namelist()
+
+
+def test_shared_charts_embed_one_workbook(tmp_path):
+    with _build(tmp_path, "shared") as zf:
+        embeddings = _embeddings(zf)
+        assert len(embeddings) == 1
+        target = "../embeddings/" + embeddings[0].rsplit("/", 1)[1]
+        for i in range(1, CHARTS + 1):
+            chart_xml = zf.read(f"ppt/charts/chart{i}.xml")
+            assert b"<c:externalData" in chart_xml
+            assert target.encode() in zf.read(f"ppt/charts/_rels/chart{i}.xml.rels")
+            formulas = re.findall(rb"<c:f>([^<]*)</c:f>", chart_xml)
+            assert formulas == [
+                f"'Chart{i}'!$B$1".encode(),
+                f"'Chart{i}'!$A$2:$A$4".encode(),
+                f"'Chart{i}'!$B$2:$B$4".encode(),
+                f"'Chart{i}'!$C$1".encode(),
+                f"'Chart{i}'!$A$2:$A$4".encode(),
+                f"'Chart{i}'!$C$2:$C$4".encode(),
+            ]
+        with zipfile.ZipFile(zf.open(embeddings[0])) as xlsx:
+            workbook = xlsx.read("xl/workbook.xml")
+            assert re.findall(rb'<sheet name="([^"]*)"', workbook) == [
+                f"Chart{i}".encode() for i in range(1, CHARTS + 1)
+            ]
+            strings = xlsx.read("xl/sharedStrings.xml")
+            for text in (b"Jackets", b"Boots", b"Scarves", b"Views", b"Sales"):
+                assert text in strings
+
+
+def test_embedded_charts_embed_one_workbook_each(tmp_path):
+    with _build(tmp_path, "embedded") as zf:
+        assert len(_embeddings(zf)) == CHARTS
+
+
+def test_shared_mode_rejects_multilevel_categories():
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    chart_data = CategoryChartData()
+    region = chart_data.add_category("Nairobi")
+    region.add_sub_category("Jackets")
+    chart_data.add_series("Views", (1,))
+    with pytest.raises(TypeError):
+        ChartBook(prs, mode="shared").add_chart(
+            slide, XL_CHART_TYPE.COLUMN_CLUSTERED, 0, 0, Inches(4), Inches(3), chart_data
+        )
+
+
+@pytest.mark.parametrize("mode, workbooks", [("static", 0), ("shared", 1)])
+def test_seller_deck_has_product_chart(tmp_path, mode, workbooks):
+    seller = {
+        "seller_id": "s1", "rank_position": 1, "full_name": "Wanjiru Kamau",
+        "location": "Nairobi", "items_sold": 12, "total_views": 3400,
+        "follower_count": 56, "rating": 4.8, "products": [
+            {"title": "Denim Jacket", "price": 2500.0, "views": 1200},
+            {"title": "Leather Boots", "price": 4200.0, "views": 800},
+        ],
+    }
+    path = tmp_path / "seller.pptx"
+    build_seller_deck(seller, "2025-06", str(path), charts=mode)
+
+    prs = Presentation(path)
+    charts = [shape.chart for slide in prs.slides for shape in slide.shapes if shape.has_chart]
+    assert len(charts) == 1
+    assert tuple(charts[0].plots[0].categories) == ("Denim Jacket", "Leather Boots")
+    assert charts[0].plots[0].series[0].values == (1200, 800)
+    with zipfile.ZipFile(path) as zf:
+        assert len(_embeddings(zf)) == workbooks
@@ -0,0 +1,97 @@
+import csv
+import tracemalloc
+import numpy as np
+import pytest
+
+from decks import columns
+from decks.columns import MappedCSV, open_columns
+
+ROWS = [
+    ["id", "title", "price", "note"],
+    ["1", "Plain", "10.5", ""],
+    ["2", 'Denim, "vintage" jacket', "20", "two\nlines"],
+    ["3", "Tee", "", 'ends with quote"'],
+    ["4", "", "7", "crlf"],
+]
+
+
+def _write(path, rows, lineterminator="\r\n"):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        csv.writer(f, lineterminator=lineterminator).writerows(rows)
+    return str(path)
+
+
+def _expected(rows):
+    return {name: [row[i] for row in rows[1:]] for i, name in enumerate(rows[0])}
+
+
+@pytest.mark.parametrize("lineterminator", ["\n", "\r\n"])
+def test_quoted_fields_match_csv_module(tmp_path, lineterminator):
+    path = _write(tmp_path / "export.csv", ROWS, lineterminator)
+    with open_columns(path, {"title": str, "note": str}) as table:
+        assert len(table) == 4
+        assert table["title"].tolist() == _expected(ROWS)["title"]
+        assert table["note"].tolist() == _expected(ROWS)["note"]
+        assert table["id"].tolist() == [1, 2, 3, 4]
+        assert np.isnan(table["price"][2]) and table["price"][1] == 20.0
+
+
+def test_quotes_are_tracked_per_block(tmp_path, monkeypatch):
+    rows = [ROWS[0]] + [
+        [
+            str(i), f'Item "{i}", size M' if i % 7 == 0 else f"Item {i}", str(i),
+            "a\nb" if i % 5 == 0 else "x",
+        ]
+        for i in range(500)
+    ]
+    path = _write(tmp_path / "export.csv", rows)
+    # Small blocks put block boundaries next to and inside quoted fields
+    monkeypatch.setattr(columns, "BLOCK_BYTES", 97)
+    source = MappedCSV(path)
+    with source:
+        blocks = list(source._blocks())
+        assert len(blocks) > 50
+        values = source.columns(["title", "note"], {"title": str, "note": str})
+        assert len(source) == 500
+    assert values["title"].tolist() == _expected(rows)["title"]
+    assert values["note"].tolist() == _expected(rows)["note"]
+
+
+def test_no_python_rows_for_quoted_files(tmp_path, monkeypatch):
+    path = _write(tmp_path / "export.csv", ROWS)
+    # csv.reader is only used for the header line
+    calls = []
+    reader = csv.reader
+    monkeypatch.setattr(csv, "reader", lambda lines, **kw: calls.append(lines) or reader(lines, **kw))
+    with open_columns(path) as table:
+        table.load("title", "note")
+    assert len(calls) == 1
+
+
+def test_table_closes_memory_map(tmp_path):
+    path = _write(tmp_path / "export.csv", ROWS)
+    with open_columns(path) as table:
+        table.load("id")
+    assert table.source._map.closed
+    assert table.source._file.closed
+
+
+def test_one_long_field_does_not_widen_the_column(tmp_path):
+    rows = [["id", "description"]] + [
+        [str(i), "x" * 2000 if i == 7 else f'Item {i}, "nice"'] for i in range(20000)
+    ]
+    path = _write(tmp_path / "export.csv", rows)
+    tracemalloc.start()
+    try:
+        with open_columns(path) as table:
+            description = table["description"]
+            ids = table["id"]
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    # A fixed-width column would take 20,000 x 2,000 x 4 bytes
+    assert peak < 32 << 20
+    assert description.dtype == columns.STRING
+    assert description[7] == "x" * 2000
+    assert description.tolist()[8:10] == ['Item 8, "nice"', 'Item 9, "nice"']
+    assert ids.tolist() == list(range(20000))
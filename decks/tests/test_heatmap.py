@@ -0,0 +1,69 @@
+"""Heatmap color scales and the grids drawn from them."""
+
+import numpy as np
+import pytest
+from pptx import Presentation
+from pptx.util import Inches
+
+from decks.heatmap import MISSING_COLOR, PALETTES, add_heatmap, heat_colors
+
+
+def test_linear_scale_hits_the_palette_stops():
+    fill, text = heat_colors([[0, 5, 10]], palette="green")
+    low, high = PALETTES["green"]
+    assert (fill[0, 0], fill[0, 2]) == (low, high)
+    # Halfway between 262626 and 22C55E, channel by channel
+    assert fill[0, 1] == "%02X%02X%02X" % (
+        round((0x26 + 0x22) / 2), round((0x26 + 0xC5) / 2), round((0x26 + 0x5E) / 2)
+    )
+    assert text.tolist() == [["FFFFFF", "FFFFFF", "121212"]]
+
+
+def test_diverging_palette_and_bins():
+    fill, _ = heat_colors(np.array([-1.0, 0.0, 1.0]), palette="diverging")
+    assert fill.tolist() == list(PALETTES["diverging"])
+
+    # Four bins: 0 and 0.2 share the lowest step, 1.0 is the highest
+    fill, _ = heat_colors([0.0, 0.2, 0.4, 0.6, 1.0], palette=("000000", "FFFFFF"), bins=4)
+    assert fill.tolist() == ["000000", "000000", "555555", "AAAAAA", "FFFFFF"]
+
+
+def test_missing_values_and_fixed_range():
+    fill, _ = heat_colors([[np.nan, 1.0], [2.0, 3.0]], palette=("000000", "FFFFFF"),
+                          vmin=1.0, vmax=5.0)
+    assert fill.tolist() == [[MISSING_COLOR, "000000"], ["404040", "808080"]]
+
+    # Constant and all-missing matrices do not divide by zero
+    assert heat_colors([4, 4], palette=("000000", "FFFFFF"))[0].tolist() == ["000000"] * 2
+    assert heat_colors([np.nan])[0].tolist() == [MISSING_COLOR]
+
+
+def _cells(frame):
+    return [[cell for cell in row.cells] for row in frame.table.rows]
+
+
+@pytest.mark.parametrize("mode", ["table", "shapes"])
+def test_grid_matches_the_colors(tmp_path, mode):
+    values = np.array([[1.0, 2.0, np.nan], [4.0, 5.0, 6.0]])
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    add_heatmap(slide, values, Inches(0.5), Inches(1), Inches(9), Inches(4), mode=mode,
+                row_labels=["Jackets", "Boots"], column_labels=["W1", "W2", "W3"], totals=True)
+    prs.save(tmp_path / "heatmap.pptx")
+
+    slide = Presentation(tmp_path / "heatmap.pptx").slides[0]
+    fill, _ = heat_colors(values)
+    if mode == "table":
+        (frame,) = slide.shapes
+        grid = [[(c.text, c.fill.fore_color.rgb) for c in row] for row in _cells(frame)]
+        assert len(grid) == 4 and all(len(row) == 5 for row in grid)
+        assert [text for text, _ in grid[0]] == ["", "W1", "W2", "W3", "Total"]
+        body = [[(text, str(rgb)) for text, rgb in row[1:4]] for row in grid[1:3]]
+    else:
+        shapes = list(slide.shapes)
+        assert len(shapes) == 4 * 5
+        grid = [shapes[i:i + 5] for i in range(0, 20, 5)]
+        body = [[(s.text_frame.text, str(s.fill.fore_color.rgb)) for s in row[1:4]]
+                for row in grid[1:3]]
+    assert [[rgb for _, rgb in row] for row in body] == fill.tolist()
+    assert [[text for text, _ in row] for row in body] == [["1", "2", ""], ["4", "5", "6"]]
@@ -0,0 +1,95 @@
+"""Batch manifest: journal reload, resume, retries and duplicate jobs."""
+
+import json
+
+import pytest
+
+from decks.manifest import DONE, FAILED, PENDING, BatchManifest, run_jobs
+from decks.progress import ProgressReporter
+
+
+def _write(path, text):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def _fail_for(bad):
+    def build(path, name):
+        if name in bad:
+            raise RuntimeError(f"cannot build {name}")
+        _write(path, name)
+    return build
+
+
+def _jobs(tmp_path, names, build):
+    return [(name, str(tmp_path / f"{name}.pptx"), build, (str(tmp_path / f"{name}.pptx"), name))
+            for name in names]
+
+
+def _run(tmp_path, jobs, **kwargs):
+    with BatchManifest(str(tmp_path / "manifest.jsonl")) as manifest:
+        return run_jobs(jobs, manifest, workers=2, retries=0, backoff=0,
+                        reporter=ProgressReporter(), executor="thread", **kwargs)
+
+
+def test_reload_ignores_a_torn_last_line(tmp_path):
+    path = tmp_path / "manifest.jsonl"
+    with BatchManifest(str(path)) as manifest:
+        manifest.mark_done("a", "a.pptx", sha256="0" * 64)
+        manifest.mark_failed("b", "boom")
+        manifest.mark_done("b", "b.pptx")
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"id": "c", "state": "do')
+
+    with BatchManifest(str(path)) as manifest:
+        assert len(manifest) == 2
+        assert manifest.state("a") == DONE
+        # A later line supersedes an earlier one
+        assert manifest.state("b") == DONE
+        assert manifest.state("c") == PENDING
+        assert manifest.record("a")["sha256"] == "0" * 64
+
+
+def test_resume_skips_done_and_retries_failed(tmp_path):
+    names = ["a", "b", "c", "d"]
+    assert _run(tmp_path, _jobs(tmp_path, names, _fail_for({"c"}))) == (3, 0, 1)
+    with BatchManifest(str(tmp_path / "manifest.jsonl")) as manifest:
+        assert manifest.state("c") == FAILED
+        assert manifest.counts() == {DONE: 3, FAILED: 1}
+
+    # Only the failed deck and the one whose output went missing are rebuilt
+    (tmp_path / "a.pptx").unlink()
+    built = []
+
+    def build(path, name):
+        built.append(name)
+        _write(path, name)
+
+    assert _run(tmp_path, _jobs(tmp_path, names, build)) == (2, 2, 0)
+    assert sorted(built) == ["a", "c"]
+
+    with open(tmp_path / "manifest.jsonl", encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert sorted(r["id"] for r in records[-2:]) == ["a", "c"]
+    assert all(r["state"] == DONE for r in records[-2:])
+
+
+def test_existing_outputs_are_adopted_without_a_manifest(tmp_path):
+    _write(tmp_path / "a.pptx", "built earlier")
+    built = []
+
+    def build(path, name):
+        built.append(name)
+        _write(path, name)
+
+    assert _run(tmp_path, _jobs(tmp_path, ["a", "b"], build)) == (1, 1, 0)
+    assert built == ["b"]
+    with BatchManifest(str(tmp_path / "manifest.jsonl")) as manifest:
+        assert manifest.is_done("a", str(tmp_path / "a.pptx"))
+
+
+def test_duplicate_jobs_are_refused(tmp_path):
+    build = _fail_for(set())
+    jobs = _jobs(tmp_path, ["a", "b"], build)
+    with pytest.raises(ValueError, match="duplicate batch job"):
+        _run(tmp_path, jobs + [("c", jobs[0][1], build, jobs[0][3])])
@@ -0,0 +1,66 @@
+"""Markup parsing: spans, bullets, escapes, and plain strings kept plain."""
+
+import pytest
+from pptx import Presentation
+from pptx.util import Inches
+
+from decks.ir import SlideIR
+from decks.markup import Span, parse_markup, plain_text
+
+
+def _span(text, bold=False, italic=False, color=None, link=None):
+    return Span(text, bold, italic, color, link)
+
+
+def test_inline_markers():
+    assert parse_markup("**Pro**: $20/mo with {green:usage credits}").spans == (
+        _span("Pro", bold=True), _span(": $20/mo with "), _span("usage credits", color="green"),
+    )
+    assert parse_markup("*a* [docs](https://cursor.com/docs)").spans == (
+        _span("a", italic=True), _span(" "), _span("docs", link="https://cursor.com/docs"),
+    )
+    assert parse_markup("**bold {#3B82F6:and blue}**").spans == (
+        _span("bold ", bold=True), _span("and blue", bold=True, color="#3B82F6"),
+    )
+
+
+def test_bullets_and_levels():
+    paragraph = parse_markup("    - nested")
+    assert (paragraph.level, paragraph.bullet) == (2, True)
+    assert plain_text("    - nested") == "nested"
+    assert parse_markup("• top").bullet
+    assert not parse_markup("-not a bullet").bullet
+
+
+def test_escapes():
+    assert plain_text(r"\*\*not bold\*\*") == "**not bold**"
+
+
+@pytest.mark.parametrize("text", [
+    "5 * 3 = 15",
+    "a ** b",
+    "[draft] pricing",
+    "{x} and }",
+    "cost {",
+    "at {hh:mm}",
+    "[x](https://unclosed",
+    "*crossed {blue:markers* here}",
+])
+def test_plain_strings_stay_plain(text):
+    assert parse_markup(text).spans == (_span(text),)
+
+
+def test_rich_textbox_renders_plain_text(tmp_path):
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    items = ["- 5 * 3 [beta]", "- **Teams** {purple:SSO}"]
+    scene = SlideIR()
+    scene.rich_textbox(Inches(1), Inches(1), Inches(4), Inches(2), items,
+                       font_size=9, font_color="FFFFFF")
+    scene.render(slide)
+    prs.save(tmp_path / "markup.pptx")
+
+    shape = Presentation(tmp_path / "markup.pptx").slides[0].shapes[0]
+    paragraphs = shape.text_frame.paragraphs
+    assert [p.text for p in paragraphs] == ["5 * 3 [beta]", "Teams SSO"]
+    assert [run.font.bold for run in paragraphs[1].runs][0]
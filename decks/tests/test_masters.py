@@ -0,0 +1,70 @@
+"""Shared chrome layouts: reuse, slide numbers and footer placeholders."""
+
+from pptx import Presentation
+from pptx.oxml.ns import qn
+
+from decks.helpers import CURSOR_GREEN, CURSOR_PURPLE
+from decks.masters import (
+    COMPACT_TITLE_BLOCK, FOOTER_IDX, SUBTITLE_IDX, add_blank_chrome_slide, add_chrome_slide,
+    get_chrome_layout,
+)
+from decks.prototype import new_presentation
+
+
+def test_layouts_are_created_once_per_block_and_accent(tmp_path):
+    prs = new_presentation()
+    before = len(prs.slide_layouts)
+    first = add_chrome_slide(prs, "One", "Sub", CURSOR_PURPLE)
+    second = add_chrome_slide(prs, "Two", "Sub", CURSOR_PURPLE)
+    assert second.slide_layout.part is first.slide_layout.part
+    assert get_chrome_layout(prs, CURSOR_PURPLE).part is first.slide_layout.part
+    assert len(prs.slide_layouts) == before + 1
+
+    add_chrome_slide(prs, "Three", "Sub", CURSOR_GREEN)
+    add_chrome_slide(prs, "Four", "Sub", CURSOR_PURPLE, block=COMPACT_TITLE_BLOCK)
+    blank = add_blank_chrome_slide(prs)
+    assert add_blank_chrome_slide(prs).slide_layout.part is blank.slide_layout.part
+    assert len(prs.slide_layouts) == before + 4
+
+    # Layouts are found again by name after a save
+    prs.save(tmp_path / "deck.pptx")
+    prs = Presentation(tmp_path / "deck.pptx")
+    count = len(prs.slide_layouts)
+    add_chrome_slide(prs, "Five", "Sub", CURSOR_PURPLE)
+    assert len(prs.slide_layouts) == count
+    ids = [entry.get("id") for entry in prs.slide_master._element.iter(qn("p:sldLayoutId"))]
+    assert len(ids) == len(set(ids))
+
+
+def test_slide_number_is_a_layout_field():
+    prs = new_presentation()
+    slide = add_chrome_slide(prs, "Title", "Sub", CURSOR_PURPLE)
+    blank = add_blank_chrome_slide(prs)
+    for layout in (slide.slide_layout, blank.slide_layout):
+        fields = list(layout._element.iter(qn("a:fld")))
+        assert [field.get("type") for field in fields] == ["slidenum"]
+    # Slides carry no chrome of their own
+    for s in (slide, blank):
+        assert not list(s._element.iter(qn("a:fld")))
+    assert [shape.name for shape in blank.shapes] == []
+
+
+def test_footer_fills_the_layout_placeholder():
+    prs = new_presentation()
+    footer = "Sources: cursor.com/docs"
+    slide = add_chrome_slide(prs, "Title", None, CURSOR_PURPLE, footer=footer)
+
+    layout_footer = slide.slide_layout.placeholders.get(idx=FOOTER_IDX)
+    assert layout_footer.width > 0
+    slide_footer = slide.placeholders[FOOTER_IDX]
+    assert slide_footer.text_frame.text == footer
+    # Position and formatting are inherited from the layout, not copied
+    assert slide_footer._element.spPr.find(qn("a:xfrm")) is None
+    assert (slide_footer.left, slide_footer.width) == (layout_footer.left, layout_footer.width)
+    assert slide_footer.text_frame.paragraphs[0].runs[0].font.size is None
+    assert any(run.hyperlink.address for run in slide_footer.text_frame.paragraphs[0].runs)
+
+    # No subtitle placeholder is left empty on the slide
+    assert SUBTITLE_IDX not in [ph.placeholder_format.idx for ph in slide.placeholders]
+    assert slide.shapes.title.text == "Title"
+    assert add_chrome_slide(prs, "Plain", "Sub", CURSOR_PURPLE).placeholders[SUBTITLE_IDX]
@@ -0,0 +1,168 @@
+"""Linked drafts and finalize; clips: the in-memory clip cache, GIF posters
+and embedding."""
+
+import io
+import os
+import pathlib
+import zipfile
+
+import pytest
+from PIL import Image
+from pptx import Presentation
+from pptx.util import Inches
+
+from decks import media
+
+
+@pytest.fixture(autouse=True)
+def empty_clip_cache(monkeypatch):
+    monkeypatch.setattr(media, "_clips", media.OrderedDict())
+    monkeypatch.setattr(media, "_clip_bytes", 0)
+
+
+def _gif(path, frames=3, size=(40, 20)):
+    images = [Image.new("RGB", size, (80 * i, 0, 0)) for i in range(frames)]
+    images[0].save(path, save_all=True, append_images=images[1:], duration=100, loop=0)
+    return path
+
+
+def _jpeg(path, size):
+    Image.new("RGB", size, (0, 120, 200)).save(path, "JPEG")
+    return str(path)
+
+
+def _draft(tmp_path, medias):
+    """A deck with one linked picture per LinkedMedia, each in a 4 x 4 in box."""
+    prs = Presentation()
+    for linked in medias:
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        media.add_linked_picture(slide, linked, Inches(1), Inches(1), Inches(4), Inches(4))
+    path = tmp_path / "draft.pptx"
+    prs.save(path)
+    return path
+
+
+def _blips(slide):
+    return [pic.find(f"{media._P}blipFill/{media._A}blip")
+            for pic in slide._element.iter(media._P + "pic")]
+
+
+def _write(path, data):
+    with open(path, "wb") as f:
+        f.write(data)
+    return str(path)
+
+
+def test_local_clips_are_read_once_while_unchanged(tmp_path):
+    path = _write(tmp_path / "a.mp4", b"v1" * 10)
+    first = media.load_clip(path)
+    assert media.load_clip(path) is first
+
+    _write(path, b"v2" * 11)
+    second = media.load_clip(path)
+    assert second.data == b"v2" * 11
+    assert second.sha1 != first.sha1
+    # The old version is dropped rather than kept until evicted
+    assert list(media._clips) == [(path, os.stat(path).st_mtime_ns, 22)]
+
+
+def test_clip_cache_is_bounded_by_bytes(tmp_path, monkeypatch):
+    monkeypatch.setattr(media, "CLIP_CACHE_BYTES", 100)
+    paths = [_write(tmp_path / f"{i}.mp4", bytes([i]) * 40) for i in range(3)]
+    for path in paths:
+        media.load_clip(path)
+    assert [key[0] for key in media._clips] == paths[1:]
+    assert media._clip_bytes == 80
+
+    big = _write(tmp_path / "big.mp4", b"x" * 101)
+    assert media.load_clip(big).data == b"x" * 101
+    assert big not in [key[0] for key in media._clips]
+
+
+def test_remote_clips_are_fetched_every_time(monkeypatch):
+    fetches = []
+
+    def read_media(location):
+        fetches.append(location)
+        return f"clip {len(fetches)}".encode()
+
+    monkeypatch.setattr(media, "read_media", read_media)
+    url = "https://cdn.outfittr.co.ke/demo.mp4"
+    assert media.load_clip(url).data == b"clip 1"
+    assert media.load_clip(url).data == b"clip 2"
+    assert media.load_clip(url).mime_type == "video/mp4"
+    assert not media._clips
+
+
+def test_gif_poster_is_cached_by_sha1(tmp_path):
+    clip = media.load_clip(str(_gif(tmp_path / "a.gif")))
+    assert media.is_gif(clip)
+    png, width, height = media.poster_frame(clip, cache_dir=str(tmp_path / "posters"))
+    assert (width, height) == (40, 20)
+    assert os.listdir(tmp_path / "posters") == [clip.sha1 + ".png"]
+    with Image.open(io.BytesIO(png)) as image:
+        assert image.format == "PNG"
+
+
+def test_add_media_embeds_a_gif_once(tmp_path):
+    path = str(_gif(tmp_path / "a.gif"))
+    prs = Presentation()
+    for _ in range(2):
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        shape = media.add_media(slide, path, Inches(1), Inches(1), Inches(4), Inches(4),
+                                cache_dir=str(tmp_path / "posters"))
+        # Fitted into the box at the GIF's 2:1 aspect ratio
+        assert shape.width == Inches(4) and shape.height == Inches(2)
+    out = io.BytesIO()
+    prs.save(out)
+    with zipfile.ZipFile(out) as zf:
+        assert len([name for name in zf.namelist() if name.startswith("ppt/media/")]) == 1
+
+
+def test_draft_links_pictures_without_media_parts(tmp_path):
+    _jpeg(tmp_path / "wide.jpg", (200, 100))
+    linked = media.link_media("wide.jpg", root=str(tmp_path))
+    assert linked == media.LinkedMedia((tmp_path / "wide.jpg").as_uri(), 200, 100)
+    path = _draft(tmp_path, [linked])
+    with zipfile.ZipFile(path) as zf:
+        assert not [name for name in zf.namelist() if name.startswith("ppt/media/")]
+
+    slide = Presentation(path).slides[0]
+    (blip,) = _blips(slide)
+    r_id = blip.get(media._R + "link")
+    assert blip.get(media._R + "embed") is None
+    rel = slide.part.rels[r_id]
+    assert rel.is_external and rel.target_ref == linked.target
+    # The known size fits the picture at 2:1 inside the box
+    (picture,) = slide.shapes
+    assert (picture.width, picture.height) == (Inches(4), Inches(2))
+    assert media.link_media("missing.jpg", root=str(tmp_path)) is None
+
+
+def test_finalize_embeds_shared_parts_and_refits(tmp_path):
+    target = pathlib.Path(_jpeg(tmp_path / "tall.jpg", (100, 200))).as_uri()
+    # Remote drafts only know the box, so the pictures start square
+    unsized = media.LinkedMedia(target, None, None)
+    missing = media.LinkedMedia((tmp_path / "gone.jpg").as_uri(), None, None)
+    path = _draft(tmp_path, [unsized, unsized, missing])
+    output = tmp_path / "final.pptx"
+
+    assert media.finalize_deck(str(path), str(output)) == (2, [missing.target])
+
+    with zipfile.ZipFile(output) as zf:
+        assert len([name for name in zf.namelist() if name.startswith("ppt/media/")]) == 1
+    slides = Presentation(output).slides
+    for slide in list(slides)[:2]:
+        (blip,) = _blips(slide)
+        assert blip.get(media._R + "link") is None
+        assert slide.part.rels[blip.get(media._R + "embed")].reltype == media._RT_IMAGE
+        assert not [rel for rel in slide.part.rels.values() if rel.is_external]
+        (picture,) = slide.shapes
+        assert (picture.width, picture.height) == (Inches(2), Inches(4))
+        assert (picture.left, picture.top) == (Inches(2), Inches(1))
+
+    # The missing target stays linked
+    (blip,) = _blips(slides[2])
+    rel = slides[2].part.rels[blip.get(media._R + "link")]
+    assert rel.is_external and rel.target_ref == missing.target
+    assert blip.get(media._R + "embed") is None
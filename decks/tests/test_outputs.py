@@ -0,0 +1,172 @@
+import io
+import os
+import threading
+import zipfile
+
+import pytest
+from pptx.util import Inches
+
+from decks.masters import add_blank_chrome_slide
+from decks.ooxml import PackageError, validate_package
+from decks.outputs import (
+    STORED_EXTENSIONS, MemoryOutput, S3Output, save_presentation, write_package,
+)
+from decks.prototype import new_presentation
+
+GIF = os.path.join(
+    os.path.dirname(__file__), "..", "..", "public", "collections", "Animated Scroll.gif"
+)
+
+
+def _broken_deck():
+    prs = new_presentation()
+    slide = add_blank_chrome_slide(prs)
+    shape = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(2), Inches(1))
+    # A hyperlink to a relationship the slide does not have
+    run = shape.text_frame.paragraphs[0].add_run()
+    run.text = "link"
+    run.hyperlink.address = "https://outfittr.co.ke"
+    slide.part.drop_rel(run._r.rPr.hlinkClick.rId)
+    return prs
+
+
+def test_checked_save_publishes_valid_deck(tmp_path):
+    prs = new_presentation()
+    add_blank_chrome_slide(prs)
+    output = save_presentation(prs, str(tmp_path / "deck.pptx"), check=True)
+    assert os.listdir(tmp_path) == ["deck.pptx"]
+    assert output.size == os.path.getsize(tmp_path / "deck.pptx")
+
+
+def test_checked_save_rejects_broken_deck(tmp_path):
+    path = str(tmp_path / "deck.pptx")
+    with pytest.raises(PackageError, match="deck.pptx"):
+        save_presentation(_broken_deck(), path, check=True)
+    assert os.listdir(tmp_path) == []
+
+    output = MemoryOutput()
+    with pytest.raises(PackageError):
+        save_presentation(_broken_deck(), output, check=True)
+    assert output.value is None
+
+
+class FakeS3:
+    """The boto3 S3 client methods S3Output uses, kept in memory."""
+
+    def __init__(self, fail_part=None):
+        self.fail_part = fail_part
+        self.objects = {}
+        self.uploads = {}
+        self.aborted = []
+        self.lock = threading.Lock()
+
+    def put_object(self, Bucket, Key, Body):
+        self.objects[Bucket, Key] = Body
+
+    def create_multipart_upload(self, Bucket, Key):
+        upload_id = f"upload-{len(self.uploads) + 1}"
+        self.uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        if PartNumber == self.fail_part:
+            raise OSError("connection reset")
+        with self.lock:
+            self.uploads[UploadId][PartNumber] = Body
+        return {"ETag": f'"{PartNumber}"'}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        parts = self.uploads.pop(UploadId)
+        numbers = [part["PartNumber"] for part in MultipartUpload["Parts"]]
+        assert numbers == sorted(parts) == list(range(1, len(parts) + 1))
+        self.objects[Bucket, Key] = b"".join(parts[n] for n in numbers)
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.aborted.append(UploadId)
+        self.uploads.pop(UploadId)
+
+
+def _media_deck():
+    prs = new_presentation()
+    slide = add_blank_chrome_slide(prs)
+    slide.shapes.add_picture(GIF, Inches(1), Inches(1))
+    return prs
+
+
+def _members(data):
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        return {info.filename: (info.compress_type, zf.read(info)) for info in zf.infolist()}
+
+
+def test_write_package_stores_media_uncompressed():
+    prs = _media_deck()
+    ours, theirs = io.BytesIO(), io.BytesIO()
+    write_package(prs, ours)
+    prs.save(theirs)
+
+    members = _members(ours.getvalue())
+    reference = _members(theirs.getvalue())
+    assert members.keys() == reference.keys()
+    for name, (compression, data) in members.items():
+        if name != "[Content_Types].xml":
+            assert data == reference[name][1], name
+        media = name.rpartition(".")[2] in STORED_EXTENSIONS
+        expected = zipfile.ZIP_STORED if media else zipfile.ZIP_DEFLATED
+        assert compression == expected, name
+    assert any(name.endswith(".gif") for name in members)
+    assert validate_package(io.BytesIO(ours.getvalue()), workers=1) == []
+
+
+def test_small_deck_is_one_put():
+    client = FakeS3()
+    output = save_presentation(new_presentation(), S3Output("decks", "a.pptx", client=client))
+    body = client.objects["decks", "a.pptx"]
+    assert output.size == len(body)
+    assert not client.uploads and not client.aborted
+    zipfile.ZipFile(io.BytesIO(body)).testzip()
+
+
+def test_large_deck_is_uploaded_in_parts():
+    client = FakeS3()
+    output = S3Output("decks", "b.pptx", client=client, part_size=16 << 10,
+                      max_in_flight=2, upload_workers=2)
+    uploaded = []
+    original = client.upload_part
+
+    def upload_part(**kwargs):
+        uploaded.append(len(kwargs["Body"]))
+        return original(**kwargs)
+
+    client.upload_part = upload_part
+    save_presentation(_media_deck(), output)
+
+    expected = MemoryOutput()
+    save_presentation(_media_deck(), expected)
+    body = client.objects["decks", "b.pptx"]
+    assert len(uploaded) == -(-len(body) // (16 << 10)) > 2
+    assert all(size == 16 << 10 for size in uploaded[:-1])
+    assert 0 < uploaded[-1] <= 16 << 10
+    assert output.size == len(body)
+    assert {k: v[1] for k, v in _members(body).items() if k != "docProps/core.xml"} == {
+        k: v[1] for k, v in _members(expected.value).items() if k != "docProps/core.xml"
+    }
+
+
+def test_failed_part_aborts_upload():
+    client = FakeS3(fail_part=2)
+    output = S3Output("decks", "c.pptx", client=client, part_size=16 << 10)
+    with pytest.raises(OSError, match="connection reset"):
+        save_presentation(_media_deck(), output)
+    assert client.aborted == ["upload-1"]
+    assert not client.objects and not client.uploads
+
+
+def test_failed_build_aborts_upload():
+    client = FakeS3()
+    output = S3Output("decks", "d.pptx", client=client, part_size=16 << 10)
+    with pytest.raises(RuntimeError):
+        with output.open() as stream:
+            stream.write(b"x" * (40 << 10))
+            raise RuntimeError("builder failed")
+    assert client.aborted == ["upload-1"]
+    assert not client.objects
@@ -0,0 +1,69 @@
+"""The python-pptx internals decks relies on are still there and behave.
+
+decks.links allocates hyperlink relationships straight into a part's
+relationship map, and decks.outputs writes the package relationships
+itself. Both depend on python-pptx 1.0.2 (pinned in decks/requirements.txt);
+if an upgrade changes these internals, this file fails first.
+"""
+
+import io
+import os
+import re
+import zipfile
+
+import pptx
+from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import _Relationship, _Relationships
+
+from decks.links import registry_for
+from decks.outputs import write_package
+from decks.prototype import new_presentation
+
+REQUIREMENTS = os.path.join(os.path.dirname(os.path.dirname(__file__)), "requirements.txt")
+
+
+def test_installed_python_pptx_is_the_pinned_one():
+    with open(REQUIREMENTS, encoding="utf-8") as f:
+        pinned = re.search(r"^python-pptx==(\S+)$", f.read(), re.MULTILINE).group(1)
+    assert pptx.__version__ == pinned
+
+
+def test_relationship_internals():
+    prs = Presentation()
+    rels = prs.slides.add_slide(prs.slide_layouts[6]).part.rels
+    assert isinstance(rels, _Relationships)
+    assert isinstance(rels._rels, dict)
+    assert isinstance(rels._base_uri, str)
+    assert isinstance(prs.part.package._rels, _Relationships)
+    rel = _Relationship(rels._base_uri, "rId99", RT.HYPERLINK, "External", "https://x.co")
+    assert (rel.rId, rel.reltype, rel.is_external, rel.target_ref) == (
+        "rId99", RT.HYPERLINK, True, "https://x.co"
+    )
+
+
+def test_batched_hyperlinks_round_trip():
+    prs = new_presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    urls = [f"https://outfittr.co.ke/p/{i}" for i in range(20)]
+    rids = registry_for(prs).rids(slide.part, urls)
+
+    assert len(set(rids.values())) == len(urls)
+    for url, rid in rids.items():
+        assert slide.part.target_ref(rid) == url
+    # python-pptx keeps allocating free rIds after the batch
+    assert slide.part.relate_to("https://cursor.com", RT.HYPERLINK, is_external=True) not in (
+        rids.values()
+    )
+
+    stream = io.BytesIO()
+    write_package(prs, stream)
+    stream.seek(0)
+    with zipfile.ZipFile(stream) as zf:
+        assert b"officeDocument" in zf.read("_rels/.rels")
+        slide_rels = zf.read("ppt/slides/_rels/slide1.xml.rels").decode()
+    for url in urls:
+        assert f'Target="{url}"' in slide_rels
+    stream.seek(0)
+    reopened = Presentation(stream).slides[0].part
+    assert {reopened.target_ref(rid) for rid in rids.values()} == set(urls)
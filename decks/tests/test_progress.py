@@ -0,0 +1,62 @@
+"""Progress events of batch runs: counts, stats and worker ids."""
+
+import importlib
+import os
+import threading
+
+import pytest
+from pptx import Presentation
+
+from decks.manifest import BatchManifest, run_jobs
+from decks.progress import ProgressReporter, deck_run, use_reporter, worker_id
+
+DECKS = 8
+WORKERS = 4
+
+
+def _build(path, barrier):
+    with deck_run(path) as deck:
+        # Hold every worker thread busy at once so each builds a deck
+        barrier.wait(timeout=10)
+        with open(path, "wb") as f:
+            f.write(b"deck")
+        deck.saved(path)
+
+
+def test_main_thread_worker_id_is_the_pid():
+    assert worker_id() == os.getpid()
+
+
+def test_thread_pool_workers_are_told_apart(tmp_path):
+    events = []
+    reporter = ProgressReporter([events.append])
+    barrier = threading.Barrier(WORKERS)
+    jobs = (
+        (f"deck-{i}", str(tmp_path / f"deck-{i}.pptx"), _build,
+         (str(tmp_path / f"deck-{i}.pptx"), barrier))
+        for i in range(DECKS)
+    )
+    with BatchManifest(str(tmp_path / "manifest.jsonl")) as manifest:
+        assert run_jobs(jobs, manifest, workers=WORKERS, reporter=reporter,
+                        executor="thread") == (DECKS, 0, 0)
+
+    finished = [e for e in events if e["event"] == "deck_finished"]
+    assert len(finished) == DECKS
+    workers = {e["worker"] for e in finished}
+    assert len(workers) == WORKERS
+    assert all(str(worker).startswith(f"{os.getpid()}/") for worker in workers)
+    assert all(e["bytes"] == 4 for e in finished)
+    assert events[-1]["event"] == "batch_finished"
+    assert events[-1]["done"] == DECKS
+
+
+@pytest.mark.parametrize("generator", ["basic", "cursor", "cursor_pro"])
+def test_generators_time_every_slide(tmp_path, generator):
+    events = []
+    path = tmp_path / f"{generator}.pptx"
+    with use_reporter(ProgressReporter([events.append])):
+        importlib.import_module(f"decks.{generator}").create_presentation(str(path))
+
+    (finished,) = [e for e in events if e["event"] == "deck_finished"]
+    assert len(finished["slides"]) == len(Presentation(path).slides)
+    assert finished["bytes"] == os.path.getsize(path)
@@ -0,0 +1,57 @@
+"""DeckReader on generated decks, compared with python-pptx's view of them."""
+
+import pytest
+from pptx import Presentation
+
+from decks.cursor_pro import create_presentation
+from decks.reader import DeckReader
+
+
+@pytest.fixture(scope="module")
+def cursor_pro(tmp_path_factory):
+    path = tmp_path_factory.mktemp("reader") / "cursor_pro.pptx"
+    create_presentation(str(path))
+    return path
+
+
+def test_title_skips_logo_marks(cursor_pro):
+    with DeckReader(str(cursor_pro)) as deck:
+        titles = [slide.title for slide in deck]
+    # Slide 1 draws a one-letter "C" logo before the title text box
+    assert titles[0] == "Cursor"
+    assert titles[1:4] == ["Value Proposition", "Business Model", "Competition"]
+    assert all(len(title) > 1 for title in titles)
+
+
+def test_reader_matches_python_pptx(cursor_pro):
+    prs = Presentation(cursor_pro)
+    with DeckReader(str(cursor_pro)) as deck:
+        assert len(deck) == len(prs.slides)
+        assert deck.slide_size == (prs.slide_width, prs.slide_height)
+        for slide, expected in zip(deck, prs.slides):
+            assert slide.shape_names == [shape.name for shape in expected.shapes]
+            # python-pptx reads line breaks as vertical tabs
+            texts = [shape.text_frame.text.replace("\v", "\n") for shape in expected.shapes
+                     if shape.has_text_frame and shape.text_frame.text]
+            assert set(texts) <= set(slide.texts)
+            notes = expected.notes_slide.notes_text_frame.text if expected.has_notes_slide else ""
+            assert slide.notes == notes
+            links = sorted(
+                rel.target_ref for rel in expected.part.rels.values()
+                if rel.reltype.endswith("/hyperlink")
+            )
+            assert sorted(slide.links) == links
+
+
+def test_top_and_font_size(cursor_pro):
+    prs = Presentation(cursor_pro)
+    with DeckReader(str(cursor_pro)) as deck:
+        slide = deck[0]
+        title = next(shape for shape in slide.shapes if shape.text == slide.title)
+    expected = next(shape for shape in prs.slides[0].shapes
+                    if shape.has_text_frame and shape.text_frame.text == title.text)
+    assert title.top == expected.top
+    fonts = [font for p in expected.text_frame.paragraphs
+             for font in (p.font, *(run.font for run in p.runs))]
+    sizes = [font.size.pt for font in fonts if font.size is not None]
+    assert title.font_size == max(sizes)
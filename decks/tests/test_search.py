@@ -0,0 +1,137 @@
+"""Search index: incremental updates, full-text queries and URL lookups."""
+
+import os
+import shutil
+import sqlite3
+
+import pytest
+
+from decks import search as search_module
+from decks.cli import main
+from decks.cursor_pro import create_presentation
+from decks.search import (
+    SCHEMA_VERSION, connect, decks_citing, literal_query, read_slide_texts, search, update_index,
+)
+
+
+@pytest.fixture(scope="module")
+def archive(tmp_path_factory):
+    root = tmp_path_factory.mktemp("archive")
+    create_presentation(str(root / "cursor_pro.pptx"))
+    os.mkdir(root / "2025-06")
+    shutil.copy(root / "cursor_pro.pptx", root / "2025-06" / "copy.pptx")
+    return root
+
+
+def test_slide_texts(archive):
+    slides = read_slide_texts(str(archive / "cursor_pro.pptx"))
+    assert [s.number for s in slides] == list(range(1, len(slides) + 1))
+    assert slides[0].title == "Cursor"
+    # The title is not repeated in the body
+    assert all(s.title not in s.body.split("\n") for s in slides if s.title)
+    assert any(s.links for s in slides)
+
+
+def test_index_is_incremental(archive, tmp_path):
+    index = str(tmp_path / "decks.db")
+    archive = shutil.copytree(archive, tmp_path / "archive")
+    assert update_index(index, [str(archive)], workers=1) == (2, 0, 0, [])
+    assert update_index(index, [str(archive)], workers=1) == (0, 2, 0, [])
+
+    os.remove(archive / "2025-06" / "copy.pptx")
+    assert update_index(index, [str(archive)], workers=1) == (0, 1, 1, [])
+
+    broken = archive / "broken.pptx"
+    broken.write_bytes(b"not a zip")
+    try:
+        indexed, unchanged, removed, errors = update_index(index, [str(archive)], workers=1)
+    finally:
+        broken.unlink()
+    assert (indexed, unchanged, removed) == (0, 1, 0)
+    assert [path for path, _ in errors] == [str(broken)]
+
+
+def test_changed_decks_are_removed_by_rowid(archive, tmp_path, monkeypatch):
+    index = str(tmp_path / "decks.db")
+    archive = shutil.copytree(archive, tmp_path / "archive")
+    update_index(index, [str(archive)], workers=1)
+    conn = sqlite3.connect(index)
+    rows = conn.execute("SELECT rowid, deck_id, slide FROM slides").fetchall()
+    assert rows and all(rowid == deck_id << 16 | slide for rowid, deck_id, slide in rows)
+
+    statements = []
+
+    def traced(path):
+        conn = connect(path)
+        conn.set_trace_callback(statements.append)
+        return conn
+
+    monkeypatch.setattr(search_module, "connect", traced)
+    changed = archive / "2025-06" / "copy.pptx"
+    os.utime(changed, ns=(0, 0))
+    assert update_index(index, [str(archive)], workers=1) == (1, 1, 0, [])
+    deletes = [sql for sql in statements if sql.startswith("DELETE FROM slides")]
+    assert len(deletes) == 1
+    # A rowid range on the FTS5 table, not a scan of every slide
+    (plan,) = conn.execute("EXPLAIN QUERY PLAN " + deletes[0]).fetchall()
+    assert plan[3].endswith("INDEX 0:><")
+    assert conn.execute("SELECT count(*) FROM slides").fetchone()[0] == len(rows)
+    conn.close()
+
+
+def test_old_index_layout_is_rebuilt(tmp_path):
+    index = str(tmp_path / "decks.db")
+    conn = sqlite3.connect(index)
+    conn.execute("CREATE TABLE decks (id INTEGER PRIMARY KEY, path TEXT)")
+    conn.execute("INSERT INTO decks (path) VALUES ('old.pptx')")
+    conn.commit()
+    conn.close()
+    conn = connect(index)
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+    assert conn.execute("SELECT count(*) FROM decks").fetchone()[0] == 0
+    conn.close()
+
+
+def test_queries(archive, tmp_path):
+    index = str(tmp_path / "decks.db")
+    update_index(index, [str(archive / "cursor_pro.pptx")], workers=1)
+
+    hits = search(index, '"Business Model"')
+    assert hits and hits[0].title == "Business Model"
+    assert hits[0].path == str(archive / "cursor_pro.pptx")
+    assert search(index, "zzzunmatchedterm") == []
+
+    slides_with_links = [s for s in read_slide_texts(str(archive / "cursor_pro.pptx")) if s.links]
+    url = slides_with_links[0].links[0]
+    rows = decks_citing(index, url)
+    assert (str(archive / "cursor_pro.pptx"), slides_with_links[0].number, url) in rows
+    prefix = url.split("://", 1)[0] + "://"
+    assert len(decks_citing(index, prefix, prefix=True)) >= len(rows)
+    assert decks_citing(index, url + "/nothing-here") == []
+
+
+def test_punctuated_queries_are_literal(archive, tmp_path):
+    index = str(tmp_path / "decks.db")
+    update_index(index, [str(archive / "cursor_pro.pptx")], workers=1)
+
+    assert literal_query('outfittr.co.ke "Jane Wanjiru" 5"') == (
+        '"outfittr.co.ke" "Jane Wanjiru" "5"""'
+    )
+    for query in ("outfittr.co.ke", "Jane-Wanjiru", "a:b", "(", '"', "zzz*", ""):
+        assert search(index, query) == []
+    # Operators are words too
+    assert "[not]" in search(index, "NOT")[0].snippet
+    assert search(index, "business model")[0].title == "Business Model"
+    assert search(index, "Business-Model")[0].title == "Business Model"
+
+    assert search(index, "Busi* NOT zzz", raw=True)
+    with pytest.raises(sqlite3.OperationalError):
+        search(index, "outfittr.co.ke", raw=True)
+
+
+def test_cli_reports_invalid_raw_queries(archive, tmp_path, capsys):
+    index = str(tmp_path / "decks.db")
+    update_index(index, [str(archive / "cursor_pro.pptx")], workers=1)
+    assert main(["search", index, "outfittr.co.ke"]) == 0
+    assert main(["search", index, "--raw", "outfittr.co.ke"]) == 1
+    assert "invalid search query" in capsys.readouterr().err
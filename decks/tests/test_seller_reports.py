@@ -0,0 +1,65 @@
+"""Seller report decks: grouping, output names and a full batch run."""
+
+import csv
+import os
+
+from pptx import Presentation
+
+from decks.seller_reports import deck_filename, generate_reports, iter_sellers
+
+FIELDS = (
+    "rank_position", "seller_id", "full_name", "location", "items_sold", "total_views",
+    "follower_count", "rating", "product_title", "product_price", "product_views",
+)
+
+
+def _rows():
+    for rank, seller_id in enumerate(["ab12", "cd34", "ef56"], 1):
+        for j in range(3):
+            yield {
+                "rank_position": rank, "seller_id": seller_id, "full_name": f"Seller {rank}",
+                "location": "Nairobi", "items_sold": 10 * rank, "total_views": 100 * rank,
+                "follower_count": rank, "rating": 4.5,
+                "product_title": f"Product {rank}-{j}", "product_price": 250 * (j + 1),
+                "product_views": 10 * j,
+            }
+
+
+def _write_export(path):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, FIELDS)
+        writer.writeheader()
+        writer.writerows(_rows())
+
+
+def test_iter_sellers_groups_consecutive_rows():
+    sellers = list(iter_sellers(_rows(), max_products=2))
+    assert [s["seller_id"] for s in sellers] == ["ab12", "cd34", "ef56"]
+    assert [p["title"] for p in sellers[1]["products"]] == ["Product 2-0", "Product 2-1"]
+
+
+def test_deck_filename_stays_in_the_output_directory():
+    assert deck_filename({"rank_position": 7, "seller_id": "ab12-CD_34"}) == "00007-ab12-CD_34.pptx"
+    for seller_id in ("../../etc/passwd", "/abs/path", "..", "a/b\\c", ""):
+        name = deck_filename({"rank_position": 1, "seller_id": seller_id})
+        assert os.path.basename(name) == name
+        assert ".." not in name
+        assert name.startswith("00001-") and name.endswith(".pptx")
+
+
+def test_generate_reports_builds_and_resumes(tmp_path):
+    export = tmp_path / "leaderboard.csv"
+    _write_export(export)
+    output_dir = tmp_path / "out"
+
+    assert generate_reports(str(export), "2025-06", str(output_dir), workers=2,
+                            executor="thread") == (3, 0, 0)
+    decks = sorted(name for name in os.listdir(output_dir) if name.endswith(".pptx"))
+    assert decks == ["00001-ab12.pptx", "00002-cd34.pptx", "00003-ef56.pptx"]
+    assert len(Presentation(output_dir / decks[0]).slides) == 4
+
+    assert generate_reports(str(export), "2025-06", str(output_dir), workers=2,
+                            executor="thread") == (0, 3, 0)
+    os.remove(output_dir / decks[1])
+    assert generate_reports(str(export), "2025-06", str(output_dir), workers=2,
+                            executor="thread") == (1, 2, 0)
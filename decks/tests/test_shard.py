@@ -0,0 +1,196 @@
+import multiprocessing
+import os
+import threading
+import time
+
+import pytest
+
+from decks import shard
+from decks.shard import Lease, gather, init_shards, work
+
+
+def _entries(count):
+    return [
+        {"id": f"deck-{i}", "generator": "basic", "output": f"out/deck-{i}.pptx"}
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def shared(tmp_path):
+    init_shards(_entries(3), str(tmp_path), shard_size=1)
+    return str(tmp_path)
+
+
+def test_renewal_wins_over_takeover_from_stale_read(shared):
+    holder = Lease(shared, "00000", "a", seconds=0.05)
+    assert holder.claim()
+    time.sleep(0.1)
+
+    # Another node sees the expired lease ...
+    taker = Lease(shared, "00000", "b", seconds=60)
+    generation, record = taker.current()
+    assert record["expires"] < time.time()
+    # ... but the holder renews before the takeover is published
+    assert holder.renew()
+    assert not taker._publish(generation + 1, time.time() + 60)
+    assert not taker.claim()
+    assert taker.current()[1]["token"] == holder.token
+
+
+def test_takeover_of_expired_lease_is_noticed_by_holder(shared):
+    holder = Lease(shared, "00000", "a", seconds=0.05)
+    assert holder.claim()
+    time.sleep(0.1)
+    taker = Lease(shared, "00000", "b")
+    assert taker.claim()
+    assert not holder.renew()
+    assert holder.lost.is_set()
+    assert taker.renew()
+
+
+def test_one_claim_wins_among_racing_nodes(shared):
+    barrier = threading.Barrier(8)
+    winners = []
+
+    def race(node):
+        lease = Lease(shared, "00001", node)
+        barrier.wait()
+        if lease.claim():
+            winners.append(node)
+
+    threads = [threading.Thread(target=race, args=(f"node-{i}",)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(winners) == 1
+
+
+def test_released_lease_is_claimable(shared):
+    with_lease = Lease(shared, "00002", "a")
+    assert with_lease.claim()
+    with with_lease:
+        pass
+    assert len(os.listdir(os.path.join(shared, "leases"))) == 1
+    assert Lease(shared, "00002", "b").claim()
+
+
+def test_threaded_workers_build_each_deck_once(tmp_path, monkeypatch):
+    shared = str(tmp_path)
+    init_shards(_entries(24), shared, shard_size=2)
+    builds = []
+
+    def build_entry(entry):
+        builds.append(entry["output"])
+        time.sleep(0.01)
+        with open(entry["output"], "wb") as f:
+            f.write(entry["output"].encode())
+
+    os.makedirs(os.path.join(shared, "out"))
+    monkeypatch.setattr(shard, "build_entry", build_entry)
+    workers = [
+        threading.Thread(target=work, args=(shared, f"node-{i}"),
+                         kwargs={"lease_seconds": 0.3, "wait": False})
+        for i in range(4)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert sorted(builds) == sorted(
+        os.path.join(shared, f"out/deck-{i}.pptx") for i in range(24)
+    )
+    assert gather(shared) == []
+
+
+def _work(shared, node):
+    build = shard.build_entry
+
+    def build_entry(entry):
+        # O_APPEND lines from both processes land whole
+        with open(os.path.join(shared, "builds.log"), "a") as log:
+            log.write(entry["output"] + "\n")
+        return build(entry)
+
+    shard.build_entry = build_entry
+    work(shared, node, wait=False)
+
+
+def test_worker_processes_build_each_shard_once(tmp_path):
+    shared = str(tmp_path)
+    init_shards(_entries(6), shared, shard_size=1)
+    context = multiprocessing.get_context("spawn")
+    nodes = [context.Process(target=_work, args=(shared, f"node-{i}")) for i in range(2)]
+    for node in nodes:
+        node.start()
+    for node in nodes:
+        node.join()
+        assert node.exitcode == 0
+
+    with open(os.path.join(shared, "builds.log")) as log:
+        builds = log.read().split()
+    assert sorted(builds) == sorted(
+        os.path.join(shared, f"out/deck-{i}.pptx") for i in range(6)
+    )
+    assert gather(shared) == []
+    summary = shard._read_json(os.path.join(shared, "summary.json"))
+    assert summary["decks"] == 6
+    assert sum(summary["shards_by_node"].values()) == 6
+
+
+def test_failed_decks_are_retried_on_request(shared, monkeypatch):
+    builds = []
+    broken = {"deck-1"}
+
+    def build_entry(entry):
+        name = os.path.basename(entry["output"])[:-len(".pptx")]
+        builds.append(name)
+        if name in broken:
+            raise RuntimeError("source unavailable")
+        with open(entry["output"], "wb") as f:
+            f.write(name.encode())
+
+    os.makedirs(os.path.join(shared, "out"))
+    monkeypatch.setattr(shard, "build_entry", build_entry)
+    assert work(shared, "a", retries=0, wait=False) == 3
+    (problem,) = gather(shared)
+    assert problem.startswith("deck-1: failed on a: RuntimeError: source unavailable")
+
+    # Without --retry-failed the shard stays done, even for another node
+    assert work(shared, "b", retries=0, wait=False) == 0
+    # A deck that fails again is retried once per run, not forever
+    assert work(shared, "b", retries=0, wait=False, retry_failed=True) == 1
+    assert builds == ["deck-0", "deck-1", "deck-2", "deck-1"]
+
+    broken.clear()
+    assert work(shared, "b", retries=0, wait=False, retry_failed=True) == 1
+    assert builds[4:] == ["deck-1"]
+    assert gather(shared) == []
+    assert work(shared, "c", retries=0, wait=False, retry_failed=True) == 0
+
+
+def test_retry_keeps_the_decks_that_succeeded(tmp_path, monkeypatch):
+    shared = str(tmp_path)
+    init_shards(_entries(3), shared, shard_size=3)
+    builds = []
+    broken = {"deck-2"}
+
+    def build_entry(entry):
+        name = os.path.basename(entry["output"])[:-len(".pptx")]
+        builds.append(name)
+        if name in broken:
+            raise RuntimeError("boom")
+        with open(entry["output"], "wb") as f:
+            f.write(name.encode())
+
+    os.makedirs(os.path.join(shared, "out"))
+    monkeypatch.setattr(shard, "build_entry", build_entry)
+    work(shared, "a", retries=0, wait=False)
+    broken.clear()
+    # An output removed since it was built is rebuilt too
+    os.remove(os.path.join(shared, "out", "deck-0.pptx"))
+    assert work(shared, "a", retries=0, wait=False, retry_failed=True) == 1
+    assert builds == ["deck-0", "deck-1", "deck-2", "deck-0", "deck-2"]
+    assert gather(shared) == []
@@ -0,0 +1,76 @@
+"""Slimming shrinks slide XML without changing how slides render."""
+
+import re
+
+from lxml import etree
+from pptx.dml.color import RGBColor
+from pptx.util import Inches, Pt
+
+from decks.cursor_pro import ASPECT, SLIDE_BUILDERS
+from decks.links import autolink_presentation
+from decks.preview import render_slide
+from decks.prototype import new_presentation
+from decks.slim import slim_presentation
+
+# A text body holding only whitespace draws nothing; slimming drops it
+_BLANK_TEXT = re.compile(r'<div class="tx"[^>]*>(?:<p[^>]*>(?:<span[^>]*>\s*</span>)*</p>)*</div>')
+# Adjacent spans of one style read the same as a single span
+_SAME_STYLE_SPANS = re.compile(r'<span style="([^"]*)">([^<]*)</span><span style="\1">')
+
+
+def _render(slide, number):
+    html = _BLANK_TEXT.sub("", render_slide(slide, number))
+    merged = None
+    while merged != html:
+        merged, html = html, _SAME_STYLE_SPANS.sub(r'<span style="\1">\2', html)
+    return html
+
+
+def _renders(prs):
+    return [_render(slide, number) for number, slide in enumerate(prs.slides, 1)]
+
+
+def _xml_bytes(prs):
+    return sum(len(etree.tostring(slide._element)) for slide in prs.slides)
+
+
+def test_cursor_pro_renders_the_same_after_slimming():
+    prs = new_presentation(ASPECT)
+    for _, builder in SLIDE_BUILDERS:
+        builder(prs, prs.slide_width, prs.slide_height)
+    autolink_presentation(prs)
+    before, size = _renders(prs), _xml_bytes(prs)
+
+    slim_presentation(prs)
+    assert _renders(prs) == before
+    assert _xml_bytes(prs) < size * 0.95
+
+
+def test_runs_merge_and_inherited_attributes_go():
+    prs = new_presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    box = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(6), Inches(1))
+    paragraph = box.text_frame.paragraphs[0]
+    for text in ("Items ", "sold ", "this month"):
+        run = paragraph.add_run()
+        run.text = text
+        run.font.size = Pt(14)
+        run.font.bold = False
+        run.font.color.rgb = RGBColor(0x3B, 0x82, 0xF6)
+    bold = paragraph.add_run()
+    bold.text = ": 42"
+    bold.font.size = Pt(14)
+    bold.font.bold = True
+    bold.font.color.rgb = RGBColor(0x3B, 0x82, 0xF6)
+    empty = slide.shapes.add_textbox(Inches(1), Inches(3), Inches(2), Inches(1))
+    empty.text_frame.clear()
+    before = _renders(prs)
+
+    slim_presentation(prs)
+    assert _renders(prs) == before
+    runs = paragraph._p.findall(
+        "{http://schemas.openxmlformats.org/drawingml/2006/main}r"
+    )
+    assert [r.text for r in paragraph.runs] == ["Items sold this month", ": 42"]
+    assert runs[0].rPr.get("b") is None
+    assert empty._element.txBody is None
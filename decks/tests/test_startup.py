@@ -0,0 +1,19 @@
+"""The decks CLI stays light to start (decks.bench_startup)."""
+
+import os
+
+import pytest
+
+from decks.bench_startup import BUDGET_MS, PROBES, heavy_imports, run_benchmark
+
+
+def test_light_commands_skip_heavy_imports():
+    assert heavy_imports() == {name: [] for name, (_, light) in PROBES.items() if light}
+
+
+@pytest.mark.skipif(os.environ.get("DECKS_STARTUP_BUDGET") != "1",
+                    reason="wall-clock budget; set DECKS_STARTUP_BUDGET=1 on an idle runner")
+def test_startup_budget():
+    results, failures = run_benchmark(BUDGET_MS, repeat=5)
+    assert set(results) == set(PROBES)
+    assert failures == []
@@ -0,0 +1,81 @@
+"""Glyph widths, greedy wrapping and font-size fitting."""
+
+import warnings
+
+import numpy as np
+import pytest
+
+from decks.text_fit import (
+    BMP_SIZE, EMU_PER_POINT, INSET_LEFT_RIGHT_PT, INSET_TOP_BOTTOM_PT, LINE_SPACING,
+    FontMetrics, TextOverflowWarning, default_metrics, fit_font_size, measure_text,
+    text_fits, wrap_line_widths,
+)
+
+# Every glyph half an em wide: 5pt per character at 10pt
+MONO = FontMetrics("Mono", np.full(BMP_SIZE, 0.5))
+
+
+def _box(chars_per_line, lines, size=10):
+    """(width, height) in EMU of a box holding `lines` lines of
+    `chars_per_line` MONO characters at `size`, insets included."""
+    width = (chars_per_line * size / 2 + 2 * INSET_LEFT_RIGHT_PT) * EMU_PER_POINT
+    height = (lines * size * LINE_SPACING + 2 * INSET_TOP_BOTTOM_PT) * EMU_PER_POINT
+    return round(width), round(height)
+
+
+def test_calibri_widths_scale_with_size_and_weight():
+    metrics = default_metrics()
+    assert metrics is default_metrics()
+    regular = metrics.widths(20)
+    assert regular[ord("H")] == pytest.approx(1276 / 2048 * 20)
+    assert regular[ord("7")] == pytest.approx(1038 / 2048 * 20)
+    assert regular[ord("中")] == pytest.approx(20)
+    assert metrics.widths(20, bold=True)[ord("H")] == pytest.approx(1276 / 2048 * 20 * 1.05)
+    assert metrics.widths(20) is regular
+
+
+def test_wrap_points():
+    # "aaa bbb" is exactly 35pt wide; the space before "ccc" is not counted
+    assert wrap_line_widths("aaa bbb ccc", 35, 10, metrics=MONO) == [35.0, 15.0]
+    assert wrap_line_widths("aaa bbb ccc", 34.9, 10, metrics=MONO) == [15.0, 15.0, 15.0]
+    assert wrap_line_widths("aaa   bbb", 100, 10, metrics=MONO) == [45.0]
+    # A word wider than the box breaks by character
+    assert wrap_line_widths("abcdefghij", 20, 10, metrics=MONO) == [20.0, 20.0, 10.0]
+    assert wrap_line_widths("", 20, 10, metrics=MONO) == [0.0]
+
+
+def test_measure_counts_hard_and_soft_breaks():
+    width, _ = _box(7, 1)
+    lines, height = measure_text(["aaa bbb ccc", "x\ny"], width, 10, space_after=6,
+                                 metrics=MONO)
+    assert lines == 4
+    assert height == pytest.approx(4 * 10 * LINE_SPACING + 6)
+
+
+def test_single_line_always_fits():
+    width, _ = _box(20, 1)
+    # Far too short for the text, but one line grows the box rather than clipping
+    assert text_fits("short line", width, 0, 10, metrics=MONO)
+    assert not text_fits("aaa bbb ccc", _box(7, 1)[0], 0, 10, metrics=MONO)
+
+
+def test_fit_font_size_finds_the_largest_step():
+    width, height = _box(7, 2)
+    assert fit_font_size("aaa bbb", width, height, max_size=10, metrics=MONO) == 10
+
+    text = "aaa bbb ccc ddd eee"
+    size = fit_font_size(text, width, height, max_size=10, metrics=MONO)
+    assert size < 10 and (size * 2).is_integer()
+    assert text_fits(text, width, height, size, metrics=MONO)
+    assert not text_fits(text, width, height, size + 0.5, metrics=MONO)
+
+
+def test_overflow_returns_min_size_and_warns():
+    width, height = _box(7, 1)
+    text = " ".join(["word"] * 40)
+    with pytest.warns(TextOverflowWarning, match="even at 6pt"):
+        assert fit_font_size(text, width, height, max_size=10, metrics=MONO) == 6
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert fit_font_size(text, width, height, max_size=10, min_size=8,
+                             metrics=MONO, warn=False) == 8
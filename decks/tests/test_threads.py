@@ -0,0 +1,46 @@
+"""Decks built concurrently in threads match decks built one at a time."""
+
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+from decks.seller_reports import build_seller_deck
+
+DECKS = 12
+
+
+def _seller(i):
+    return {
+        "seller_id": f"seller-{i}", "rank_position": i + 1,
+        "full_name": f"Seller {i} https://outfittr.co.ke/s/{i}", "location": "Nairobi",
+        "items_sold": 10 * i, "total_views": 1000 + i, "follower_count": i,
+        "rating": 4.5, "products": [
+            {"title": f"Product {i}-{j} with a long enough title to fit", "price": 100.0 * j,
+             "views": 10 * j}
+            for j in range(5)
+        ],
+    }
+
+
+def _parts(path):
+    with zipfile.ZipFile(path) as zf:
+        return {
+            name: zf.read(name) for name in zf.namelist()
+            # Creation timestamps differ between any two builds
+            if name != "docProps/core.xml"
+        }
+
+
+def test_thread_pool_builds_match_serial_builds(tmp_path):
+    (tmp_path / "serial").mkdir()
+    (tmp_path / "threads").mkdir()
+    jobs = [(_seller(i), f"seller-{i}.pptx") for i in range(DECKS)]
+    for seller, name in jobs:
+        build_seller_deck(seller, "2025-06", str(tmp_path / "serial" / name))
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(
+            lambda job: build_seller_deck(job[0], "2025-06", str(tmp_path / "threads" / job[1])),
+            jobs,
+        ))
+
+    for _, name in jobs:
+        assert _parts(tmp_path / "threads" / name) == _parts(tmp_path / "serial" / name), name
@@ -0,0 +1,28 @@
+import re
+import zipfile
+
+from decks.cursor_pro import create_presentation
+from decks.watch import WatchedDeck
+
+
+def _slides(path):
+    with zipfile.ZipFile(path) as zf:
+        return {
+            name: zf.read(name) for name in zf.namelist()
+            if re.fullmatch(r"ppt/slides/(_rels/)?slide\d+\.xml(\.rels)?", name)
+        }
+
+
+def test_watch_saves_the_deck_decks_build_writes(tmp_path):
+    built = tmp_path / "built.pptx"
+    create_presentation(str(built))
+
+    watched = WatchedDeck("cursor_pro", "cursor_pro", str(tmp_path / "watched.pptx"))
+    watched.build()
+    watched.save()
+    assert _slides(tmp_path / "watched.pptx") == _slides(built)
+
+    # An incremental save of the same slides writes the same XML again
+    assert watched.rebuild_changed() == []
+    watched.save()
+    assert _slides(tmp_path / "watched.pptx") == _slides(built)
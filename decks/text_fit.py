@@ -0,0 +1,225 @@
+"""
+Font-metric text fitting for the presentation generators.
+
+The slide helpers place text in fixed-size boxes with word_wrap turned on,
+so long strings silently overflow. This module measures wrapped text with
+real glyph advance widths and picks the largest font size that fits a box.
+
+Glyph widths are loaded once per font into a 65,536-entry array (one slot
+per BMP code point, in em units) and scaled into cached per-size arrays.
+Measuring a paragraph is then a table lookup plus a cumulative sum, and
+each wrapped line costs a single binary search, which keeps fitting cheap
+enough to run on every textbox of a large batch.
+
+Usage:
+    from decks.text_fit import fit_font_size
+    size = fit_font_size(text, Inches(9), Inches(1), max_size=18)
+"""
+
+import threading
+import warnings
+from functools import lru_cache
+
+import numpy as np
+
+EMU_PER_POINT = 12700
+BMP_SIZE = 0x10000
+
+# Default text frame insets used by python-pptx/PowerPoint (0.1" / 0.05")
+INSET_LEFT_RIGHT_PT = 7.2
+INSET_TOP_BOTTOM_PT = 3.6
+LINE_SPACING = 1.2
+BOLD_WIDTH_FACTOR = 1.05
+
+# Approximate Calibri advance widths (units per 2048 em) for printable ASCII.
+# Calibri is the theme font of python-pptx's default template.
+_CALIBRI_ASCII_WIDTHS = {
+    " ": 463, "!": 544, '"': 821, "#": 1031, "$": 1048, "%": 1470, "&": 1397,
+    "'": 452, "(": 621, ")": 621, "*": 1022, "+": 1031, ",": 511, "-": 627,
+    ".": 517, "/": 791, ":": 548, ";": 548, "<": 1031, "=": 1031, ">": 1031,
+    "?": 941, "@": 1823, "[": 632, "\\": 791, "]": 632, "^": 1031, "_": 1022,
+    "`": 587, "{": 640, "|": 941, "}": 640, "~": 1031,
+    "A": 1185, "B": 1114, "C": 1092, "D": 1260, "E": 1000, "F": 941, "G": 1292,
+    "H": 1276, "I": 516, "J": 653, "K": 1064, "L": 861, "M": 1751, "N": 1322,
+    "O": 1356, "P": 1058, "Q": 1378, "R": 1112, "S": 941, "T": 998, "U": 1314,
+    "V": 1162, "W": 1822, "X": 1063, "Y": 998, "Z": 959,
+    "a": 981, "b": 1076, "c": 866, "d": 1076, "e": 1019, "f": 625, "g": 964,
+    "h": 1076, "i": 470, "j": 490, "k": 931, "l": 470, "m": 1636, "n": 1076,
+    "o": 1080, "p": 1076, "q": 1076, "r": 714, "s": 801, "t": 686, "u": 1076,
+    "v": 925, "w": 1464, "x": 887, "y": 927, "z": 809,
+}
+_CALIBRI_DIGIT_WIDTH = 1038
+_CALIBRI_FALLBACK_WIDTH = 1080
+
+
+class TextOverflowWarning(UserWarning):
+    """Text does not fit its box even at the smallest allowed font size."""
+
+
+# =============================================================================
+# FONT METRICS
+# =============================================================================
+
+class FontMetrics:
+    """Glyph advance widths for one font, with cached per-size tables."""
+
+    def __init__(self, name, em_widths):
+        self.name = name
+        self._em_widths = np.asarray(em_widths, dtype=np.float64)
+        self._lock = threading.Lock()
+        self._size_tables = {}
+
+    @classmethod
+    def calibri(cls):
+        """Built-in approximate Calibri metrics (no font file needed)."""
+        em = np.full(BMP_SIZE, _CALIBRI_FALLBACK_WIDTH / 2048.0)
+        for char, width in _CALIBRI_ASCII_WIDTHS.items():
+            em[ord(char)] = width / 2048.0
+        for digit in "0123456789":
+            em[ord(digit)] = _CALIBRI_DIGIT_WIDTH / 2048.0
+        # CJK and fullwidth forms are roughly one em wide
+        em[0x2E80:0xA000] = 1.0
+        em[0xFF00:0xFF61] = 1.0
+        return cls("Calibri", em)
+
+    @classmethod
+    def from_font_file(cls, path, name=None):
+        """Load advance widths for the BMP from a TrueType/OpenType file."""
+        from PIL import ImageFont
+
+        units = 2048
+        font = ImageFont.truetype(path, size=units)
+        em = np.empty(BMP_SIZE)
+        fallback = font.getlength("o") / units
+        for code in range(BMP_SIZE):
+            if 0xD800 <= code <= 0xDFFF:
+                em[code] = fallback
+                continue
+            try:
+                em[code] = font.getlength(chr(code)) / units
+            except (UnicodeEncodeError, OSError):
+                em[code] = fallback
+        return cls(name or path, em)
+
+    def widths(self, size, bold=False):
+        """Glyph widths in points at `size`, computed once per size."""
+        key = (float(size), bool(bold))
+        table = self._size_tables.get(key)
+        if table is None:
+            with self._lock:
+                table = self._size_tables.get(key)
+                if table is None:
+                    factor = size * (BOLD_WIDTH_FACTOR if bold else 1.0)
+                    table = self._em_widths * factor
+                    self._size_tables[key] = table
+        return table
+
+
+@lru_cache(maxsize=1)
+def default_metrics():
+    """Process-wide default metrics (built-in Calibri)."""
+    return FontMetrics.calibri()
+
+
+# =============================================================================
+# MEASUREMENT
+# =============================================================================
+
+def _codepoints(text):
+    codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    # Astral characters (emoji etc.) fall back to a wide CJK-sized slot
+    return np.where(codes < BMP_SIZE, codes, 0x4E00)
+
+
+def wrap_line_widths(line, max_width, size, bold=False, metrics=None):
+    """Greedy word-wrap one hard line; return the width of each wrapped line."""
+    if not line:
+        return [0.0]
+    metrics = metrics or default_metrics()
+    codes = _codepoints(line)
+    cum = np.concatenate(([0.0], np.cumsum(metrics.widths(size, bold)[codes])))
+    # A break may follow any space; the trailing space does not count
+    spaces = np.flatnonzero(codes == 32)
+    ends = np.concatenate((spaces, [len(codes)]))
+
+    lines = []
+    start = 0
+    n = len(codes)
+    while start < n:
+        limit = cum[start] + max_width
+        # Last break whose (space-stripped) line still fits
+        i = int(np.searchsorted(cum[ends], limit, side="right")) - 1
+        candidates = ends[: i + 1]
+        candidates = candidates[candidates > start]
+        if len(candidates):
+            end = int(candidates[-1])
+        else:
+            # A single word wider than the box is broken by character
+            end = int(np.searchsorted(cum, limit, side="right")) - 1
+            end = max(end, start + 1)
+        lines.append(float(cum[end] - cum[start]))
+        start = end
+        while start < n and codes[start] == 32:
+            start += 1
+    return lines
+
+
+def measure_text(paragraphs, width, size, bold=False, space_after=0,
+                 metrics=None):
+    """Return (line_count, height_pt) for text wrapped into `width` (EMU)."""
+    if isinstance(paragraphs, str):
+        paragraphs = [paragraphs]
+    max_width = width / EMU_PER_POINT - 2 * INSET_LEFT_RIGHT_PT
+    line_count = 0
+    for paragraph in paragraphs:
+        for line in paragraph.split("\n"):
+            line_count += len(wrap_line_widths(line, max_width, size, bold, metrics))
+    height = line_count * size * LINE_SPACING
+    height += space_after * max(len(paragraphs) - 1, 0)
+    return line_count, height
+
+
+def text_fits(paragraphs, width, height, size, bold=False, space_after=0,
+              metrics=None):
+    """True when the wrapped text fits inside a `width` x `height` box (EMU).
+
+    A single unwrapped line always fits vertically: PowerPoint grows the
+    box rather than clipping it, so only wrapping can push text out.
+    """
+    line_count, text_height = measure_text(
+        paragraphs, width, size, bold, space_after, metrics
+    )
+    if line_count <= 1:
+        return True
+    return text_height <= height / EMU_PER_POINT - 2 * INSET_TOP_BOTTOM_PT
+
+
+def fit_font_size(paragraphs, width, height, max_size, min_size=6, step=0.5,
+                  bold=False, space_after=0, metrics=None, warn=True):
+    """Largest font size (a multiple of `step`, in points) that fits the box.
+
+    Returns `max_size` untouched when the text already fits. When even
+    `min_size` overflows, returns `min_size` and emits a
+    TextOverflowWarning (unless `warn` is False).
+    """
+    if text_fits(paragraphs, width, height, max_size, bold, space_after, metrics):
+        return max_size
+    lo = int(np.ceil(min_size / step))
+    hi = int(np.floor(max_size / step)) - 1
+    best = None
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        if text_fits(paragraphs, width, height, mid * step, bold, space_after, metrics):
+            best = mid
+            lo = mid + 1
+        else:
+            hi = mid - 1
+    if best is None:
+        if warn:
+            preview = paragraphs if isinstance(paragraphs, str) else " / ".join(paragraphs)
+            warnings.warn(
+                f"Text overflows its box even at {min_size}pt: {preview[:60]!r}",
+                TextOverflowWarning, stacklevel=2,
+            )
+        return min_size
+    return best * step
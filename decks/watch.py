@@ -0,0 +1,613 @@
+"""
+Watch mode: rebuild slides as their source changes and show them live.
+
+    python3 -m decks watch cursor_pro --open
+    python3 -m decks watch cursor_pro -o cursor_presentation_pro.pptx
+    python3 -m decks watch spec.json
+
+The watcher builds each deck once, serves a preview page on
+http://127.0.0.1:8000/ and then polls its sources every POLL_INTERVAL
+seconds. The sources are the generator modules, every decks module they
+import, and the spec file when one is given. On a change:
+
+- for an edited generator module that lists its slides in SLIDE_BUILDERS
+  (label, builder(prs, width, height)), the module is reloaded and only
+  the builders whose code changed are re-run. A builder's fingerprint
+  covers its bytecode, its constants and the module-level functions and
+  values it uses, but not line numbers, so edits elsewhere in the file do
+  not rebuild it. The new slide replaces the old one in the same
+  presentation, and slide numbers and layouts stay as they were;
+- an edited shared module (decks.helpers, decks.masters, ...) re-imports
+  the decks modules and rebuilds every deck;
+- an edited spec file re-reads the entries and rebuilds the decks listed.
+
+Changed slides are rendered to HTML (decks.preview) and pushed to every
+open page over a websocket, before the deck is written to its output.
+Rebuilding one builder, rendering it and pushing it takes tens of
+milliseconds, well under the 300 ms edit-to-preview budget. Each update
+is reported as a "preview_updated" progress event with the time taken
+from the file's modification to the push.
+
+Generators without SLIDE_BUILDERS are rebuilt whole and only the slides
+whose preview changed are pushed. Builder errors (including syntax errors
+on reload) are shown on the page and the previous preview stays up.
+Remote (s3://) outputs are previewed but not written on every edit.
+"""
+
+import base64
+import hashlib
+import importlib
+import io
+import json
+import os
+import socket
+import struct
+import sys
+import threading
+import time
+import traceback
+import types
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from decks.outputs import MemoryOutput, is_remote
+from decks.progress import ProgressReporter, get_reporter, use_reporter
+from decks.spec import GENERATORS, entry_id_of, load_and_validate
+
+POLL_INTERVAL = 0.05
+
+# Loaded once and kept across re-imports: the watcher itself, and modules
+# whose state (prototype caches, the current reporter) must stay put
+_KEEP_MODULES = {
+    "decks", "decks.__main__", "decks.cli", "decks.outputs", "decks.preview",
+    "decks.progress", "decks.spec", "decks.watch",
+}
+
+_WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+# =============================================================================
+# FINGERPRINTS
+# =============================================================================
+
+def _hash_code(code, digest, names):
+    digest.update(code.co_code)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _hash_code(const, digest, names)
+        else:
+            digest.update(repr(const).encode())
+    names.extend(code.co_names)
+
+
+def builder_fingerprint(builder):
+    """Digest of `builder` and the same-module functions and values it uses."""
+    digest = hashlib.sha1()
+    module = builder.__module__
+    seen = set()
+    pending = [builder]
+    while pending:
+        func = pending.pop()
+        if func in seen:
+            continue
+        seen.add(func)
+        names = []
+        _hash_code(func.__code__, digest, names)
+        digest.update(repr(func.__defaults__).encode())
+        for name in names:
+            value = func.__globals__.get(name)
+            if isinstance(value, types.FunctionType):
+                if value.__module__ == module:
+                    pending.append(value)
+            elif value is not None and not isinstance(value, (types.ModuleType, type)):
+                digest.update(f"{name}={value!r}".encode())
+    return digest.hexdigest()
+
+
+# =============================================================================
+# DECKS
+# =============================================================================
+
+class WatchedDeck:
+    """One deck being previewed: its presentation, slide previews and the
+    fingerprints of the builders that made each slide."""
+
+    def __init__(self, key, generator, output=None):
+        self.key = key
+        self.generator = generator
+        self.output = output
+        self.module_name = GENERATORS[generator][0]
+        self.prs = None
+        self.aspect = None
+        self.labels = []
+        self.fingerprints = []
+        self.previews = []
+        self.error = None
+
+    @property
+    def module(self):
+        return importlib.import_module(self.module_name)
+
+    def build(self):
+        """Build every slide; returns the indexes whose preview changed, or
+        None if the slides themselves changed (added, removed, relabelled)."""
+        from decks.preview import render_slide
+
+        module = self.module
+        builders = getattr(module, "SLIDE_BUILDERS", None)
+        aspect = getattr(module, "ASPECT", None)
+        if builders is None:
+            prs = self._build_whole(module)
+            labels = [
+                slide.shapes.title.text_frame.text if slide.shapes.title is not None
+                else f"Slide {number}"
+                for number, slide in enumerate(prs.slides, 1)
+            ]
+            fingerprints = [None] * len(labels)
+        else:
+            from decks.links import autolink_slide, registry_for
+            from decks.prototype import new_presentation
+
+            prs = new_presentation(aspect or "4:3")
+            registry = registry_for(prs)
+            for _, builder in builders:
+                builder(prs, prs.slide_width, prs.slide_height)
+                autolink_slide(prs.slides[-1], registry)
+            labels = [label for label, _ in builders]
+            fingerprints = [builder_fingerprint(builder) for _, builder in builders]
+        previews = [render_slide(slide, n) for n, slide in enumerate(prs.slides, 1)]
+        changed = None
+        if labels == self.labels and aspect == self.aspect and self.previews:
+            changed = [i for i, preview in enumerate(previews) if preview != self.previews[i]]
+        self.prs, self.aspect, self.labels, self.fingerprints, self.previews = (
+            prs, aspect, labels, fingerprints, previews,
+        )
+        self.error = None
+        return changed
+
+    def _build_whole(self, module):
+        from pptx import Presentation
+
+        output = MemoryOutput(self.key)
+        with use_reporter(ProgressReporter([])):
+            module.create_presentation(output)
+        return Presentation(io.BytesIO(output.value))
+
+    def rebuild_changed(self):
+        """Re-run the builders whose fingerprint changed; returns the indexes
+        of the rebuilt slides, or None if the deck needs a full build."""
+        from decks.links import autolink_slide, registry_for
+        from decks.preview import render_slide
+
+        module = self.module
+        builders = getattr(module, "SLIDE_BUILDERS", None)
+        if (builders is None or self.prs is None
+                or getattr(module, "ASPECT", None) != self.aspect
+                or [label for label, _ in builders] != self.labels):
+            return None
+        fingerprints = [builder_fingerprint(builder) for _, builder in builders]
+        changed = [i for i, fp in enumerate(fingerprints) if fp != self.fingerprints[i]]
+        prs = self.prs
+        registry = registry_for(prs)
+        for index in changed:
+            count = len(prs.slides)
+            builders[index][1](prs, prs.slide_width, prs.slide_height)
+            if len(prs.slides) != count + 1:
+                return None
+            slide = prs.slides[-1]
+            autolink_slide(slide, registry)
+            _move_slide(prs, count, index)
+            self.previews[index] = render_slide(slide, index + 1)
+            self.fingerprints[index] = fingerprints[index]
+        return changed
+
+    def save(self):
+        from decks.outputs import save_presentation
+        from decks.slim import slim_presentation
+
+        if self.output and not is_remote(self.output) and self.prs is not None:
+            # Same XML as `decks build`; slimming already slim slides is a no-op
+            slim_presentation(self.prs)
+            save_presentation(self.prs, self.output)
+
+    def message(self):
+        """The "deck" message carrying every slide preview."""
+        return {
+            "type": "deck", "deck": self.key, "error": self.error,
+            "slides": [
+                {"label": label, "html": html}
+                for label, html in zip(self.labels, self.previews)
+            ],
+        }
+
+
+def _move_slide(prs, source, target):
+    """Put slide `source` in place of slide `target`, dropping the old one."""
+    slide_ids = prs.slides._sldIdLst
+    new, old = slide_ids[source], slide_ids[target]
+    old.addprevious(new)
+    slide_ids.remove(old)
+    # Unreferenced now, so the old slide (and its notes) is not saved
+    prs.part.drop_rel(old.rId)
+    prs.part.rename_slide_parts([slide_id.rId for slide_id in slide_ids])
+
+
+# =============================================================================
+# WEBSOCKET PREVIEW SERVER
+# =============================================================================
+
+def _ws_frame(payload, opcode=0x1):
+    header = bytes([0x80 | opcode])
+    length = len(payload)
+    if length < 126:
+        header += bytes([length])
+    elif length < 1 << 16:
+        header += bytes([126]) + struct.pack("!H", length)
+    else:
+        header += bytes([127]) + struct.pack("!Q", length)
+    return header + payload
+
+
+def _ws_read_frame(rfile):
+    """(opcode, payload) of the next client frame, or (None, b"") at EOF."""
+    head = rfile.read(2)
+    if len(head) < 2:
+        return None, b""
+    opcode, length = head[0] & 0x0F, head[1] & 0x7F
+    if length == 126:
+        length = struct.unpack("!H", rfile.read(2))[0]
+    elif length == 127:
+        length = struct.unpack("!Q", rfile.read(8))[0]
+    mask = rfile.read(4) if head[1] & 0x80 else b"\0\0\0\0"
+    data = rfile.read(length)
+    return opcode, bytes(b ^ mask[i % 4] for i, b in enumerate(data))
+
+
+class PreviewServer(ThreadingHTTPServer):
+    """Serves the preview page and pushes JSON messages to its websockets."""
+
+    daemon_threads = True
+
+    def __init__(self, address, snapshot):
+        super().__init__(address, _PreviewHandler)
+        self.snapshot = snapshot
+        self.clients = set()
+        self.clients_lock = threading.Lock()
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def broadcast(self, message):
+        frame = _ws_frame(json.dumps(message).encode())
+        with self.clients_lock:
+            clients = list(self.clients)
+        for client in clients:
+            client.send(frame)
+
+
+class _PreviewHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path == "/ws" and self.headers.get("Upgrade", "").lower() == "websocket":
+            self._websocket()
+            return
+        if self.path not in ("/", "/index.html"):
+            self.send_error(404)
+            return
+        body = _page().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send(self, frame):
+        try:
+            with self._send_lock:
+                self.wfile.write(frame)
+                self.wfile.flush()
+        except OSError:
+            self._drop()
+
+    def _drop(self):
+        with self.server.clients_lock:
+            self.server.clients.discard(self)
+
+    def _websocket(self):
+        key = self.headers.get("Sec-WebSocket-Key", "")
+        accept = base64.b64encode(hashlib.sha1((key + _WS_GUID).encode()).digest()).decode()
+        self.send_response(101)
+        self.send_header("Upgrade", "websocket")
+        self.send_header("Connection", "Upgrade")
+        self.send_header("Sec-WebSocket-Accept", accept)
+        self.end_headers()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._send_lock = threading.Lock()
+        # Register first, then send the snapshot: an update pushed in between
+        # is at worst applied twice, never lost
+        with self.server.clients_lock:
+            self.server.clients.add(self)
+        for message in self.server.snapshot():
+            self.send(_ws_frame(json.dumps(message).encode()))
+        try:
+            while True:
+                opcode, payload = _ws_read_frame(self.rfile)
+                if opcode is None or opcode == 0x8:
+                    break
+                if opcode == 0x9:
+                    self.send(_ws_frame(payload, opcode=0xA))
+        except OSError:
+            pass
+        finally:
+            self._drop()
+        self.close_connection = True
+
+
+# =============================================================================
+# WATCHER
+# =============================================================================
+
+class Watcher:
+    """Polls the sources of `decks` and keeps their previews up to date."""
+
+    def __init__(self, decks, spec_path=None):
+        self.decks = {deck.key: deck for deck in decks}
+        self.spec_path = spec_path
+        self.server = None
+        self._lock = threading.Lock()
+        self._mtimes = {}
+
+    @classmethod
+    def for_target(cls, target, output=None):
+        """A Watcher for a generator name or a spec file path."""
+        if target in GENERATORS:
+            return cls([WatchedDeck(target, target, output)])
+        return cls(_spec_decks(target), spec_path=target)
+
+    # ----- sources -----
+
+    def sources(self):
+        """{path: mtime_ns} of every file watched."""
+        paths = {
+            module.__file__ for name, module in list(sys.modules.items())
+            if name.startswith("decks.") and name not in _KEEP_MODULES
+            and getattr(module, "__file__", None)
+        }
+        if self.spec_path:
+            paths.add(self.spec_path)
+        mtimes = {}
+        for path in paths:
+            try:
+                mtimes[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+        return mtimes
+
+    def _changed(self):
+        mtimes = self.sources()
+        changed = [path for path, mtime in mtimes.items() if self._mtimes.get(path) != mtime]
+        self._mtimes = mtimes
+        return changed, max((mtimes[path] for path in changed), default=0)
+
+    # ----- building -----
+
+    def snapshot(self):
+        with self._lock:
+            return [{"type": "reset", "decks": list(self.decks)}] + [
+                deck.message() for deck in self.decks.values()
+            ]
+
+    def _push(self, message):
+        if self.server is not None:
+            self.server.broadcast(message)
+
+    def build_all(self):
+        for deck in list(self.decks.values()):
+            self._build(deck, full=True)
+
+    def _build(self, deck, full, edited_ns=None):
+        started = time.perf_counter()
+        reporter = get_reporter()
+        had_error = deck.error is not None
+        try:
+            with self._lock:
+                changed = None if full else deck.rebuild_changed()
+                if changed is None:
+                    changed = deck.build()
+                if changed is None:
+                    changed = range(len(deck.labels))
+                    message = deck.message()
+                else:
+                    message = {
+                        "type": "slides", "deck": deck.key, "error": None,
+                        "slides": {str(i): deck.previews[i] for i in changed},
+                    }
+        except Exception as exc:
+            # A builder may have failed half way; start the next build afresh
+            deck.prs = None
+            deck.error = "".join(traceback.format_exception(exc))
+            self._push({"type": "error", "deck": deck.key, "error": deck.error})
+            reporter.emit("preview_failed", deck=deck.key, error=f"{type(exc).__name__}: {exc}")
+            return
+        if not changed and not had_error and message["type"] == "slides":
+            return
+        self._push(message)
+        fields = {"build_ms": round((time.perf_counter() - started) * 1000, 1)}
+        if edited_ns:
+            fields["latency_ms"] = round((time.time_ns() - edited_ns) / 1e6, 1)
+        reporter.emit(
+            "preview_updated", deck=deck.key,
+            slides=[deck.labels[i] for i in changed], **fields,
+        )
+        try:
+            deck.save()
+        except OSError as exc:
+            reporter.emit("preview_failed", deck=deck.key, error=f"cannot save: {exc}")
+
+    def poll(self):
+        """Check the sources once and rebuild what changed."""
+        changed, edited_ns = self._changed()
+        if not changed:
+            return
+        if self.spec_path and self.spec_path in changed:
+            try:
+                decks = _spec_decks(self.spec_path)
+            except ValueError as exc:
+                get_reporter().emit("preview_failed", deck=self.spec_path, error=str(exc))
+                return
+            with self._lock:
+                self.decks = {deck.key: deck for deck in decks}
+            self._push({"type": "reset", "decks": list(self.decks)})
+            self.build_all()
+            self._changed()
+            return
+
+        generator_files = {}
+        for deck in self.decks.values():
+            module = sys.modules.get(deck.module_name)
+            if module is not None:
+                generator_files.setdefault(module.__file__, []).append(deck)
+        if all(path in generator_files for path in changed):
+            for path in changed:
+                decks = generator_files[path]
+                try:
+                    importlib.reload(sys.modules[decks[0].module_name])
+                except Exception as exc:
+                    for deck in decks:
+                        deck.error = "".join(traceback.format_exception(exc))
+                        self._push({"type": "error", "deck": deck.key, "error": deck.error})
+                    get_reporter().emit(
+                        "preview_failed", deck=decks[0].module_name,
+                        error=f"{type(exc).__name__}: {exc}",
+                    )
+                    continue
+                for deck in decks:
+                    self._build(deck, full=False, edited_ns=edited_ns)
+        else:
+            # A shared module changed: re-import everything the decks use
+            for name in [n for n in sys.modules if n.startswith("decks.")]:
+                if name not in _KEEP_MODULES:
+                    del sys.modules[name]
+            for deck in self.decks.values():
+                self._build(deck, full=True, edited_ns=edited_ns)
+        # Modules imported by the rebuild are watched from now on
+        self._mtimes.update(self.sources())
+
+    def serve(self, host="127.0.0.1", port=8000, open_browser=False):
+        """Build, start the preview server and poll until interrupted."""
+        self.server = PreviewServer((host, port), self.snapshot)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.build_all()
+        self._changed()
+        if open_browser:
+            import webbrowser
+
+            webbrowser.open(self.server.url)
+        try:
+            while True:
+                time.sleep(POLL_INTERVAL)
+                self.poll()
+        finally:
+            self.server.shutdown()
+            self.server.server_close()
+
+
+def _spec_decks(spec_path):
+    return [
+        WatchedDeck(entry_id_of(entry), entry["generator"], entry["output"])
+        for entry in load_and_validate(spec_path)
+    ]
+
+
+_PAGE = """<!doctype html>
+<html><head><meta charset="utf-8"><title>decks watch</title>
+<style>
+body{margin:0;background:#1e1e1e;color:#ddd;font:14px system-ui,sans-serif}
+header{position:sticky;top:0;z-index:1;padding:8px 16px;background:#111;
+  display:flex;gap:16px;align-items:baseline}
+#status{color:#8b8}
+#status.down{color:#d88}
+section{padding:8px 16px}
+h2{font-size:15px;font-weight:600;margin:8px 0}
+.grid{display:grid;grid-template-columns:repeat(auto-fill,minmax(480px,1fr));gap:16px}
+figure{margin:0}
+figcaption{font-size:12px;color:#999;margin-bottom:4px}
+figure .slide{box-shadow:0 1px 4px #000;outline:3px solid transparent;
+  transition:outline-color 0.6s}
+figure.fresh .slide{outline-color:#8b5cf6;transition:none}
+pre.error{background:#3a1d1d;color:#f6c4c4;padding:8px;white-space:pre-wrap;margin:0 0 8px}
+/*PREVIEW_CSS*/
+</style></head>
+<body><header><strong>decks watch</strong><span id="status">connecting…</span></header>
+<main id="decks"></main>
+<script>
+const main = document.getElementById("decks"), status = document.getElementById("status");
+const section = key => {
+  let el = document.getElementById("deck:" + key);
+  if (!el) {
+    el = document.createElement("section");
+    el.id = "deck:" + key;
+    el.innerHTML = "<h2></h2><pre class='error' hidden></pre><div class='grid'></div>";
+    el.querySelector("h2").textContent = key;
+    main.appendChild(el);
+  }
+  return el;
+};
+const flash = fig => {
+  fig.classList.add("fresh");
+  setTimeout(() => fig.classList.remove("fresh"), 50);
+};
+const showError = (el, error) => {
+  const pre = el.querySelector("pre.error");
+  pre.hidden = !error;
+  pre.textContent = error || "";
+};
+function handle(msg) {
+  if (msg.type === "reset") {
+    for (const el of [...main.children])
+      if (!msg.decks.includes(el.id.slice(5))) el.remove();
+    return;
+  }
+  const el = section(msg.deck);
+  if (msg.type === "error") { showError(el, msg.error); return; }
+  showError(el, msg.error);
+  const grid = el.querySelector(".grid");
+  if (msg.type === "deck") {
+    grid.innerHTML = "";
+    msg.slides.forEach((slide, i) => {
+      const fig = document.createElement("figure");
+      fig.innerHTML = "<figcaption></figcaption>" + slide.html;
+      fig.firstChild.textContent = (i + 1) + ". " + slide.label;
+      grid.appendChild(fig);
+    });
+  } else if (msg.type === "slides") {
+    for (const [i, html] of Object.entries(msg.slides)) {
+      const fig = grid.children[+i];
+      fig.lastChild.outerHTML = html;
+      flash(fig);
+    }
+  }
+  status.textContent = "updated " + new Date().toLocaleTimeString();
+}
+function connect() {
+  const ws = new WebSocket("ws://" + location.host + "/ws");
+  ws.onopen = () => { status.className = ""; status.textContent = "connected"; };
+  ws.onmessage = event => handle(JSON.parse(event.data));
+  ws.onclose = () => {
+    status.className = "down";
+    status.textContent = "disconnected, retrying…";
+    setTimeout(connect, 1000);
+  };
+}
+connect();
+</script></body></html>
+"""
+
+
+def _page():
+    from decks.preview import PREVIEW_CSS
+
+    return _PAGE.replace("/*PREVIEW_CSS*/", PREVIEW_CSS)